@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, Set, Mapping, Awaitable, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Set, Mapping, Awaitable, Sequence, Union
 import platform
 import subprocess
 import shlex
@@ -34,7 +34,9 @@ from ..orchestrator import (
     MergeMode,
     MergeOutcome,
 )
-from ..services import CodexMonitor, LogManager, TmuxLayoutManager, WorktreeManager
+from ..services import CodexHomeManager, CodexMonitor, LogManager, TmuxLayoutManager, WorktreeManager
+from ..services.tmux_control import control_client_count
+from ..services.worktree_manager import DEFAULT_CACHE_PATHS
 from ..stores import (
     ManifestStore,
     PaneRecord,
@@ -47,6 +49,21 @@ from ..stores import (
 )
 from .workflow_runner import WorkflowRunner
 
+# Orchestrator.reconfigure で差し替えられるサイクル単位の設定。これ以外が変わった場合だけ作り直す
+_CYCLE_OPTIONS = frozenset(
+    {
+        "log_dir",
+        "reuse_existing_session",
+        "boss_mode",
+        "log_hook",
+        "merge_mode",
+        "worker_quorum",
+        "straggler_grace",
+        "stream_boss",
+        "boss_top_k",
+    }
+)
+
 def _ensure_logs_directory(identifier: str) -> Path:
     """Create and return the logs directory for the given identifier."""
     base_dir = default_config_dir() / "logs"
@@ -147,7 +164,14 @@ class TmuxAttachManager:
         if result.returncode != 0:
             return False
         output = (result.stdout or "").strip().lower()
-        return output in {"1", "true"}
+        if output == "true":
+            return True
+        try:
+            attached = int(output)
+        except ValueError:
+            return False
+        # 自プロセスのコントロールモード接続は利用者のアタッチとして数えない
+        return attached - control_client_count(session_name) > 0
 
     def session_exists(self, session_name: str) -> bool:
         try:
@@ -225,6 +249,8 @@ class CLIController:
         self._cancelled_cycles: Set[int] = set()
         self._last_tmux_manager: Optional[TmuxLayoutManager] = None
         self._active_orchestrator: Optional[Orchestrator] = None
+        self._warm_orchestrator: Optional[Orchestrator] = None
+        self._warm_options: Dict[str, Any] = {}
         self._queued_instruction: Optional[str] = None
         self._continue_future: Optional[Future] = None
         self._continuation_input_future: Optional[Future] = None
@@ -654,16 +680,43 @@ class CLIController:
             self._emit(ControllerEventType.LOG, {"text": f"tmuxセッション {session_name} にペインが見つかりませんでした。"})
             return
 
+        self._tmux_send_keys(pane_ids, "Escape")
+        self._emit(ControllerEventType.LOG, {"text": f"tmuxセッション {session_name} の {len(pane_ids)} 個のペインへEscapeを送信しました。"})
+
+    def handle_escape(self) -> None:
+        self._pause_helper.handle_escape()
+
+    def _tmux_send_keys(self, pane_ids: List[str], keys: str, *, enter: bool = False) -> None:
+        sender = getattr(self._last_tmux_manager, "send_keys_to_panes", None)
+        if callable(sender):
+            try:
+                sender(pane_ids, keys, enter=enter)
+                return
+            except Exception:  # noqa: BLE001 - コントロールモード切断時は tmux コマンドで再送する
+                pass
+        suffix = ["Enter"] if enter else []
         for pane_id in pane_ids:
             subprocess.run(
-                ["tmux", "send-keys", "-t", pane_id, "Escape"],
+                ["tmux", "send-keys", "-t", pane_id, keys, *suffix],
                 check=False,
             )
-        self._emit(ControllerEventType.LOG, {"text": f"tmuxセッション {session_name} の {len(pane_ids)} 個のペインへEscapeを送信しました。"})
 
-    def handle_escape(self) -> None:
-        self._pause_helper.handle_escape()
+    def _tmux_send_instruction(self, pane_ids: List[str], instruction: str) -> None:
+        sender = getattr(self._last_tmux_manager, "send_instruction_to_panes", None)
+        if callable(sender):
+            try:
+                sender(pane_ids=pane_ids, instruction=instruction)
+                return
+            except Exception:  # noqa: BLE001 - バッファ経由で送れない場合は send-keys で送る
+                pass
+        self._tmux_send_keys(pane_ids, instruction, enter=True)
+
     def _tmux_list_panes(self) -> Optional[List[str]]:
+        lister = getattr(self._last_tmux_manager, "list_panes", None)
+        if callable(lister):
+            pane_ids = lister()
+            if isinstance(pane_ids, list):
+                return pane_ids
         session_name = self._config.tmux_session
         try:
             result = subprocess.run(
@@ -1081,15 +1134,15 @@ class CLIController:
             return
 
         worker_count = len(manifest.workers)
-        orchestrator = self._builder(
-            worker_count=worker_count,
-            log_dir=Path(manifest.logs_dir) if manifest.logs_dir else None,
-            session_name=manifest.tmux_session,
-            reuse_existing_session=False,
-            session_namespace=manifest.session_id,
-            boss_mode=self._config.boss_mode,
-            project_root=self._worktree_root,
-            worktree_storage_root=self._worktree_storage_root,
+        # 再開時もサイクル実行と同じ構成で常駐 Orchestrator を取得し、二重生成やオプションの取りこぼしを防ぐ
+        orchestrator = self._acquire_orchestrator(
+            **self._orchestrator_options(
+                worker_count=worker_count,
+                log_dir=Path(manifest.logs_dir) if manifest.logs_dir else None,
+                session_name=manifest.tmux_session,
+                reuse_existing_session=False,
+                session_namespace=manifest.session_id,
+            )
         )
         tmux_manager = orchestrator._tmux  # type: ignore[attr-defined]
         orchestrator._worktree.prepare()  # type: ignore[attr-defined]
@@ -1332,6 +1385,63 @@ class CLIController:
         if status:
             self._emit_status(status)
 
+    def _orchestrator_options(self, **overrides: Any) -> Dict[str, Any]:
+        """現在の設定から builder へ渡す全オプションを組み立てる (overrides で個別に上書きする)."""
+        store = self._settings_store
+        options: Dict[str, Any] = {
+            "worker_count": self._config.worker_count,
+            "log_dir": None,
+            "session_name": self._config.tmux_session,
+            "reuse_existing_session": self._config.reuse_existing_session,
+            "session_namespace": self._session_namespace,
+            "boss_mode": self._config.boss_mode,
+            "project_root": self._worktree_root,
+            "worktree_storage_root": self._worktree_storage_root,
+            "log_hook": self._log_hook,
+            "merge_mode": self._config.merge_mode,
+            "worktree_reset": store.worktree_reset,
+            "worktree_keep": store.worktree_keep,
+            "worktree_seed": store.worktree_seed,
+            "worktree_seed_hardlink": store.worktree_seed_hardlink,
+            "worktree_sparse": store.worktree_sparse,
+            "worktree_sparse_auto": store.worktree_sparse_auto,
+            "worktree_checkout_workers": store.worktree_checkout_workers,
+            "worker_quorum": store.worker_quorum,
+            "straggler_grace": store.straggler_grace,
+            "stream_boss": store.stream_boss,
+            "boss_shards": store.boss_shards,
+            "boss_top_k": store.boss_top_k,
+            "isolate_codex_home": store.codex_isolate_home,
+            "fork_strategy": store.codex_fork_strategy,
+            "sticky_workers": store.codex_sticky_workers,
+            "signal_socket": store.signal_socket,
+        }
+        options.update(overrides)
+        return options
+
+    def _acquire_orchestrator(self, **options: Any) -> Orchestrator:
+        """構成が前サイクルと同じなら常駐中の Orchestrator を再利用し、サイクル単位の設定だけ差し替える."""
+        cycle_options = {key: value for key, value in options.items() if key in _CYCLE_OPTIONS}
+        layout_options = {key: value for key, value in options.items() if key not in _CYCLE_OPTIONS}
+        warm = self._warm_orchestrator
+        if warm is not None and self._warm_options == layout_options:
+            warm.reconfigure(**cycle_options)
+            return warm
+        self._discard_warm_orchestrator()
+        orchestrator = self._builder(**options)
+        # 独自ビルダーが返すテスト用のダブル等は毎サイクル作り直す
+        if isinstance(orchestrator, Orchestrator):
+            self._warm_orchestrator = orchestrator
+            self._warm_options = layout_options
+        return orchestrator
+
+    def _discard_warm_orchestrator(self) -> None:
+        warm = self._warm_orchestrator
+        self._warm_orchestrator = None
+        self._warm_options = {}
+        if warm is not None:
+            warm.close()
+
     @staticmethod
     def _default_builder(
         *,
@@ -1359,6 +1469,22 @@ def build_orchestrator(
     worktree_storage_root: Optional[Path] = None,
     log_hook: Optional[Callable[[str], None]] = None,
     merge_mode: MergeMode = MergeMode.MANUAL,
+    worktree_reset: str = "full",
+    worktree_keep: Optional[Sequence[str]] = None,
+    worktree_seed: Optional[Sequence[str]] = None,
+    worktree_seed_hardlink: bool = False,
+    worktree_sparse: Optional[Sequence[str]] = None,
+    worktree_sparse_auto: bool = False,
+    worktree_checkout_workers: int = 0,
+    worker_quorum: Optional[int] = None,
+    straggler_grace: Optional[float] = None,
+    stream_boss: bool = False,
+    boss_shards: int = 1,
+    boss_top_k: int = 0,
+    isolate_codex_home: bool = False,
+    fork_strategy: str = "resume",
+    sticky_workers: bool = False,
+    signal_socket: bool = True,
 ) -> Orchestrator:
     session_name = session_name or "parallel-dev"
     timestamp = datetime.utcnow().strftime("%y-%m-%d-%H%M%S")
@@ -1370,7 +1496,13 @@ def build_orchestrator(
     map_session_id = session_namespace or session_name or "parallel-dev"
     session_map_dir = default_config_dir() / "session_maps"
     session_map_dir.mkdir(parents=True, exist_ok=True)
-    session_map_path = session_map_dir / f"{map_session_id}.yaml"
+    session_map_path = session_map_dir / f"{map_session_id}.json"
+    legacy_map_path = session_map_path.with_suffix(".yaml")
+    if not session_map_path.exists() and legacy_map_path.exists():
+        try:
+            legacy_map_path.replace(session_map_path)
+        except OSError:
+            pass
 
     project_root_path = Path(project_root).expanduser() if project_root else Path.cwd()
     storage_root_path = (
@@ -1383,10 +1515,13 @@ def build_orchestrator(
         session_root = session_root / "sessions" / session_namespace
     session_root.mkdir(parents=True, exist_ok=True)
 
+    # ペインごとの CODEX_HOME は rollout の置き場所でペインを特定できるため、並列フォークでも取り違えない
+    codex_homes = CodexHomeManager(session_root / "codex-homes") if isolate_codex_home else None
     monitor = CodexMonitor(
         logs_dir=base_logs_dir,
         session_map_path=session_map_path,
         session_namespace=session_namespace,
+        codex_homes=codex_homes,
     )
     tmux_manager = TmuxLayoutManager(
         session_name=session_name,
@@ -1397,13 +1532,27 @@ def build_orchestrator(
         backtrack_delay=0.0,
         reuse_existing_session=reuse_existing_session,
         session_namespace=session_namespace,
+        control_mode=True,
+        boss_count=boss_shards,
+        codex_homes=codex_homes,
     )
     worktree_manager = WorktreeManager(
         root=project_root_path,
         worker_count=worker_count,
         session_namespace=session_namespace,
         storage_root=storage_root_path,
+        reset_policy="keep_cache" if worktree_reset == "keep_cache" else "full",
+        keep_paths=DEFAULT_CACHE_PATHS if worktree_keep is None else tuple(worktree_keep),
+        seed_paths=tuple(worktree_seed or ()),
+        seed_hardlink=worktree_seed_hardlink,
+        sparse_paths=tuple(worktree_sparse or ()),
+        sparse_from_instruction=worktree_sparse_auto,
+        checkout_workers=worktree_checkout_workers,
+        follow_root_head=sticky_workers,
     )
+    if log_hook is not None:
+        for warning in worktree_manager.seed_warnings():
+            log_hook(f"[worktree] {warning}")
     log_manager = LogManager(logs_dir=base_logs_dir)
 
     return Orchestrator(
@@ -1416,4 +1565,11 @@ def build_orchestrator(
         boss_mode=boss_mode,
         log_hook=log_hook,
         merge_mode=merge_mode,
+        worker_quorum=worker_quorum,
+        straggler_grace=straggler_grace,
+        stream_boss=stream_boss,
+        boss_top_k=boss_top_k,
+        fork_strategy=fork_strategy,
+        sticky_workers=sticky_workers,
+        signal_socket=signal_socket,
     )
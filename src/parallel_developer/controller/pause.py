@@ -3,9 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-import subprocess
-from subprocess import PIPE
-from typing import List, Optional, TYPE_CHECKING
+from typing import TYPE_CHECKING
 
 from .events import ControllerEventType
 
@@ -52,18 +50,16 @@ class PauseHelper:
     def _send_instruction_to_panes(self, instruction: str) -> None:
         controller = self._controller
         session_name = controller._config.tmux_session
-        pane_ids = self._tmux_list_panes()
+        pane_ids = controller._tmux_list_panes()
         if pane_ids is None:
             return
         if len(pane_ids) <= 2:
             controller._emit(ControllerEventType.LOG, {"text": f"tmuxセッション {session_name} にワーカーペインが見つからず、追加指示を送信できませんでした。"})
             return
-        worker_panes = pane_ids[2:]
-        for pane_id in worker_panes:
-            subprocess.run(
-                ["tmux", "send-keys", "-t", pane_id, instruction, "Enter"],
-                check=False,
-            )
+        # ensure_layout はワーカーの後ろに追加の Boss ペインを置くため、ワーカー数で切り出す
+        worker_count = max(1, int(controller._config.worker_count))
+        worker_panes = pane_ids[2 : 2 + worker_count]
+        controller._tmux_send_instruction(worker_panes, instruction)
         preview = instruction.replace("\n", " ")[:60]
         if len(instruction) > 60:
             preview += "..."
@@ -71,24 +67,3 @@ class PauseHelper:
         controller._paused = False
         controller._emit_pause_state()
         controller._emit_status("待機中")
-
-    def _tmux_list_panes(self) -> Optional[List[str]]:
-        controller = self._controller
-        session_name = controller._config.tmux_session
-        try:
-            result = subprocess.run(
-                ["tmux", "list-panes", "-t", session_name, "-F", "#{pane_id}"],
-                check=False,
-                stdout=PIPE,
-                stderr=PIPE,
-                text=True,
-            )
-        except FileNotFoundError:
-            controller._emit(ControllerEventType.LOG, {"text": "tmux コマンドが見つかりません。tmuxがインストールされているか確認してください。"})
-            return None
-        if result.returncode != 0:
-            message = (result.stderr or result.stdout or "").strip()
-            if message:
-                controller._emit(ControllerEventType.LOG, {"text": f"tmux list-panes に失敗しました: {message}"})
-            return None
-        return [line.strip() for line in (result.stdout or "").splitlines() if line.strip()]
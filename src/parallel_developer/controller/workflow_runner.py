@@ -40,18 +40,7 @@ class WorkflowRunner:
 
         logs_dir = c._create_cycle_logs_dir()
 
-        orchestrator = c._builder(
-            worker_count=c._config.worker_count,
-            log_dir=logs_dir,
-            session_name=c._config.tmux_session,
-            reuse_existing_session=c._config.reuse_existing_session,
-            session_namespace=c._session_namespace,
-            boss_mode=c._config.boss_mode,
-            project_root=c._worktree_root,
-            worktree_storage_root=c._worktree_storage_root,
-            log_hook=self._controller._log_hook,
-            merge_mode=c._config.merge_mode,
-        )
+        orchestrator = c._acquire_orchestrator(**c._orchestrator_options(log_dir=logs_dir))
         c._active_orchestrator = orchestrator
         c._last_tmux_manager = getattr(orchestrator, "_tmux", None)
         main_hook = getattr(orchestrator, "set_main_session_hook", None)
@@ -105,6 +94,8 @@ class WorkflowRunner:
                 c._record_cycle_snapshot(result, cycle_id)
         except Exception as exc:  # noqa: BLE001
             c._emit(ControllerEventType.LOG, {"text": f"エラーが発生しました: {exc}"})
+            # 失敗したサイクルの tmux/worktree 状態は信用できないため、次の指示では作り直す
+            c._discard_warm_orchestrator()
         finally:
             c._selection_context = None
             if c._current_cycle_id == cycle_id:
@@ -7,12 +7,14 @@ import os
 import shutil
 import subprocess
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Literal
 
+from .services.signal_server import SignalServer
 from .stores import default_config_dir
 
 
@@ -80,6 +82,7 @@ class CycleLayout:
     worker_names: List[str]
     pane_to_worker: Dict[str, str]
     pane_to_path: Dict[str, Path]
+    boss_shards: List[str] = field(default_factory=list)
 
 
 @dataclass(slots=True)
@@ -101,6 +104,29 @@ class SignalPaths:
     root: Path
     worker_flags: Dict[str, Path]
     boss_flag: Path
+    socket: Optional[Path] = None
+
+
+@dataclass(slots=True)
+class _BossStream:
+    """逐次採点モードで Boss に送った候補と受け取ったスコアの状態."""
+
+    session_id: Optional[str] = None
+    queued: List[str] = field(default_factory=list)
+    in_flight: List[str] = field(default_factory=list)
+    batches: int = 0
+    last_raw: Optional[str] = None
+    metrics: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    stale: bool = False
+
+
+@dataclass(slots=True)
+class _StickyWorkers:
+    """次サイクルへ持ち越す非採択ワーカーのセッションと、同期元となった採択結果."""
+
+    sessions: Dict[str, str]
+    selected_key: str
+    selected_session_id: Optional[str]
 
 
 @dataclass(slots=True)
@@ -129,6 +155,14 @@ class Orchestrator:
         boss_mode: BossMode = BossMode.SCORE,
         log_hook: Optional[Callable[[str], None]] = None,
         merge_mode: MergeMode = MergeMode.MANUAL,
+        worker_quorum: Optional[int] = None,
+        straggler_grace: Optional[float] = None,
+        stream_boss: bool = False,
+        prefork_boss: bool = True,
+        boss_top_k: int = 0,
+        fork_strategy: str = "resume",
+        sticky_workers: bool = False,
+        signal_socket: bool = True,
     ) -> None:
         self._tmux = tmux_manager
         self._worktree = worktree_manager
@@ -136,13 +170,83 @@ class Orchestrator:
         self._log = log_manager
         self._worker_count = worker_count
         self._session_name = session_name
-        self._boss_mode = boss_mode if isinstance(boss_mode, BossMode) else BossMode(str(boss_mode))
         self._active_worker_sessions: List[str] = []
         self._main_session_hook: Optional[Callable[[str], None]] = main_session_hook
         self._worker_decider = worker_decider
         self._active_signals: Optional[SignalPaths] = None
+        self._signal_socket = bool(signal_socket)
+        self._signal_server: Optional[SignalServer] = None
+        self._prefork_boss = bool(prefork_boss)
+        self._fork_strategy = "clone" if str(fork_strategy).strip().lower() == "clone" else "resume"
+        self._sticky_workers = bool(sticky_workers)
+        self._sticky: Optional[_StickyWorkers] = None
+        self._apply_cycle_options(
+            boss_mode=boss_mode,
+            merge_mode=merge_mode,
+            log_hook=log_hook,
+            worker_quorum=worker_quorum,
+            straggler_grace=straggler_grace,
+            stream_boss=stream_boss,
+            boss_top_k=boss_top_k,
+        )
+
+    def reconfigure(
+        self,
+        *,
+        log_dir: Optional[Path] = None,
+        reuse_existing_session: Optional[bool] = None,
+        boss_mode: BossMode = BossMode.SCORE,
+        log_hook: Optional[Callable[[str], None]] = None,
+        merge_mode: MergeMode = MergeMode.MANUAL,
+        worker_quorum: Optional[int] = None,
+        straggler_grace: Optional[float] = None,
+        stream_boss: bool = False,
+        boss_top_k: int = 0,
+    ) -> None:
+        """常駐させた Orchestrator に次サイクルの設定を反映する。tmux・worktree・監視の状態は引き継ぐ."""
+        if log_dir is not None:
+            for component in (self._log, self._monitor):
+                setter = getattr(component, "set_logs_dir", None)
+                if callable(setter):
+                    setter(Path(log_dir))
+        if reuse_existing_session is not None:
+            setter = getattr(self._tmux, "set_reuse_existing_session", None)
+            if callable(setter):
+                setter(reuse_existing_session)
+        self._apply_cycle_options(
+            boss_mode=boss_mode,
+            merge_mode=merge_mode,
+            log_hook=log_hook,
+            worker_quorum=worker_quorum,
+            straggler_grace=straggler_grace,
+            stream_boss=stream_boss,
+            boss_top_k=boss_top_k,
+        )
+
+    def close(self) -> None:
+        for component in (self._tmux, self._monitor):
+            closer = getattr(component, "close", None)
+            if callable(closer):
+                closer()
+
+    def _apply_cycle_options(
+        self,
+        *,
+        boss_mode: BossMode,
+        merge_mode: MergeMode,
+        log_hook: Optional[Callable[[str], None]],
+        worker_quorum: Optional[int],
+        straggler_grace: Optional[float],
+        stream_boss: bool,
+        boss_top_k: int,
+    ) -> None:
+        self._boss_mode = boss_mode if isinstance(boss_mode, BossMode) else BossMode(str(boss_mode))
         self._log_hook = log_hook
         self._merge_mode = merge_mode if isinstance(merge_mode, MergeMode) else MergeMode(str(merge_mode))
+        self._worker_quorum = worker_quorum if worker_quorum and worker_quorum > 0 else None
+        self._straggler_grace = straggler_grace if straggler_grace is not None and straggler_grace >= 0 else None
+        self._stream_boss = bool(stream_boss)
+        self._boss_top_k = max(0, int(boss_top_k or 0))
 
     def set_main_session_hook(self, hook: Optional[Callable[[str], None]]) -> None:
         self._main_session_hook = hook
@@ -161,47 +265,104 @@ class Orchestrator:
     ) -> OrchestrationResult:
         """Execute a single orchestrated instruction cycle."""
 
-        worker_roots = self._worktree.prepare()
+        # worktree の準備はメインセッションの起動と依存しないため、ワーカーを fork する直前まで裏で進める
+        prepare_job = self._start_worktree_prepare(instruction)
         boss_path = self._worktree.boss_path
 
         self._tmux.set_boss_path(boss_path)
         self._cleanup_signal_paths()
         signal_paths: Optional[SignalPaths] = None
+        boss_job: Optional[Future[Dict[str, str]]] = None
 
         try:
-            layout, baseline = self._prepare_layout(worker_roots)
-            signal_paths = self._prepare_signal_paths(layout.worker_names)
+            baseline = self._monitor.snapshot_rollouts()
+            layout_map = self._ensure_layout()
             main_session_id, formatted_instruction = self._start_main_session(
-                layout=layout,
+                main_pane=layout_map["main"],
                 instruction=instruction,
                 baseline=baseline,
                 resume_session_id=resume_session_id,
             )
+            worker_roots = prepare_job.result()
+            self._log_prepare_timings()
+            layout = self._build_cycle_layout(layout_map, worker_roots)
+            signal_paths = self._prepare_signal_paths(layout.worker_names)
 
+            sticky_map, sync_notes = self._take_sticky_sessions(layout, resume_session_id)
+            fork_panes = [pane_id for pane_id in layout.worker_panes if pane_id not in sticky_map]
             baseline = self._monitor.snapshot_rollouts()
-            worker_pane_list = self._fork_worker_sessions(
-                layout=layout,
-                main_session_id=main_session_id,
-                baseline=baseline,
-            )
+            cloned_map = self._clone_worker_sessions(layout, main_session_id, fork_panes)
+            if cloned_map is not None:
+                worker_pane_list = list(cloned_map)
+            elif fork_panes:
+                worker_pane_list = self._fork_worker_sessions(
+                    layout=layout,
+                    main_session_id=main_session_id,
+                    baseline=baseline,
+                    panes=fork_panes,
+                )
+            else:
+                worker_pane_list = []
             worker_flag_map: Dict[str, Path] = signal_paths.worker_flags if signal_paths else {}
             self._dispatch_worker_instructions(
                 layout=layout,
                 user_instruction=instruction,
                 signal_flags=worker_flag_map,
+                notes=sync_notes,
             )
-            fork_map = self._monitor.register_worker_rollouts(
-                worker_panes=worker_pane_list,
-                baseline=baseline,
-            )
+            worker_paths = {
+                pane_id: layout.pane_to_path[pane_id]
+                for pane_id in worker_pane_list
+                if pane_id in layout.pane_to_path
+            }
+            if cloned_map is not None:
+                forked_map = cloned_map
+            elif worker_pane_list:
+                forked_map = self._monitor.register_worker_rollouts(
+                    worker_panes=worker_pane_list,
+                    baseline=baseline,
+                    pane_paths=worker_paths,
+                )
+            else:
+                forked_map = {}
+            fork_map = {
+                pane_id: sticky_map.get(pane_id) or forked_map[pane_id]
+                for pane_id in layout.worker_panes
+                if pane_id in sticky_map or pane_id in forked_map
+            }
             self._active_worker_sessions = [session_id for session_id in fork_map.values() if session_id]
+            boss_job = self._start_boss_prefork(layout, main_session_id)
             session_signal_map: Dict[str, Path] = {}
             for pane_id, session_id in fork_map.items():
                 worker_name = layout.pane_to_worker.get(pane_id)
                 flag_path = worker_flag_map.get(worker_name) if worker_name else None
                 if session_id and flag_path is not None:
                     session_signal_map[session_id] = flag_path
-            completion_info = self._await_worker_completion(fork_map, session_signal_map)
+
+            boss_stream: Optional[_BossStream] = None
+            on_worker_done: Optional[Callable[[str, Mapping[str, Any]], None]] = None
+            if self._stream_boss and self._boss_mode != BossMode.SKIP and layout.worker_panes:
+                # 最初の完了で Boss を fork し、以降の完了分は追加の採点依頼として逐次送る
+                boss_stream = _BossStream()
+                session_to_worker = {
+                    session_id: layout.pane_to_worker[pane_id]
+                    for pane_id, session_id in fork_map.items()
+                    if session_id and pane_id in layout.pane_to_worker
+                }
+
+                def on_worker_done(session_id: str, _entry: Mapping[str, Any]) -> None:
+                    worker_name = session_to_worker.get(session_id)
+                    if worker_name:
+                        self._stream_boss_review(
+                            boss_stream,
+                            worker_name,
+                            layout=layout,
+                            main_session_id=main_session_id,
+                            user_instruction=instruction.rstrip(),
+                            boss_job=boss_job,
+                        )
+
+            completion_info = self._await_worker_completion(fork_map, session_signal_map, on_complete=on_worker_done)
 
             while True:
                 if self._worker_decider:
@@ -216,6 +377,9 @@ class Orchestrator:
                     continuation_text = (worker_decision.instruction or "").strip()
                     if not continuation_text:
                         raise RuntimeError("/continue が選択されましたが追加指示が取得できませんでした。")
+                    if boss_stream is not None:
+                        # 追加指示で成果物が変わるため、逐次採点の結果は破棄して最後にまとめて採点し直す
+                        boss_stream.stale = True
                     self._dispatch_worker_continuation(
                         layout=layout,
                         user_instruction=continuation_text,
@@ -253,10 +417,13 @@ class Orchestrator:
                     raise RuntimeError("Signal paths were not initialized for boss phase.")
                 boss_session_id, boss_metrics = self._run_boss_phase(
                     layout=layout,
+                    fork_map=fork_map,
                     main_session_id=main_session_id,
                     user_instruction=instruction.rstrip(),
                     completion_info=completion_info,
                     boss_flag=signal_paths.boss_flag,
+                    stream=boss_stream,
+                    boss_job=boss_job,
                 )
 
             candidates = self._build_candidates(layout, fork_map, boss_session_id, boss_path)
@@ -339,9 +506,12 @@ class Orchestrator:
             )
             artifact.log_paths = log_paths
             self._active_worker_sessions = []
+            self._retain_sticky_workers(fork_map, selected_info, merge_outcome, completion_info)
 
             return result
         finally:
+            # 途中で失敗しても、裏で動いている git 操作が次サイクルと重ならないよう完了を待つ
+            wait([prepare_job] if boss_job is None else [prepare_job, boss_job])
             self._cleanup_signal_paths()
 
     def force_complete_workers(self) -> int:
@@ -356,11 +526,22 @@ class Orchestrator:
     # Layout preparation
     # --------------------------------------------------------------------- #
 
-    def _prepare_layout(self, worker_roots: Mapping[str, Path]) -> tuple[CycleLayout, Mapping[Path, float]]:
-        baseline = self._monitor.snapshot_rollouts()
-        layout_map = self._ensure_layout()
-        cycle_layout = self._build_cycle_layout(layout_map, worker_roots)
-        return cycle_layout, baseline
+    def _start_worktree_prepare(self, instruction: str) -> Future[Mapping[str, Path]]:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sibyl-worktree-prepare")
+        try:
+            return executor.submit(self._worktree.prepare, instruction=instruction)
+        finally:
+            executor.shutdown(wait=False)
+
+    def _start_boss_prefork(self, layout: CycleLayout, main_session_id: str) -> Optional[Future[Dict[str, str]]]:
+        """ワーカーの作業中に Boss の fork と rollout 検出を済ませ、採点開始時は指示の送信だけにする."""
+        if not self._prefork_boss or self._boss_mode == BossMode.SKIP or not layout.worker_panes:
+            return None
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sibyl-boss-fork")
+        try:
+            return executor.submit(self._fork_boss_sessions, self._boss_panes(layout), main_session_id)
+        finally:
+            executor.shutdown(wait=False)
 
     def _build_cycle_layout(
         self,
@@ -389,6 +570,7 @@ class Orchestrator:
             worker_names=worker_names,
             pane_to_worker=pane_to_worker,
             pane_to_path=pane_to_path,
+            boss_shards=list(layout_map.get("boss_shards") or []),
         )
 
     def _prepare_signal_paths(self, worker_names: Sequence[str]) -> SignalPaths:
@@ -408,15 +590,30 @@ class Orchestrator:
             worker_flags=worker_flags,
             boss_flag=boss_flag,
         )
+        if self._signal_socket:
+            # フラグの存在確認を待たず、sibyl-signal からの通知で待機中の監視を即座に起こす
+            server = SignalServer(root / "signal.sock", flags=[*worker_flags.values(), boss_flag], on_signal=self._on_signal)
+            if server.start():
+                self._signal_server = server
+                bundle.socket = server.socket_path
         self._active_signals = bundle
         return bundle
 
+    def _on_signal(self, _flag_path: Path) -> None:
+        notifier = getattr(self._monitor, "notify_signal", None)
+        if callable(notifier):
+            notifier()
+
     def _signal_base_dir(self, namespace: str) -> Path:
         signals_root = default_config_dir() / "sessions" / namespace / "signals"
         signals_root.mkdir(parents=True, exist_ok=True)
         return signals_root
 
     def _cleanup_signal_paths(self) -> None:
+        server = self._signal_server
+        self._signal_server = None
+        if server is not None:
+            server.close()
         bundle = self._active_signals
         if not bundle:
             return
@@ -432,21 +629,21 @@ class Orchestrator:
     def _start_main_session(
         self,
         *,
-        layout: CycleLayout,
+        main_pane: str,
         instruction: str,
         baseline: Mapping[Path, float],
         resume_session_id: Optional[str],
     ) -> tuple[str, str]:
         if resume_session_id:
             self._monitor.bind_existing_session(
-                pane_id=layout.main_pane,
+                pane_id=main_pane,
                 session_id=resume_session_id,
             )
             main_session_id = resume_session_id
         else:
-            self._tmux.launch_main_session(pane_id=layout.main_pane)
+            self._tmux.launch_main_session(pane_id=main_pane)
             main_session_id = self._monitor.register_new_rollout(
-                pane_id=layout.main_pane,
+                pane_id=main_pane,
                 baseline=baseline,
             )
 
@@ -458,16 +655,16 @@ class Orchestrator:
         fork_prompt = self._build_main_fork_prompt()
 
         self._tmux.send_instruction_to_pane(
-            pane_id=layout.main_pane,
+            pane_id=main_pane,
             instruction=fork_prompt,
         )
         self._monitor.wait_for_rollout_activity(
             main_session_id,
             timeout_seconds=10.0,
         )
-        self._tmux.prepare_for_instruction(pane_id=layout.main_pane)
+        self._tmux.prepare_for_instruction(pane_id=main_pane)
         self._monitor.capture_instruction(
-            pane_id=layout.main_pane,
+            pane_id=main_pane,
             instruction=fork_prompt,
         )
         return main_session_id, formatted_instruction
@@ -482,10 +679,12 @@ class Orchestrator:
         layout: CycleLayout,
         main_session_id: str,
         baseline: Mapping[Path, float],
+        panes: Optional[Sequence[str]] = None,
     ) -> List[str]:
-        worker_paths = {pane_id: layout.pane_to_path[pane_id] for pane_id in layout.worker_panes}
+        targets = list(layout.worker_panes if panes is None else panes)
+        worker_paths = {pane_id: layout.pane_to_path[pane_id] for pane_id in targets}
         worker_pane_list = self._tmux.fork_workers(
-            workers=layout.worker_panes,
+            workers=targets,
             base_session_id=main_session_id,
             pane_paths=worker_paths,
         )
@@ -495,13 +694,102 @@ class Orchestrator:
         )
         return worker_pane_list
 
+    def _clone_worker_sessions(
+        self,
+        layout: CycleLayout,
+        main_session_id: str,
+        panes: Optional[Sequence[str]] = None,
+    ) -> Optional[Dict[str, str]]:
+        """clone 戦略ではメインの rollout を複製して id を先に確定させ、rollout の検出待ちを省く."""
+        targets = list(layout.worker_panes if panes is None else panes)
+        if self._fork_strategy != "clone" or not targets:
+            return None
+        cloner = getattr(self._monitor, "clone_worker_sessions", None)
+        resumer = getattr(self._tmux, "resume_workers", None)
+        if not callable(cloner) or not callable(resumer):
+            return None
+        worker_paths = {pane_id: layout.pane_to_path[pane_id] for pane_id in targets}
+        try:
+            fork_map = cloner(
+                base_session_id=main_session_id,
+                worker_panes=targets,
+                pane_paths=worker_paths,
+            )
+        except (OSError, ValueError) as exc:
+            if self._log_hook:
+                self._log_hook(f"[fork] rollout を複製できないため resume で fork します: {exc}")
+            return None
+        resumer(sessions=fork_map, pane_paths=worker_paths)
+        self._maybe_pause(
+            "PARALLEL_DEV_PAUSE_AFTER_RESUME",
+            "[parallel-dev] Debug pause after worker resume. Inspect tmux panes and press Enter to continue...",
+        )
+        return dict(fork_map)
+
+    def _take_sticky_sessions(
+        self,
+        layout: CycleLayout,
+        resume_session_id: Optional[str],
+    ) -> tuple[Dict[str, str], Dict[str, str]]:
+        """前サイクルから持ち越したワーカーのうち、同じペインが残っているものを fork せずに使う."""
+        sticky = self._sticky
+        self._sticky = None
+        if sticky is None or (resume_session_id and resume_session_id != sticky.selected_session_id):
+            return {}, {}
+        sessions = {pane_id: session_id for pane_id, session_id in sticky.sessions.items() if pane_id in layout.pane_to_worker}
+        note = (
+            f"Sync: {sticky.selected_key} was selected in the previous cycle and your worktree has been reset to that result. "
+            "Discard your earlier changes and continue from the files as they are now.\n"
+        )
+        return sessions, {pane_id: note for pane_id in sessions}
+
+    def _retain_sticky_workers(
+        self,
+        fork_map: Mapping[str, str],
+        selected: CandidateInfo,
+        merge_outcome: Optional[MergeOutcome],
+        completion_info: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        # ルートへ統合済みでないと次サイクルの worktree リセットが採択結果と一致しないため持ち越さない
+        if not self._sticky_workers or merge_outcome is None or merge_outcome.status != "merged":
+            return
+        completion_info = completion_info or {}
+        sessions: Dict[str, str] = {}
+        for pane_id, session_id in fork_map.items():
+            if not session_id or pane_id == selected.pane_id or session_id == selected.session_id:
+                continue
+            entry = completion_info.get(session_id)
+            # 中断で Codex が終了したペインや強制完了扱いのセッションは、次サイクルで fork し直す
+            if isinstance(entry, Mapping) and (entry.get("interrupted") or entry.get("forced")):
+                continue
+            sessions[pane_id] = session_id
+        consume = getattr(self._monitor, "consume_session_until_eof", None)
+        clear_forced = getattr(self._monitor, "clear_forced_completion", None)
+        for session_id in sessions.values():
+            # 前サイクルの完了行を次サイクルの完了と取り違えないよう、読み取り位置を末尾へ進める
+            if callable(consume):
+                consume(session_id)
+            if callable(clear_forced):
+                clear_forced([session_id])
+        if sessions:
+            self._sticky = _StickyWorkers(
+                sessions=sessions,
+                selected_key=selected.key,
+                selected_session_id=selected.session_id,
+            )
+
     def _dispatch_worker_instructions(
         self,
         *,
         layout: CycleLayout,
         user_instruction: str,
         signal_flags: Mapping[str, Path],
+        notes: Optional[Mapping[str, str]] = None,
     ) -> None:
+        body = user_instruction.rstrip()
+        targets: List[str] = []
+        headers: Dict[str, str] = {}
+        footers: Dict[str, str] = {}
         for pane_id in layout.worker_panes:
             worker_name = layout.pane_to_worker[pane_id]
             worker_path = layout.pane_to_path.get(pane_id)
@@ -510,20 +798,24 @@ class Orchestrator:
             completion_flag = signal_flags.get(worker_name)
             self._tmux.prepare_for_instruction(pane_id=pane_id)
             location_notice = self._worktree_location_notice(custom_path=worker_path)
-            base_message = (
-                f"You are {worker_name}. Your dedicated worktree is `{worker_path}`.\n"
-                "Task:\n"
-                f"{user_instruction.rstrip()}"
-            )
-            message = self._ensure_done_directive(
-                base_message,
+            header = f"You are {worker_name}. Your dedicated worktree is `{worker_path}`.\nTask:\n"
+            if notes and pane_id in notes:
+                header = notes[pane_id] + header
+            notice, directive = self._done_directive_parts(
+                header + body,
                 location_notice=location_notice,
                 completion_flag=completion_flag,
             )
-            self._tmux.send_instruction_to_pane(
-                pane_id=pane_id,
-                instruction=message,
-            )
+            # 共通のタスク本文は一度だけ tmux バッファへ送り、ワーカー固有の前後文だけをペインごとに送る
+            targets.append(pane_id)
+            headers[pane_id] = header
+            footers[pane_id] = notice + directive
+        self._tmux.send_instruction_to_panes(
+            pane_ids=targets,
+            instruction=body,
+            headers=headers,
+            footers=footers,
+        )
         self._phase_log("ワーカー実行を開始しました。", status="ワーカー実行中")
 
     def _dispatch_worker_continuation(
@@ -534,30 +826,50 @@ class Orchestrator:
         signal_flags: Mapping[str, Path],
     ) -> None:
         trimmed = user_instruction.rstrip("\n")
-        for pane_id in layout.worker_panes:
-            worker_name = layout.pane_to_worker.get(pane_id)
-            worker_path = layout.pane_to_path.get(pane_id)
-            if not worker_name or worker_path is None:
-                continue
-            self._tmux.send_instruction_to_pane(
-                pane_id=pane_id,
-                instruction=trimmed,
-            )
+        targets = [
+            pane_id
+            for pane_id in layout.worker_panes
+            if layout.pane_to_worker.get(pane_id) and layout.pane_to_path.get(pane_id) is not None
+        ]
+        self._tmux.send_instruction_to_panes(pane_ids=targets, instruction=trimmed)
 
     def _await_worker_completion(
         self,
         fork_map: Mapping[str, str],
         signal_map: Mapping[str, Path],
+        on_complete: Optional[Callable[[str, Mapping[str, Any]], None]] = None,
     ) -> Dict[str, Any]:
+        policy: Dict[str, Any] = {}
+        if on_complete is not None:
+            policy["on_complete"] = on_complete
+        if self._worker_quorum is not None:
+            policy["quorum"] = self._worker_quorum
+        if self._straggler_grace is not None:
+            policy["grace_seconds"] = self._straggler_grace
         completion_info = self._monitor.await_completion(
             session_ids=list(fork_map.values()),
             signal_paths=signal_map,
+            **policy,
         )
+        if "quorum" in policy or "grace_seconds" in policy:
+            self._interrupt_stragglers(fork_map, completion_info)
         if os.getenv("PARALLEL_DEV_DEBUG_STATE") == "1":
             print("[parallel-dev] Worker completion status:", completion_info)
         self._phase_log("ワーカー処理が完了しました。", status="採点準備中")
         return completion_info
 
+    def _interrupt_stragglers(self, fork_map: Mapping[str, str], completion_info: Dict[str, Any]) -> None:
+        """打ち切り時点で未完了のワーカーを中断し、スコアボード用に interrupted を記録する."""
+        stragglers: List[str] = []
+        for pane_id, session_id in fork_map.items():
+            entry = completion_info.get(session_id)
+            if not session_id or not isinstance(entry, dict) or entry.get("done"):
+                continue
+            self._tmux.interrupt_pane(pane_id=pane_id)
+            entry["interrupted"] = True
+            stragglers.append(pane_id)
+        if stragglers:
+            self._phase_log(f"未完了の {len(stragglers)} ワーカーを中断し、完了分のみで採点へ進みます。")
 
     # --------------------------------------------------------------------- #
     # Boss handling
@@ -567,45 +879,58 @@ class Orchestrator:
         self,
         *,
         layout: CycleLayout,
+        fork_map: Mapping[str, str],
         main_session_id: str,
         user_instruction: str,
         completion_info: Dict[str, Any],
         boss_flag: Path,
+        stream: Optional[_BossStream] = None,
+        boss_job: Optional[Future[Dict[str, str]]] = None,
     ) -> tuple[Optional[str], Dict[str, Dict[str, Any]]]:
         if not layout.worker_panes:
             return None, {}
-        baseline = self._monitor.snapshot_rollouts()
-        self._tmux.fork_boss(
-            pane_id=layout.boss_pane,
-            base_session_id=main_session_id,
-            boss_path=self._worktree.boss_path,
-        )
-        boss_session_id = self._monitor.register_new_rollout(
-            pane_id=layout.boss_pane,
-            baseline=baseline,
-        )
+        finished = self._finished_worker_names(layout, fork_map, completion_info)
+        sharded = False
+        if stream is not None and stream.session_id is not None:
+            boss_session_id = stream.session_id
+            boss_metrics = self._finish_boss_stream(
+                stream,
+                finished,
+                boss_pane=layout.boss_pane,
+                user_instruction=user_instruction,
+            )
+        else:
+            shard_panes = self._boss_panes(layout)[: max(1, len(finished))]
+            boss_sessions = self._resolve_boss_sessions(boss_job, shard_panes, main_session_id)
+            boss_session_id = boss_sessions[layout.boss_pane]
 
-        self._maybe_pause(
-            "PARALLEL_DEV_PAUSE_BEFORE_BOSS",
-            "[parallel-dev] All workers reported completion. Inspect boss pane, then press Enter to send boss instructions...",
-        )
+            self._maybe_pause(
+                "PARALLEL_DEV_PAUSE_BEFORE_BOSS",
+                "[parallel-dev] All workers reported completion. Inspect boss pane, then press Enter to send boss instructions...",
+            )
 
-        boss_instruction = self._build_boss_instruction(
-            layout.worker_names,
-            user_instruction,
-        )
-        self._phase_log("採点フェーズを開始します。", status="採点中")
-        self._tmux.send_instruction_to_pane(
-            pane_id=layout.boss_pane,
-            instruction=boss_instruction,
-        )
+            sharded = len(shard_panes) > 1
+            if sharded:
+                boss_metrics = self._run_sharded_scoring(shard_panes, boss_sessions, finished, user_instruction)
+                for pane_id in shard_panes[1:]:
+                    completion_info[boss_sessions[pane_id]] = {"done": True, "scores_detected": True}
+            else:
+                boss_instruction = self._build_boss_instruction(finished, user_instruction)
+                self._phase_log("採点フェーズを開始します。", status="採点中")
+                self._tmux.send_instruction_to_pane(
+                    pane_id=layout.boss_pane,
+                    instruction=boss_instruction,
+                )
 
-        boss_metrics = self._wait_for_boss_scores(boss_session_id)
-        if not boss_metrics:
-            boss_metrics = self._extract_boss_scores(boss_session_id)
+                boss_metrics = self._wait_for_boss_scores(boss_session_id)
+                if not boss_metrics:
+                    boss_metrics = self._extract_boss_scores(boss_session_id)
 
         if self._boss_mode == BossMode.REWRITE:
-            followup = self._build_boss_rewrite_followup(boss_flag=boss_flag)
+            followup = self._build_boss_rewrite_followup(
+                boss_flag=boss_flag,
+                merged_scores=boss_metrics if sharded else None,
+            )
             if followup:
                 self._tmux.send_instruction_to_pane(
                     pane_id=layout.boss_pane,
@@ -622,10 +947,240 @@ class Orchestrator:
         self._phase_log("採点フェーズが完了しました。", status="採択待ち")
         return boss_session_id, boss_metrics
 
+    def _fork_boss_session(self, boss_pane: str, main_session_id: str) -> str:
+        baseline = self._monitor.snapshot_rollouts()
+        self._tmux.fork_boss(
+            pane_id=boss_pane,
+            base_session_id=main_session_id,
+            boss_path=self._worktree.boss_path,
+        )
+        return self._monitor.register_new_rollout(
+            pane_id=boss_pane,
+            baseline=baseline,
+        )
+
+    def _fork_boss_sessions(self, boss_panes: Sequence[str], main_session_id: str) -> Dict[str, str]:
+        # register_new_rollout は最初に現れた rollout を対応付けるため、ペインごとに順番に起動する
+        return {pane_id: self._fork_boss_session(pane_id, main_session_id) for pane_id in boss_panes}
+
+    def _boss_panes(self, layout: CycleLayout) -> List[str]:
+        # 逐次採点は 1 枚の Boss に順次送るため、分担用のペインは使わない
+        if self._stream_boss:
+            return [layout.boss_pane]
+        return [layout.boss_pane, *layout.boss_shards]
+
+    def _resolve_boss_sessions(
+        self,
+        boss_job: Optional[Future[Dict[str, str]]],
+        boss_panes: Sequence[str],
+        main_session_id: str,
+    ) -> Dict[str, str]:
+        sessions: Dict[str, str] = {}
+        if boss_job is not None:
+            try:
+                sessions = dict(boss_job.result())
+            except Exception as exc:  # noqa: BLE001 - 事前起動に失敗した場合はその場で fork し直す
+                self._phase_log(f"Boss の事前起動に失敗したため起動し直します: {exc}")
+        missing = [pane_id for pane_id in boss_panes if pane_id not in sessions]
+        if missing:
+            sessions.update(self._fork_boss_sessions(missing, main_session_id))
+        return sessions
+
+    def _run_sharded_scoring(
+        self,
+        boss_panes: Sequence[str],
+        boss_sessions: Mapping[str, str],
+        worker_names: Sequence[str],
+        user_instruction: str,
+    ) -> Dict[str, Dict[str, Any]]:
+        """候補を複数の Boss ペインに振り分けて並列に採点させ、結果を 1 つのスコア表にまとめる."""
+        shard_count = len(boss_panes)
+        baselines: Dict[str, Optional[str]] = {}
+        for index, pane_id in enumerate(boss_panes):
+            session_id = boss_sessions[pane_id]
+            baselines[session_id] = self._monitor.get_last_assistant_message(session_id)
+            instruction = self._build_boss_instruction(
+                worker_names[index::shard_count],
+                user_instruction,
+                shard=(index + 1, shard_count),
+            )
+            self._tmux.send_instruction_to_pane(pane_id=pane_id, instruction=instruction)
+        self._phase_log(f"{shard_count} 枚の Boss ペインで採点を分担します。", status="採点中")
+        metrics = self._collect_boss_replies(baselines)
+
+        finalists = self._top_candidates(metrics, worker_names, self._boss_top_k)
+        if len(finalists) < 2:
+            return metrics
+        primary_session = boss_sessions[boss_panes[0]]
+        baseline = self._monitor.get_last_assistant_message(primary_session)
+        self._tmux.send_instruction_to_pane(
+            pane_id=boss_panes[0],
+            instruction=self._build_boss_final_round(finalists, metrics),
+        )
+        self._phase_log(f"上位 {len(finalists)} 件を再採点します。", status="採点中")
+        final = self._collect_boss_replies({primary_session: baseline})
+        rescored = {name: final[name] for name in finalists if name in final}
+        if not rescored:
+            return metrics
+        metrics.update(rescored)
+        numeric = [score for score in (self._score_value(entry) for entry in rescored.values()) if score is not None]
+        if numeric:
+            # 決勝に残らなかった候補は、担当 Boss ごとの採点基準の差で決勝進出者を上回らないよう上限を設ける
+            ceiling = min(numeric) - 1
+            for name, entry in metrics.items():
+                score = self._score_value(entry)
+                if name not in rescored and score is not None and score > ceiling:
+                    entry["score"] = ceiling
+        return metrics
+
+    def _collect_boss_replies(
+        self,
+        baselines: Mapping[str, Optional[str]],
+        timeout: float = 120.0,
+    ) -> Dict[str, Dict[str, Any]]:
+        """各 Boss セッションから、送信前とは異なる JSON 応答が届くまで待ってスコアを集める."""
+        deadline = time.time() + timeout
+        interval = self._poll_interval()
+        pending = dict(baselines)
+        metrics: Dict[str, Dict[str, Any]] = {}
+        while pending:
+            for session_id, baseline in list(pending.items()):
+                raw = self._monitor.get_last_assistant_message(session_id)
+                if not raw or raw == baseline:
+                    continue
+                parsed = self._parse_boss_scores(raw)
+                if parsed:
+                    metrics.update(parsed)
+                    del pending[session_id]
+            if not pending or time.time() >= deadline:
+                break
+            time.sleep(interval)
+        return metrics
+
+    @staticmethod
+    def _score_value(entry: Mapping[str, Any]) -> Optional[float]:
+        try:
+            return float(entry.get("score"))
+        except (TypeError, ValueError):
+            return None
+
+    def _top_candidates(
+        self,
+        metrics: Mapping[str, Mapping[str, Any]],
+        worker_names: Sequence[str],
+        limit: int,
+    ) -> List[str]:
+        if limit < 2:
+            return []
+        scored: List[tuple[float, str]] = []
+        for name in worker_names:
+            score = self._score_value(metrics[name]) if name in metrics else None
+            if score is not None:
+                scored.append((score, name))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [name for _, name in scored[:limit]]
+
+    def _stream_boss_review(
+        self,
+        stream: _BossStream,
+        worker_name: str,
+        *,
+        layout: CycleLayout,
+        main_session_id: str,
+        user_instruction: str,
+        boss_job: Optional[Future[Dict[str, str]]] = None,
+    ) -> None:
+        if stream.stale:
+            return
+        stream.queued.append(worker_name)
+        if stream.session_id is None:
+            stream.session_id = self._resolve_boss_sessions(boss_job, [layout.boss_pane], main_session_id)[layout.boss_pane]
+            self._phase_log(f"{worker_name} が完了したため、Boss による逐次採点を開始します。", status="採点中")
+        self._pump_boss_stream(stream, boss_pane=layout.boss_pane, user_instruction=user_instruction)
+
+    def _pump_boss_stream(
+        self,
+        stream: _BossStream,
+        *,
+        boss_pane: str,
+        user_instruction: str,
+        final: bool = False,
+        timeout: float = 0.0,
+    ) -> None:
+        """前の採点依頼への応答が揃っていれば、待機中の候補をまとめて次の依頼として送る."""
+        if stream.in_flight and not self._collect_boss_stream(stream, timeout=timeout):
+            return
+        if not stream.queued or stream.session_id is None:
+            return
+        names, stream.queued = stream.queued, []
+        if stream.batches == 0:
+            instruction = self._build_boss_instruction(names, user_instruction, streaming=not final)
+        else:
+            instruction = self._build_boss_stream_followup(names)
+        stream.last_raw = self._monitor.get_last_assistant_message(stream.session_id)
+        stream.in_flight = names
+        stream.batches += 1
+        self._tmux.send_instruction_to_pane(pane_id=boss_pane, instruction=instruction)
+
+    def _collect_boss_stream(self, stream: _BossStream, *, timeout: float) -> bool:
+        """送信済みの採点依頼に対する新しい JSON 応答を取り込む。timeout 内に届かなければ False."""
+        deadline = time.time() + timeout
+        interval = self._poll_interval()
+        while True:
+            raw = self._monitor.get_last_assistant_message(stream.session_id)
+            if raw and raw != stream.last_raw:
+                metrics = self._parse_boss_scores(raw)
+                if metrics:
+                    stream.metrics.update(metrics)
+                    stream.last_raw = raw
+                    stream.in_flight = []
+                    self._phase_log(f"Boss の採点を受信しました ({len(stream.metrics)} 件)。")
+                    return True
+            if time.time() >= deadline:
+                return False
+            time.sleep(interval)
+
+    def _finish_boss_stream(
+        self,
+        stream: _BossStream,
+        finished: Sequence[str],
+        *,
+        boss_pane: str,
+        user_instruction: str,
+        timeout: float = 120.0,
+    ) -> Dict[str, Dict[str, Any]]:
+        if stream.in_flight:
+            self._collect_boss_stream(stream, timeout=timeout)
+            stream.in_flight = []
+        if stream.stale:
+            stream.metrics.clear()
+            stream.queued = list(finished)
+            stream.batches = 0
+            stream.stale = False
+        else:
+            stream.queued = [name for name in stream.queued if name in finished]
+        self._pump_boss_stream(stream, boss_pane=boss_pane, user_instruction=user_instruction, final=True)
+        if stream.in_flight:
+            self._collect_boss_stream(stream, timeout=timeout)
+        return dict(stream.metrics)
+
     # --------------------------------------------------------------------- #
     # Candidate selection
     # --------------------------------------------------------------------- #
 
+    def _finished_worker_names(
+        self,
+        layout: CycleLayout,
+        fork_map: Mapping[str, str],
+        completion_info: Mapping[str, Any],
+    ) -> List[str]:
+        interrupted = {
+            layout.pane_to_worker.get(pane_id)
+            for pane_id, session_id in fork_map.items()
+            if isinstance(completion_info.get(session_id), Mapping) and completion_info[session_id].get("interrupted")
+        }
+        return [name for name in layout.worker_names if name not in interrupted]
+
     def _build_candidates(
         self,
         layout: CycleLayout,
@@ -976,25 +1531,38 @@ class Orchestrator:
         return
 
     def _wait_for_flag(self, flag_path: Path, timeout: float = 600.0) -> None:
-        poll = getattr(self._monitor, "poll_interval", 0.05)
-        try:
-            interval = float(poll)
-            if interval <= 0:
+        waiter = getattr(self._monitor, "wait_for_flag", None)
+        if callable(waiter):
+            waiter(flag_path, timeout_seconds=timeout)
+        else:
+            poll = getattr(self._monitor, "poll_interval", 0.05)
+            try:
+                interval = float(poll)
+                if interval <= 0:
+                    interval = 0.05
+            except (TypeError, ValueError):
                 interval = 0.05
-        except (TypeError, ValueError):
-            interval = 0.05
-        deadline = time.time() + timeout
-        flag_path.parent.mkdir(parents=True, exist_ok=True)
-        while time.time() < deadline:
-            if flag_path.exists():
-                return
-            time.sleep(interval)
+            deadline = time.time() + timeout
+            flag_path.parent.mkdir(parents=True, exist_ok=True)
+            while time.time() < deadline:
+                if flag_path.exists():
+                    return
+                time.sleep(interval)
+        if flag_path.exists():
+            return
         if self._log_hook:
             try:
                 self._log_hook(f"[merge] 完了フラグ {flag_path} が {timeout}s 以内に検出できませんでした。")
             except Exception:
                 pass
 
+    def _log_prepare_timings(self) -> None:
+        timings = getattr(self._worktree, "last_prepare_timings", None)
+        if not isinstance(timings, Mapping) or not timings:
+            return
+        summary = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in timings.items())
+        self._phase_log(f"worktree を準備しました ({summary})。")
+
     def _phase_log(self, message: str, status: Optional[str] = None) -> None:
         if not self._log_hook:
             return
@@ -1052,11 +1620,31 @@ class Orchestrator:
         location_notice: Optional[str] = None,
         completion_flag: Optional[Path] = None,
     ) -> str:
+        notice, directive = self._done_directive_parts(
+            instruction,
+            location_notice=location_notice,
+            completion_flag=completion_flag,
+        )
+        return instruction.rstrip() + notice + directive
+
+    def _done_directive_parts(
+        self,
+        instruction: str,
+        *,
+        location_notice: Optional[str] = None,
+        completion_flag: Optional[Path] = None,
+    ) -> tuple[str, str]:
+        """instruction の後ろに付ける (作業場所の案内, 完了手順) を返す。既に含まれているものは空文字にする."""
         if completion_flag is not None:
             flag_text = str(completion_flag)
+            socket_path = self._active_signals.socket if self._active_signals else None
+            if socket_path is not None:
+                command = f"sibyl-signal --socket {socket_path} {flag_text} || touch {flag_text}"
+            else:
+                command = f"touch {flag_text}"
             directive = (
                 "\n\nCompletion protocol:\n"
-                f"- When the entire task is complete, run `touch {flag_text}` (no markdown, single command).\n"
+                f"- When the entire task is complete, run `{command}` (no markdown, single command).\n"
                 "- The host watches that file and will automatically continue once it exists—no `/done` line is required.\n"
                 f"- If you signaled completion too early, remove the flag with `rm -f {flag_text}` and keep working."
             )
@@ -1069,13 +1657,9 @@ class Orchestrator:
             )
         notice = location_notice or self._worktree_location_notice()
 
-        parts = [instruction.rstrip()]
-        if notice and notice.strip() not in instruction:
-            parts.append(notice.rstrip())
-        if directive.strip() not in instruction:
-            parts.append(directive)
-
-        return "".join(parts)
+        notice_part = notice.rstrip() if notice and notice.strip() not in instruction else ""
+        directive_part = directive if directive.strip() not in instruction else ""
+        return notice_part, directive_part
 
     def _auto_or_select(
         self,
@@ -1160,6 +1744,9 @@ class Orchestrator:
 
     def _extract_boss_scores(self, boss_session_id: str) -> Dict[str, Dict[str, Any]]:
         raw = self._monitor.get_last_assistant_message(boss_session_id)
+        return self._parse_boss_scores(raw)
+
+    def _parse_boss_scores(self, raw: Optional[str]) -> Dict[str, Dict[str, Any]]:
         if not raw:
             return {}
 
@@ -1260,11 +1847,7 @@ class Orchestrator:
     def _build_main_fork_prompt(self) -> str:
         return "Fork"
 
-    def _build_boss_instruction(
-        self,
-        worker_names: Sequence[str],
-        user_instruction: str,
-    ) -> str:
+    def _boss_candidate_section(self, worker_names: Sequence[str]) -> str:
         worker_paths: Dict[str, Path] = getattr(self._worktree, "_worker_paths", {})
         worker_lines: List[str] = []
         for name in worker_names:
@@ -1272,7 +1855,17 @@ class Orchestrator:
             if path is None:
                 path = Path(self._worktree_location_hint(role=name))
             worker_lines.append(f"- {name} (worktree: {path})")
-        worker_section = "\n".join(worker_lines)
+        return "\n".join(worker_lines)
+
+    def _build_boss_instruction(
+        self,
+        worker_names: Sequence[str],
+        user_instruction: str,
+        *,
+        streaming: bool = False,
+        shard: Optional[tuple[int, int]] = None,
+    ) -> str:
+        worker_section = self._boss_candidate_section(worker_names)
 
         instruction = (
             "Boss evaluation phase:\n"
@@ -1296,7 +1889,17 @@ class Orchestrator:
             "}\n\n"
             "Output only the JSON object for the evaluation—do NOT return Markdown or prose at this stage.\n"
         )
-        if self._boss_mode == BossMode.REWRITE:
+        if streaming:
+            instruction += (
+                "Other workers are still running. Score only the candidates listed above; "
+                "the remaining candidates will be sent to you as they finish.\n"
+            )
+        if shard is not None:
+            instruction += (
+                f"You are reviewer {shard[0]} of {shard[1]}. Other reviewers are scoring the remaining candidates "
+                "in parallel; score only the candidates listed above.\n"
+            )
+        if self._boss_mode == BossMode.REWRITE and (shard is None or shard[0] == 1):
             instruction += (
                 "After you emit the JSON scoreboard, wait for the follow-up instructions to perform the final integration."
             )
@@ -1309,34 +1912,82 @@ class Orchestrator:
             parts.append(notice)
         return "".join(parts)
 
-    def _build_boss_rewrite_followup(self, *, boss_flag: Path) -> str:
+    def _build_boss_stream_followup(self, worker_names: Sequence[str]) -> str:
+        return (
+            "Boss evaluation phase (additional candidates):\n"
+            "These workers have now finished:\n"
+            f"{self._boss_candidate_section(worker_names)}\n\n"
+            "Score them with the same criteria as before and respond with JSON only, "
+            "using the same structure and listing only these candidates.\n"
+            "After the JSON response, stop and wait for the host to continue."
+        )
+
+    def _build_boss_final_round(
+        self,
+        worker_names: Sequence[str],
+        metrics: Mapping[str, Mapping[str, Any]],
+    ) -> str:
+        lines: List[str] = []
+        for name in worker_names:
+            entry = metrics.get(name, {})
+            candidate = self._boss_candidate_section([name])
+            lines.append(f"{candidate} - reviewer score {entry.get('score')}: {entry.get('comment', '')}")
+        return (
+            "Boss final round:\n"
+            "Several reviewers scored the candidates in parallel. These are the top candidates across all reviewers:\n"
+            + "\n".join(lines)
+            + "\n\n"
+            "Inspect these worktrees directly, compare them against each other, and re-score them on one consistent "
+            "0-100 scale.\n"
+            "Respond with JSON only, using the same structure as before and listing only these candidates.\n"
+            "After the JSON response, stop and wait for the host to continue."
+        )
+
+    def _build_boss_rewrite_followup(
+        self,
+        *,
+        boss_flag: Path,
+        merged_scores: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    ) -> str:
         if self._boss_mode != BossMode.REWRITE:
             return ""
         flag_text = str(boss_flag)
+        scored_line = "You have already produced the JSON scoreboard for the workers.\n"
+        if merged_scores:
+            scored_line = (
+                "The workers were scored by several reviewers in parallel. The merged scoreboard is:\n"
+                f"{json.dumps({'scores': merged_scores}, ensure_ascii=False)}\n"
+            )
         return (
             "Boss integration phase:\n"
-            "You have already produced the JSON scoreboard for the workers.\n"
+            f"{scored_line}"
             "Now stay in this boss workspace and deliver the final merged implementation.\n"
-            "- Review the worker outputs you just scored and decide how to combine or refine them.\n"
+            "- Review the scored worker outputs and decide how to combine or refine them.\n"
             "- If one worker result is already ideal, copy it into this boss workspace; otherwise, refactor or merge the strongest parts.\n"
             f"When the integration is completely finished, run `touch {flag_text}` to signal completion.\n"
             f"If you need to continue editing after signaling, remove the flag with `rm -f {flag_text}` and keep working."
         )
 
-    def _wait_for_boss_scores(self, boss_session_id: str, timeout: float = 120.0) -> Dict[str, Dict[str, Any]]:
-        start = time.time()
+    def _poll_interval(self) -> float:
         poll = getattr(self._monitor, "poll_interval", 1.0)
         try:
             interval = float(poll)
-            if interval <= 0:
-                interval = 1.0
         except (TypeError, ValueError):
-            interval = 1.0
+            return 1.0
+        return interval if interval > 0 else 1.0
+
+    def _wait_for_boss_scores(self, boss_session_id: str, timeout: float = 120.0) -> Dict[str, Dict[str, Any]]:
+        start = time.time()
+        interval = self._poll_interval()
         metrics: Dict[str, Dict[str, Any]] = {}
+        last_raw: Optional[str] = None
         while time.time() - start < timeout:
-            metrics = self._extract_boss_scores(boss_session_id)
-            if metrics:
-                break
+            raw = self._monitor.get_last_assistant_message(boss_session_id)
+            if raw != last_raw:
+                last_raw = raw
+                metrics = self._parse_boss_scores(raw)
+                if metrics:
+                    break
             time.sleep(interval)
         return metrics
 
@@ -1,14 +1,30 @@
 """Service layer components exposed for orchestrator and controller."""
 
+from .codex_home import CodexHomeManager
 from .codex_monitor import CodexMonitor, SessionReservationError
+from .file_watcher import FileWatcher
 from .log_manager import LogManager
+from .rollout_index import RolloutIndex
+from .rollout_reader import AssistantMessageEvent, RolloutReader, SessionMetaEvent
+from .signal_server import SignalServer
+from .tmux_control import ControlPane, TmuxControlClient, TmuxControlError
 from .tmux_manager import TmuxLayoutManager
 from .worktree_manager import WorktreeManager
 
 __all__ = [
+    "AssistantMessageEvent",
+    "CodexHomeManager",
     "CodexMonitor",
+    "ControlPane",
+    "FileWatcher",
     "LogManager",
+    "RolloutIndex",
+    "RolloutReader",
+    "SessionMetaEvent",
     "SessionReservationError",
+    "SignalServer",
+    "TmuxControlClient",
+    "TmuxControlError",
     "TmuxLayoutManager",
     "WorktreeManager",
 ]
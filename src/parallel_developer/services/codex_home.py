@@ -0,0 +1,104 @@
+"""ペインごとに専用の CODEX_HOME を用意するサービス."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Set
+
+DEFAULT_SHARED_ENTRIES: tuple[str, ...] = (
+    "auth.json",
+    "config.toml",
+    "config.json",
+    "AGENTS.md",
+    "instructions.md",
+    "prompts",
+)
+
+
+class CodexHomeManager:
+    """各ペインの rollout が専用ディレクトリにだけ書かれるよう、ペイン単位の Codex HOME を構成する.
+
+    認証情報や設定は共有 HOME へのシンボリックリンクとし、sessions/ だけをペインごとに分ける。
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        source_home: Optional[Path] = None,
+        shared_entries: Sequence[str] = DEFAULT_SHARED_ENTRIES,
+    ) -> None:
+        self.root = Path(root)
+        if source_home is not None:
+            self.source_home = Path(source_home).expanduser()
+        else:
+            env_home = os.environ.get("CODEX_HOME")
+            self.source_home = Path(env_home).expanduser() if env_home else Path.home() / ".codex"
+        self.shared_entries = tuple(shared_entries)
+        self._lock = threading.Lock()
+        self._homes: Dict[str, Path] = {}
+        self._staged: Set[Path] = set()
+
+    def home_for(self, pane_id: str) -> Path:
+        with self._lock:
+            home = self._homes.get(pane_id)
+            if home is not None:
+                return home
+            home = self.root / f"pane-{str(pane_id).lstrip('%') or 'unknown'}"
+            (home / "sessions").mkdir(parents=True, exist_ok=True)
+            for name in self.shared_entries:
+                self._link_shared(home, name)
+            self._homes[pane_id] = home
+            return home
+
+    def sessions_dir(self, pane_id: str) -> Path:
+        return self.home_for(pane_id) / "sessions"
+
+    def staged_path(self, pane_id: str, rollout_path: Path) -> Path:
+        """rollout をペインの HOME へ複製した場合の配置先 (既にペイン配下ならそのまま)."""
+        source = Path(rollout_path)
+        sessions = self.sessions_dir(pane_id)
+        if sessions in source.parents:
+            return source
+        # sessions/YYYY/MM/DD/ の日付階層を保ったまま配置する
+        return sessions.joinpath(*source.parent.parts[-3:], source.name)
+
+    def stage_rollout(self, pane_id: str, rollout_path: Path) -> Optional[Path]:
+        """codex resume は自分の HOME 配下からしか rollout を探さないため、元 rollout をペインの HOME へ複製する."""
+        source = Path(rollout_path)
+        target = self.staged_path(pane_id, source)
+        if target == source:
+            return source
+        if not source.is_file():
+            return None
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            # 監視側が新規 rollout と誤認しないよう、書き込み前に登録しておく
+            self._staged.add(target)
+        try:
+            shutil.copy2(source, target)
+        except OSError:
+            return None
+        return target
+
+    def is_staged(self, path: Path) -> bool:
+        with self._lock:
+            return Path(path) in self._staged
+
+    # 内部ユーティリティ  -------------------------------------------------
+    def _link_shared(self, home: Path, name: str) -> None:
+        source = self.source_home / name
+        target = home / name
+        if not source.exists() or target.exists() or target.is_symlink():
+            return
+        try:
+            target.symlink_to(source, target_is_directory=source.is_dir())
+        except OSError:
+            if source.is_file():
+                try:
+                    shutil.copy2(source, target)
+                except OSError:
+                    pass
@@ -4,12 +4,22 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
+import uuid
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Set, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Set, TYPE_CHECKING, Union
 
 import yaml
 
+from .file_watcher import FileWatcher
+from .rollout_index import RolloutIndex
+from .rollout_reader import RolloutReader
+
+if TYPE_CHECKING:  # pragma: no cover - 型チェック専用
+    from .codex_home import CodexHomeManager
+
 
 class SessionReservationError(RuntimeError):
     """Codex rollout が既に別 namespace によって予約されている場合の例外."""
@@ -34,24 +44,42 @@ class CodexMonitor:
         codex_sessions_root: Optional[Path] = None,
         poll_interval: float = 0.05,
         session_namespace: Optional[str] = None,
+        flush_interval: float = 1.0,
+        codex_homes: Optional["CodexHomeManager"] = None,
     ) -> None:
-        self.logs_dir = Path(logs_dir)
         self.session_map_path = Path(session_map_path)
         self.poll_interval = poll_interval
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
-        (self.logs_dir / "sessions").mkdir(parents=True, exist_ok=True)
-        if not self.session_map_path.exists():
-            self.session_map_path.write_text("{}\n", encoding="utf-8")
+        self.flush_interval = flush_interval
+        self.set_logs_dir(logs_dir)
+        self._map_lock = threading.RLock()
+        self._map_dirty = False
+        self._last_flush = 0.0
+        self._map, legacy = self._read_map_file()
+        if legacy or not self.session_map_path.exists():
+            self.flush(force=True)
         self.codex_sessions_root = (
             Path(codex_sessions_root)
             if codex_sessions_root is not None
             else Path.home() / ".codex" / "sessions"
         )
+        self._rollout_index = RolloutIndex(self.codex_sessions_root)
+        self.codex_homes = codex_homes
+        # ペイン専用 HOME 利用時は pane-N/sessions ごとに索引を持ち、基準化ではそれらの結果を束ねる
+        self._home_indexes: Dict[Path, RolloutIndex] = {}
+        self._index_lock = threading.Lock()
         self._session_namespace = session_namespace or "default"
         self._registry_dir = self.session_map_path.parent / "codex_session_registry"
         self._owned_sessions: Set[str] = set()
         self._forced_done: Set[str] = set()
         self._active_signal_paths: Dict[str, Path] = {}
+        self._watcher = FileWatcher(poll_interval=poll_interval, heartbeat=poll_interval * 20)
+        self._readers: Dict[str, RolloutReader] = {}
+
+    def set_logs_dir(self, logs_dir: Path) -> None:
+        """指示ログの出力先を切り替える (セッション対応表と rollout の読み取り位置は保持する)."""
+        self.logs_dir = Path(logs_dir)
+        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        (self.logs_dir / "sessions").mkdir(parents=True, exist_ok=True)
 
     def register_session(self, *, pane_id: str, session_id: str, rollout_path: Path) -> None:
         try:
@@ -61,72 +89,80 @@ class CodexMonitor:
 
         self._reserve_session(session_id, rollout_path)
 
-        data = self._load_map()
-        panes = data.setdefault("panes", {})
-        sessions = data.setdefault("sessions", {})
+        # Boss の事前起動はワーカーの完了待ちと別スレッドで登録するため、対応表の更新をまとめて排他する
+        with self._map_lock:
+            data = self._load_map()
+            panes = data.setdefault("panes", {})
+            sessions = data.setdefault("sessions", {})
 
-        panes[pane_id] = {
-            "session_id": session_id,
-            "rollout_path": str(rollout_path),
-            "offset": int(offset),
-        }
-        sessions[session_id] = {
-            "pane_id": pane_id,
-            "rollout_path": str(rollout_path),
-            "offset": int(offset),
-        }
-        self._write_map(data)
+            panes[pane_id] = {
+                "session_id": session_id,
+                "rollout_path": str(rollout_path),
+                "offset": int(offset),
+            }
+            sessions[session_id] = {
+                "pane_id": pane_id,
+                "rollout_path": str(rollout_path),
+                "offset": int(offset),
+            }
+            self._write_map(data)
 
     def consume_session_until_eof(self, session_id: str) -> None:
-        data = self._load_map()
-        entry = data.get("sessions", {}).get(session_id)
-        if entry is None:
-            return
-        rollout_path = Path(entry.get("rollout_path", ""))
-        if not rollout_path.exists():
-            return
-        try:
-            size = rollout_path.stat().st_size
-        except OSError:
-            return
-        entry["offset"] = int(size)
-        sessions = data.setdefault("sessions", {})
-        sessions[session_id] = entry
-        panes = data.setdefault("panes", {})
-        for pane_id, pane_entry in panes.items():
-            if pane_entry.get("session_id") == session_id:
-                pane_entry["offset"] = int(size)
-        self._write_map(data)
+        with self._map_lock:
+            data = self._load_map()
+            entry = data.get("sessions", {}).get(session_id)
+            if entry is None:
+                return
+            rollout_path = Path(entry.get("rollout_path", ""))
+            if not rollout_path.exists():
+                return
+            try:
+                size = rollout_path.stat().st_size
+            except OSError:
+                return
+            entry["offset"] = int(size)
+            sessions = data.setdefault("sessions", {})
+            sessions[session_id] = entry
+            panes = data.setdefault("panes", {})
+            for pane_id, pane_entry in panes.items():
+                if pane_entry.get("session_id") == session_id:
+                    pane_entry["offset"] = int(size)
+            self._write_map(data)
 
     def refresh_session_id(self, session_id: str) -> str:
-        data = self._load_map()
-        sessions = data.get("sessions", {})
-        entry = sessions.get(session_id)
-        if entry is None or not session_id.startswith("unknown-"):
-            return session_id
+        # flush や offset 更新と並行して対応表を書き換えるため、付け替えは一括で排他する
+        with self._map_lock:
+            data = self._load_map()
+            sessions = data.get("sessions", {})
+            entry = sessions.get(session_id)
+            if entry is None or not session_id.startswith("unknown-"):
+                return session_id
 
-        rollout_path = Path(entry.get("rollout_path", ""))
-        actual_id = self._extract_session_meta(rollout_path)
-        if not actual_id or actual_id.startswith("unknown-"):
-            return session_id
+            rollout_path = Path(entry.get("rollout_path", ""))
+            actual_id = self._extract_session_meta(rollout_path)
+            if not actual_id or actual_id.startswith("unknown-"):
+                return session_id
 
-        entry["session_id"] = actual_id
-        sessions.pop(session_id, None)
-        sessions[actual_id] = entry
+            entry["session_id"] = actual_id
+            sessions.pop(session_id, None)
+            sessions[actual_id] = entry
 
-        panes = data.get("panes", {})
-        for pane_entry in panes.values():
-            if pane_entry.get("session_id") == session_id:
-                pane_entry["session_id"] = actual_id
+            panes = data.get("panes", {})
+            for pane_entry in panes.values():
+                if pane_entry.get("session_id") == session_id:
+                    pane_entry["session_id"] = actual_id
 
-        self._write_map(data)
+            self._write_map(data)
 
-        if session_id in self._owned_sessions:
-            self._owned_sessions.discard(session_id)
-            self._owned_sessions.add(actual_id)
-        if session_id in self._forced_done:
-            self._forced_done.discard(session_id)
-            self._forced_done.add(actual_id)
+            if session_id in self._owned_sessions:
+                self._owned_sessions.discard(session_id)
+                self._owned_sessions.add(actual_id)
+            if session_id in self._forced_done:
+                self._forced_done.discard(session_id)
+                self._forced_done.add(actual_id)
+            reader = self._readers.pop(session_id, None)
+            if reader is not None:
+                self._readers[actual_id] = reader
 
         if self._registry_dir.exists():
             old_record = self._registry_dir / f"{session_id}.json"
@@ -140,44 +176,59 @@ class CodexMonitor:
         return actual_id
 
     def bind_existing_session(self, *, pane_id: str, session_id: str) -> None:
-        data = self._load_map()
-        sessions = data.setdefault("sessions", {})
-        entry = sessions.get(session_id)
-        if entry is None:
-            raise RuntimeError(f"Session {session_id!r} not found in session_map")
+        with self._map_lock:
+            data = self._load_map()
+            sessions = data.setdefault("sessions", {})
+            entry = sessions.get(session_id)
+            if entry is None:
+                raise RuntimeError(f"Session {session_id!r} not found in session_map")
 
-        rollout_path = Path(entry.get("rollout_path", ""))
-        try:
-            offset = rollout_path.stat().st_size
-        except OSError:
-            offset = int(entry.get("offset", 0))
+            # resume 先のペインでは HOME へ複製した rollout に追記されるため、以降はそちらを追跡する
+            rollout_path = self._pane_rollout(pane_id, Path(entry.get("rollout_path", "")))
+            try:
+                offset = rollout_path.stat().st_size
+            except OSError:
+                offset = int(entry.get("offset", 0))
 
-        entry["pane_id"] = pane_id
-        entry["offset"] = int(offset)
+            entry["pane_id"] = pane_id
+            entry["rollout_path"] = str(rollout_path)
+            entry["offset"] = int(offset)
 
-        panes = data.setdefault("panes", {})
-        for existing_pane, pane_entry in list(panes.items()):
-            if existing_pane == pane_id or pane_entry.get("session_id") == session_id:
-                panes.pop(existing_pane, None)
+            panes = data.setdefault("panes", {})
+            for existing_pane, pane_entry in list(panes.items()):
+                if existing_pane == pane_id or pane_entry.get("session_id") == session_id:
+                    panes.pop(existing_pane, None)
 
-        panes[pane_id] = {
-            "session_id": session_id,
-            "rollout_path": entry["rollout_path"],
-            "offset": int(offset),
-        }
+            panes[pane_id] = {
+                "session_id": session_id,
+                "rollout_path": entry["rollout_path"],
+                "offset": int(offset),
+            }
 
-        self._write_map(data)
+            self._write_map(data)
 
     def snapshot_rollouts(self) -> Dict[Path, float]:
-        if not self.codex_sessions_root.exists():
-            return {}
-        result: Dict[Path, float] = {}
-        for path in self.codex_sessions_root.glob("**/rollout-*.jsonl"):
-            try:
-                result[path] = path.stat().st_mtime
-            except FileNotFoundError:
-                continue
-        return result
+        snapshot = self._rollout_index.snapshot()
+        homes = self.codex_homes
+        if homes is not None:
+            with self._index_lock:
+                sessions_dirs = set(self._home_indexes)
+            sessions_dirs.update(path for path in homes.root.glob("pane-*/sessions") if path.is_dir())
+            for sessions_dir in sorted(sessions_dirs):
+                snapshot.update(self._home_index_for(sessions_dir).snapshot())
+        return snapshot
+
+    def rollout_path(self, session_id: str) -> Optional[Path]:
+        """session_id の rollout パス。対応表に無ければ共有 sessions から UUID 付きのファイル名で探す."""
+        with self._map_lock:
+            entry = self._load_map().get("sessions", {}).get(session_id)
+        if entry and entry.get("rollout_path"):
+            return Path(entry["rollout_path"])
+        suffix = f"-{session_id}.jsonl"
+        for path in self._rollout_index.refresh():
+            if path.name.endswith(suffix):
+                return path
+        return None
 
     def register_new_rollout(
         self,
@@ -197,6 +248,7 @@ class CodexMonitor:
                 baseline_map,
                 expected=1,
                 timeout_seconds=remaining,
+                pane_id=pane_id,
             )
             if not paths:
                 break
@@ -226,12 +278,15 @@ class CodexMonitor:
         worker_panes: Sequence[str],
         baseline: Mapping[Path, float],
         timeout_seconds: float = 30.0,
+        pane_paths: Optional[Mapping[str, Path]] = None,
     ) -> Dict[str, str]:
         if not worker_panes:
             return {}
 
         baseline_map: Dict[Path, float] = dict(baseline)
         deadline = time.time() + timeout_seconds
+        if self.codex_homes is not None:
+            return self._register_isolated_worker_rollouts(worker_panes, baseline_map, deadline)
         fork_map: Dict[str, str] = {}
 
         while len(fork_map) < len(worker_panes):
@@ -247,21 +302,12 @@ class CodexMonitor:
                 break
             for path in paths:
                 self._mark_rollout_seen(baseline_map, path)
-                pane_index = len(fork_map)
-                if pane_index >= len(worker_panes):
+                if len(fork_map) >= len(worker_panes):
                     break
-                pane_id = worker_panes[pane_index]
-                session_id = self._wait_for_session_identifier(
-                    path,
-                    self._parse_session_meta(path),
-                    timeout_seconds=min(2.0, remaining),
-                )
-                session_id = self._await_real_session_id(session_id)
-                session_id = self._wait_for_session_identifier(
-                    path,
-                    session_id,
-                    timeout_seconds=min(2.0, remaining),
-                )
+                session_id = self._settle_worker_session_id(path, remaining)
+                pane_id = self._match_worker_pane(path, worker_panes, fork_map, pane_paths)
+                if pane_id is None:
+                    continue
                 try:
                     self.register_session(pane_id=pane_id, session_id=session_id, rollout_path=path)
                 except SessionReservationError:
@@ -275,55 +321,114 @@ class CodexMonitor:
 
         return fork_map
 
-    def get_last_assistant_message(self, session_id: str) -> Optional[str]:
-        data = self._load_map()
-        sessions = data.get("sessions", {})
-        entry = sessions.get(session_id)
-        if entry is None:
-            return None
-
-        rollout_path = Path(entry.get("rollout_path", ""))
-        if not rollout_path.exists():
-            return None
-
-        last_text: Optional[str] = None
-        try:
-            with rollout_path.open("r", encoding="utf-8") as fh:
-                for line in fh:
+    def _register_isolated_worker_rollouts(
+        self,
+        worker_panes: Sequence[str],
+        baseline_map: MutableMapping[Path, float],
+        deadline: float,
+    ) -> Dict[str, str]:
+        """ペイン専用 HOME では rollout の置き場所がそのままペインを示すため、到着順に頼らず割り当てる."""
+        fork_map: Dict[str, str] = {}
+        for pane_id in worker_panes:
+            while pane_id not in fork_map:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                paths = self._wait_for_new_rollouts(
+                    baseline_map,
+                    expected=1,
+                    timeout_seconds=remaining,
+                    pane_id=pane_id,
+                )
+                if not paths:
+                    break
+                for path in paths:
+                    self._mark_rollout_seen(baseline_map, path)
+                    session_id = self._settle_worker_session_id(path, remaining)
                     try:
-                        obj = json.loads(line)
-                    except json.JSONDecodeError:
+                        self.register_session(pane_id=pane_id, session_id=session_id, rollout_path=path)
+                    except SessionReservationError:
                         continue
+                    fork_map[pane_id] = self._await_real_session_id(session_id)
+                    break
+            if pane_id not in fork_map:
+                break
 
-                    if obj.get("type") != "response_item":
-                        continue
+        if len(fork_map) < len(worker_panes):
+            raise TimeoutError(f"Detected {len(fork_map)} worker rollouts but {len(worker_panes)} required.")
+        return fork_map
 
-                    payload = obj.get("payload", {})
-                    if payload.get("role") != "assistant":
-                        continue
+    def _settle_worker_session_id(self, path: Path, remaining: float) -> str:
+        session_id = self._wait_for_session_identifier(
+            path,
+            self._parse_session_meta(path),
+            timeout_seconds=min(2.0, remaining),
+        )
+        session_id = self._await_real_session_id(session_id)
+        return self._wait_for_session_identifier(
+            path,
+            session_id,
+            timeout_seconds=min(2.0, remaining),
+        )
 
-                    texts: List[str] = []
-                    for block in payload.get("content", []):
-                        block_type = block.get("type")
-                        if block_type in {"output_text", "text"}:
-                            texts.append(block.get("text", ""))
-                        elif block_type == "output_markdown":
-                            texts.append(block.get("markdown", ""))
-                        elif block_type == "output_json":
-                            data = block.get("json")
-                            if data is not None:
-                                texts.append(json.dumps(data))
-                    if texts:
-                        last_text = "\n".join(part for part in texts if part).strip()
-        except OSError:
+    def clone_worker_sessions(
+        self,
+        *,
+        base_session_id: str,
+        worker_panes: Sequence[str],
+        pane_paths: Optional[Mapping[str, Path]] = None,
+    ) -> Dict[str, str]:
+        """base の rollout を新しい session id 付きで複製してペインへ登録する (resume 前に id が確定する)."""
+        source = self.rollout_path(base_session_id)
+        if source is None or not source.is_file():
+            raise FileNotFoundError(f"Rollout for Codex session {base_session_id} was not found.")
+        data = source.read_bytes()
+        # 書き込み途中の末尾行は複製しない
+        lines = data[: data.rfind(b"\n") + 1].splitlines(keepends=True)
+        meta_index = next((index for index, line in enumerate(lines) if b'"session_meta"' in line), None)
+        if meta_index is None:
+            raise ValueError(f"Rollout for Codex session {base_session_id} has no session_meta.")
+        meta = json.loads(lines[meta_index].decode("utf-8"))
+        now = datetime.now()
+        fork_map: Dict[str, str] = {}
+        for pane_id in worker_panes:
+            session_id = str(uuid.uuid4())
+            payload = dict(meta.get("payload") or {})
+            payload["id"] = session_id
+            if pane_paths and pane_id in pane_paths:
+                payload["cwd"] = str(pane_paths[pane_id])
+            lines[meta_index] = (json.dumps({**meta, "payload": payload}, ensure_ascii=False) + "\n").encode("utf-8")
+            root = self.codex_homes.sessions_dir(pane_id) if self.codex_homes is not None else self.codex_sessions_root
+            # codex resume はファイル名に含まれる session id で rollout を探すため、Codex と同じ命名にする
+            target = root / now.strftime("%Y/%m/%d") / f"rollout-{now.strftime('%Y-%m-%dT%H-%M-%S')}-{session_id}.jsonl"
+            target.parent.mkdir(parents=True, exist_ok=True)
+            temp = target.with_name(f".{target.name}.tmp")
+            temp.write_bytes(b"".join(lines))
+            os.replace(temp, target)
+            self.register_session(pane_id=pane_id, session_id=session_id, rollout_path=target)
+            fork_map[pane_id] = session_id
+        return fork_map
+
+    def get_last_assistant_message(self, session_id: str) -> Optional[str]:
+        with self._map_lock:
+            entry = self._load_map().get("sessions", {}).get(session_id)
+            if entry is None:
+                return None
+            rollout_path = Path(entry.get("rollout_path", ""))
+        if not rollout_path.exists():
             return None
 
-        return last_text
+        reader = self._reader_for(session_id, rollout_path)
+        reader.read()
+        if reader.last_assistant is None:
+            return None
+        return reader.last_assistant.text
 
     def capture_instruction(self, *, pane_id: str, instruction: str) -> str:
-        data = self._load_map()
-        pane_entry = data.get("panes", {}).get(pane_id)
-        if pane_entry is None:
+        with self._map_lock:
+            pane_entry = self._load_map().get("panes", {}).get(pane_id)
+            session_id = pane_entry["session_id"] if pane_entry is not None else None
+        if session_id is None:
             raise RuntimeError(
                 f"Pane {pane_id!r} is not registered in session_map; ensure Codex session detection succeeded."
             )
@@ -332,7 +437,7 @@ class CodexMonitor:
         with instruction_log.open("a", encoding="utf-8") as fh:
             fh.write(json.dumps({"pane": pane_id, "instruction": instruction}) + "\n")
 
-        return pane_entry["session_id"]
+        return session_id
 
     def await_completion(
         self,
@@ -340,18 +445,24 @@ class CodexMonitor:
         session_ids: Iterable[str],
         timeout_seconds: Optional[int] = None,
         signal_paths: Optional[Mapping[str, Union[str, Path]]] = None,
+        quorum: Optional[int] = None,
+        grace_seconds: Optional[float] = None,
+        on_complete: Optional[Callable[[str, Dict[str, Any]], None]] = None,
     ) -> Dict[str, Any]:
-        data = self._load_map()
-        sessions = data.get("sessions", {})
+        """全セッションの完了を待つ。quorum 件の完了、または最初の完了から grace_seconds 経過でも打ち切る.
 
+        on_complete を渡すと、各セッションの完了を検知した時点で (session_id, entry) を通知する。
+        """
         targets: Dict[str, Path] = {}
         offsets: Dict[str, int] = {}
-        for session_id in session_ids:
-            entry = sessions.get(session_id)
-            if entry is None:
-                raise RuntimeError(f"Session {session_id!r} not found in session_map")
-            targets[session_id] = Path(entry["rollout_path"])
-            offsets[session_id] = int(entry.get("offset", 0))
+        with self._map_lock:
+            sessions = self._load_map().get("sessions", {})
+            for session_id in session_ids:
+                entry = sessions.get(session_id)
+                if entry is None:
+                    raise RuntimeError(f"Session {session_id!r} not found in session_map")
+                targets[session_id] = Path(entry["rollout_path"])
+                offsets[session_id] = int(entry.get("offset", 0))
 
         remaining = set(targets)
         completion: Dict[str, Any] = {}
@@ -364,49 +475,73 @@ class CodexMonitor:
                 signal_targets[session_id] = flag_path
                 self._active_signal_paths[session_id] = flag_path
 
+        def mark_done(session_id: str, entry: Dict[str, Any]) -> None:
+            completion[session_id] = entry
+            remaining.discard(session_id)
+            if on_complete is not None:
+                on_complete(session_id, entry)
+
         def consume_forced() -> None:
-            forced_now = remaining.intersection(self._forced_done)
+            with self._map_lock:
+                forced_now = remaining.intersection(self._forced_done)
             for session_id in list(forced_now):
                 path = targets[session_id]
                 try:
                     offset = path.stat().st_size
                 except OSError:
                     offset = 0
-                completion[session_id] = {"done": True, "rollout_path": str(path), "forced": True}
                 offsets[session_id] = offset
-                remaining.remove(session_id)
+                mark_done(session_id, {"done": True, "rollout_path": str(path), "forced": True})
 
         deadline = None if timeout_seconds is None else time.time() + timeout_seconds
-        while remaining:
-            consume_forced()
-            if not remaining:
-                break
-            for session_id in list(remaining):
-                if session_id in signal_targets and signal_targets[session_id].exists():
-                    completion[session_id] = {"done": True, "rollout_path": str(targets[session_id])}
-                    remaining.remove(session_id)
-                    flag_path = signal_targets[session_id]
-                    try:
-                        flag_path.unlink()
-                    except OSError:
-                        pass
-                    continue
-                done, new_offset = self._contains_done(
-                    session_id=session_id,
-                    rollout_path=targets[session_id],
-                    offset=offsets.get(session_id, 0),
-                )
-                if new_offset != offsets.get(session_id, 0):
-                    offsets[session_id] = new_offset
-                    self._update_session_offset(session_id, new_offset)
-                if done:
-                    completion[session_id] = {"done": True, "rollout_path": str(targets[session_id])}
-                    remaining.remove(session_id)
-            if not remaining:
-                break
-            if deadline is not None and time.time() >= deadline:
-                break
-            time.sleep(self.poll_interval)
+        quorum_target = None if quorum is None else max(1, min(int(quorum), len(targets)))
+        first_done_at: Optional[float] = None
+
+        def quorum_reached() -> bool:
+            done_count = sum(1 for entry in completion.values() if entry.get("done"))
+            return quorum_target is not None and done_count >= quorum_target
+
+        with self._watcher.watching(files=[*targets.values(), *signal_targets.values()]) as scope:
+            while remaining:
+                token = scope.token()
+                consume_forced()
+                if not remaining:
+                    break
+                for session_id in list(remaining):
+                    if session_id in signal_targets and signal_targets[session_id].exists():
+                        flag_path = signal_targets[session_id]
+                        try:
+                            flag_path.unlink()
+                        except OSError:
+                            pass
+                        mark_done(session_id, {"done": True, "rollout_path": str(targets[session_id])})
+                        continue
+                    done, new_offset = self._contains_done(
+                        session_id=session_id,
+                        rollout_path=targets[session_id],
+                        offset=offsets.get(session_id, 0),
+                    )
+                    if new_offset != offsets.get(session_id, 0):
+                        offsets[session_id] = new_offset
+                        self._update_session_offset(session_id, new_offset)
+                    if done:
+                        mark_done(session_id, {"done": True, "rollout_path": str(targets[session_id])})
+                if completion and first_done_at is None:
+                    first_done_at = time.time()
+                if not remaining or quorum_reached():
+                    break
+                if grace_seconds is not None and first_done_at is not None:
+                    grace_deadline = first_done_at + grace_seconds
+                    if deadline is None or grace_deadline < deadline:
+                        deadline = grace_deadline
+                if deadline is not None and time.time() >= deadline:
+                    break
+                wait_for = None if deadline is None else deadline - time.time()
+                # 間引いた読み取り位置が次の追記まで書き出されずに残らないよう、書き出し期限でも起きる
+                flush_in = self._flush_if_due()
+                if flush_in is not None:
+                    wait_for = flush_in if wait_for is None else min(wait_for, flush_in)
+                scope.wait(token, wait_for)
 
         for session_id in remaining:
             completion[session_id] = {
@@ -417,13 +552,26 @@ class CodexMonitor:
         for session_id in signal_targets:
             self._active_signal_paths.pop(session_id, None)
 
+        self.flush()
         return completion
 
+    def notify_signal(self) -> None:
+        """ソケット経由の完了通知を受けた際に、待機中の処理へフラグを即座に再確認させる."""
+        self._watcher.notify()
+
     def force_completion(self, session_ids: Iterable[str]) -> None:
         for session_id in session_ids:
             if session_id:
-                self._forced_done.add(session_id)
+                with self._map_lock:
+                    self._forced_done.add(session_id)
                 self._release_session(session_id)
+        self._watcher.notify()
+
+    def clear_forced_completion(self, session_ids: Iterable[str]) -> None:
+        """持ち越したセッションを次サイクルで改めて待てるよう、強制完了の印を外す."""
+        with self._map_lock:
+            for session_id in session_ids:
+                self._forced_done.discard(session_id)
 
     def wait_for_rollout_activity(
         self,
@@ -432,27 +580,72 @@ class CodexMonitor:
         min_bytes: int = 1,
         timeout_seconds: float = 5.0,
     ) -> None:
-        data = self._load_map()
-        sessions = data.get("sessions", {})
-        entry = sessions.get(session_id)
-        if entry is None:
-            return
-        rollout_path = Path(entry.get("rollout_path", ""))
-        baseline = int(entry.get("offset", 0))
+        with self._map_lock:
+            entry = self._load_map().get("sessions", {}).get(session_id)
+            if entry is None:
+                return
+            rollout_path = Path(entry.get("rollout_path", ""))
+            baseline = int(entry.get("offset", 0))
         deadline = time.time() + timeout_seconds
         last_size = baseline
 
-        while time.time() < deadline:
+        with self._watcher.watching(files=[rollout_path]) as scope:
+            while time.time() < deadline:
+                token = scope.token()
+                try:
+                    size = rollout_path.stat().st_size
+                except OSError:
+                    break
+                if size - baseline >= min_bytes:
+                    last_size = size
+                    break
+                scope.wait(token, deadline - time.time())
+        self._update_session_offset(session_id, int(last_size))
+        self.flush()
+
+    def wait_for_flag(self, flag_path: Path, *, timeout_seconds: float = 600.0) -> bool:
+        flag_path = Path(flag_path)
+        flag_path.parent.mkdir(parents=True, exist_ok=True)
+        deadline = time.time() + timeout_seconds
+        with self._watcher.watching(files=[flag_path]) as scope:
+            while True:
+                token = scope.token()
+                if flag_path.exists():
+                    return True
+                if time.time() >= deadline:
+                    return False
+                scope.wait(token, deadline - time.time())
+
+    def flush(self, *, force: bool = False) -> None:
+        """メモリ上のセッション対応表を一時ファイル経由でアトミックに書き出す."""
+        with self._map_lock:
+            if not (force or self._map_dirty):
+                return
+            payload = json.dumps(self._map, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+            tmp_path = self.session_map_path.with_name(f".{self.session_map_path.name}.{os.getpid()}.tmp")
             try:
-                size = rollout_path.stat().st_size
+                with tmp_path.open("w", encoding="utf-8") as fh:
+                    fh.write(payload)
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                os.replace(tmp_path, self.session_map_path)
             except OSError:
-                break
-            if size - baseline >= min_bytes:
-                last_size = size
-                break
-            time.sleep(self.poll_interval / 2)
-        entry["offset"] = int(last_size)
-        self._update_session_offset(session_id, int(last_size))
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+                return
+            self._map_dirty = False
+            self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        self.flush()
+        self._watcher.close()
+        with self._map_lock:
+            readers = list(self._readers.values())
+            self._readers.clear()
+        for reader in readers:
+            reader.close()
 
     # 内部ユーティリティ  -------------------------------------------------
     def _reserve_session(self, session_id: str, rollout_path: Path) -> None:
@@ -472,7 +665,8 @@ class CodexMonitor:
             try:
                 with record_path.open("x", encoding="utf-8") as fh:
                     json.dump(metadata, fh, ensure_ascii=False)
-                self._owned_sessions.add(session_id)
+                with self._map_lock:
+                    self._owned_sessions.add(session_id)
                 return
             except FileExistsError:
                 try:
@@ -484,7 +678,8 @@ class CodexMonitor:
                 if owner_ns == self._session_namespace:
                     try:
                         record_path.write_text(json.dumps(metadata, ensure_ascii=False), encoding="utf-8")
-                        self._owned_sessions.add(session_id)
+                        with self._map_lock:
+                            self._owned_sessions.add(session_id)
                     except OSError:
                         pass
                     return
@@ -503,14 +698,16 @@ class CodexMonitor:
         try:
             existing = json.loads(record_path.read_text(encoding="utf-8"))
         except (FileNotFoundError, json.JSONDecodeError):
-            self._owned_sessions.discard(session_id)
+            with self._map_lock:
+                self._owned_sessions.discard(session_id)
             return
         if existing.get("namespace") == self._session_namespace:
             try:
                 record_path.unlink()
             except OSError:
                 pass
-            self._owned_sessions.discard(session_id)
+            with self._map_lock:
+                self._owned_sessions.discard(session_id)
 
     @staticmethod
     def _pid_exists(pid: int) -> bool:
@@ -536,27 +733,59 @@ class CodexMonitor:
         *,
         expected: int,
         timeout_seconds: float,
+        pane_id: Optional[str] = None,
     ) -> List[Path]:
         deadline = time.time() + timeout_seconds
         baseline_paths = set(baseline.keys())
-        while True:
-            current = self.snapshot_rollouts()
-            new_paths = [path for path in current.keys() if path not in baseline_paths]
-            if len(new_paths) >= expected:
-                new_paths.sort(key=lambda p: current.get(p, 0.0))
-                return new_paths
-            if time.time() >= deadline:
-                new_paths.sort(key=lambda p: current.get(p, 0.0))
-                return new_paths
-            time.sleep(self.poll_interval)
+        root, index = self._rollout_source(pane_id)
+        homes = self.codex_homes
+        with self._watcher.watching(dirs=[root]) as scope:
+            while True:
+                token = scope.token()
+                current = index.refresh()
+                new_paths = [
+                    path
+                    for path in current.keys()
+                    if path not in baseline_paths and (homes is None or not homes.is_staged(path))
+                ]
+                if len(new_paths) >= expected:
+                    new_paths.sort(key=lambda p: current.get(p, 0.0))
+                    return new_paths
+                if time.time() >= deadline:
+                    new_paths.sort(key=lambda p: current.get(p, 0.0))
+                    return new_paths
+                scope.wait(token, deadline - time.time())
+
+    def _rollout_source(self, pane_id: Optional[str]) -> tuple[Path, RolloutIndex]:
+        if self.codex_homes is None or pane_id is None:
+            return self.codex_sessions_root, self._rollout_index
+        index = self._home_index_for(self.codex_homes.sessions_dir(pane_id))
+        return index.root, index
+
+    def _home_index_for(self, sessions_dir: Path) -> RolloutIndex:
+        with self._index_lock:
+            index = self._home_indexes.get(sessions_dir)
+            if index is None:
+                index = RolloutIndex(sessions_dir)
+                self._home_indexes[sessions_dir] = index
+            return index
+
+    def _pane_rollout(self, pane_id: str, rollout_path: Path) -> Path:
+        homes = self.codex_homes
+        if homes is None or not rollout_path.name:
+            return rollout_path
+        staged = homes.staged_path(pane_id, rollout_path)
+        return staged if staged.is_file() else rollout_path
 
     def _wait_for_session_meta(self, rollout_path: Path, *, timeout_seconds: float = 1.0) -> Optional[str]:
         deadline = time.time() + timeout_seconds
-        while time.time() < deadline:
-            ident = self._extract_session_meta(rollout_path)
-            if ident:
-                return ident
-            time.sleep(min(self.poll_interval, 0.1))
+        with self._watcher.watching(files=[rollout_path]) as scope:
+            while time.time() < deadline:
+                token = scope.token()
+                ident = self._extract_session_meta(rollout_path)
+                if ident:
+                    return ident
+                scope.wait(token, deadline - time.time())
         return None
 
     def _parse_session_meta(self, rollout_path: Path) -> str:
@@ -592,7 +821,43 @@ class CodexMonitor:
             return resolved
         return session_id or self._parse_session_meta(rollout_path)
 
+    def _match_worker_pane(
+        self,
+        rollout_path: Path,
+        worker_panes: Sequence[str],
+        assigned: Mapping[str, str],
+        pane_paths: Optional[Mapping[str, Path]],
+    ) -> Optional[str]:
+        """rollout を割り当てるペインを返す。cwd がどのワーカーとも一致しなければ None (無関係な rollout)."""
+        pending = [pane_id for pane_id in worker_panes if pane_id not in assigned]
+        if pane_paths:
+            # 並列フォーク時は rollout の生成順が前後するため、session_meta の cwd でペインを特定する
+            cwd = (self._read_session_meta(rollout_path) or {}).get("cwd")
+            if cwd:
+                resolved = self._resolve_path(cwd)
+                for pane_id in pending:
+                    worker_path = pane_paths.get(pane_id)
+                    if worker_path is not None and self._resolve_path(worker_path) == resolved:
+                        return pane_id
+                # 他のセッションや手動起動の Codex が同時に rollout を作った場合は取り違えないよう待ち続ける
+                return None
+        return pending[0]
+
+    @staticmethod
+    def _resolve_path(path: Union[str, Path]) -> Path:
+        try:
+            return Path(path).expanduser().resolve()
+        except OSError:
+            return Path(path)
+
     def _extract_session_meta(self, rollout_path: Path) -> Optional[str]:
+        payload = self._read_session_meta(rollout_path)
+        if payload is None:
+            return None
+        ident = payload.get("id")
+        return str(ident) if ident else None
+
+    def _read_session_meta(self, rollout_path: Path) -> Optional[Dict[str, Any]]:
         try:
             with rollout_path.open("r", encoding="utf-8") as fh:
                 for line in fh:
@@ -600,22 +865,40 @@ class CodexMonitor:
                         obj = json.loads(line)
                     except json.JSONDecodeError:
                         continue
-                    if obj.get("type") == "session_meta" and "payload" in obj:
-                        ident = obj["payload"].get("id")
-                        if ident:
-                            return str(ident)
+                    if obj.get("type") == "session_meta" and isinstance(obj.get("payload"), dict):
+                        payload = obj["payload"]
+                        if payload.get("id"):
+                            return payload
         except FileNotFoundError:
             pass
         return None
 
-    def _load_map(self) -> Dict[str, Any]:
-        text = self.session_map_path.read_text(encoding="utf-8")
+    def _read_map_file(self) -> tuple[Dict[str, Any], bool]:
+        try:
+            text = self.session_map_path.read_text(encoding="utf-8")
+        except OSError:
+            return {}, False
         if not text.strip():
-            return {}
-        return yaml.safe_load(text) or {}
+            return {}, False
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            # 旧形式 (YAML) の対応表は読み込み後に JSON へ書き換える
+            try:
+                data = yaml.safe_load(text)
+            except yaml.YAMLError:
+                return {}, True
+            return (data if isinstance(data, dict) else {}), True
+        return (data if isinstance(data, dict) else {}), False
+
+    def _load_map(self) -> Dict[str, Any]:
+        return self._map
 
     def _write_map(self, data: Mapping[str, Any]) -> None:
-        self.session_map_path.write_text(yaml.safe_dump(dict(data), sort_keys=True), encoding="utf-8")
+        with self._map_lock:
+            self._map = dict(data)
+            self._map_dirty = True
+            self.flush()
 
     def _contains_done(
         self,
@@ -626,52 +909,44 @@ class CodexMonitor:
     ) -> tuple[bool, int]:
         if not rollout_path.exists():
             return False, offset
-        try:
-            with rollout_path.open("rb") as fh:
-                fh.seek(offset)
-                chunk = fh.read()
-                new_offset = fh.tell()
-        except OSError:
-            return False, offset
-
-        if not chunk:
-            return False, new_offset
-
-        done_detected = False
-        for line in chunk.decode("utf-8", errors="ignore").splitlines():
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            if obj.get("type") != "response_item":
-                continue
-
-            payload = obj.get("payload", {})
-            if payload.get("role") != "assistant":
-                continue
-
-            for block in payload.get("content", []):
-                block_type = block.get("type")
-                if block_type in {"output_text", "text"}:
-                    text = block.get("text", "")
-                    lines = [segment.strip() for segment in text.splitlines() if segment.strip()]
-                    if any(segment == "/done" for segment in lines):
-                        done_detected = True
-                        break
-            if done_detected:
-                break
-
-        return done_detected, new_offset
+        reader = self._reader_for(session_id, rollout_path)
+        reader.read()
+        return reader.done_since(offset), max(offset, reader.offset)
+
+    def _reader_for(self, session_id: str, rollout_path: Path) -> RolloutReader:
+        with self._map_lock:
+            reader = self._readers.get(session_id)
+            if reader is None or reader.path != rollout_path:
+                if reader is not None:
+                    reader.close()
+                # 登録時点より前はフォーク元の履歴なので読み飛ばし、必要なら末尾側から逆引きする
+                entry = self._map.get("sessions", {}).get(session_id) or {}
+                reader = RolloutReader(rollout_path, offset=int(entry.get("offset", 0)))
+                self._readers[session_id] = reader
+            return reader
 
     def _update_session_offset(self, session_id: str, new_offset: int) -> None:
-        data = self._load_map()
-        sessions = data.get("sessions", {})
-        panes = data.get("panes", {})
-        session_entry = sessions.get(session_id)
-        if session_entry is not None:
+        with self._map_lock:
+            sessions = self._map.get("sessions", {})
+            panes = self._map.get("panes", {})
+            session_entry = sessions.get(session_id)
+            if session_entry is None:
+                return
             session_entry["offset"] = int(new_offset)
             pane_id = session_entry.get("pane_id")
             if pane_id and pane_id in panes:
                 panes[pane_id]["offset"] = int(new_offset)
-            self._write_map(data)
+            self._map_dirty = True
+            self._flush_if_due()
+
+    def _flush_if_due(self) -> Optional[float]:
+        """書き出し間隔を過ぎていれば対応表を書き出し、未書き出しが残る場合は次の期限までの秒数を返す."""
+        with self._map_lock:
+            if not self._map_dirty:
+                return None
+            remaining = self.flush_interval - (time.monotonic() - self._last_flush)
+            if remaining > 0:
+                return remaining
+            self.flush()
+            # 書き出しに失敗した場合は次の間隔で再試行する
+            return max(self.flush_interval, self.poll_interval) if self._map_dirty else None
@@ -0,0 +1,221 @@
+"""ファイルシステムの変更通知を待ち受けるサービス."""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Set, Union
+
+try:  # watchfiles は依存パッケージだが、欠落環境ではポーリングで動作させる
+    import watchfiles
+except ImportError:  # pragma: no cover - 依存欠落時のフォールバック
+    watchfiles = None  # type: ignore[assignment]
+
+PathLike = Union[str, Path]
+
+_LIVE_WATCHERS: "weakref.WeakSet[FileWatcher]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_watchers() -> None:
+    # watchfiles のスレッドがインタプリタ終了時に強制終了されると abort するため、先に停止させる
+    for watcher in list(_LIVE_WATCHERS):
+        watcher.close()
+
+
+class WatchScope:
+    """FileWatcher.watching() が返す待機ハンドル."""
+
+    def __init__(self, watcher: "FileWatcher", *, event_driven: bool) -> None:
+        self._watcher = watcher
+        self._event_driven = event_driven
+
+    @property
+    def event_driven(self) -> bool:
+        return self._event_driven and self._watcher.active
+
+    def token(self) -> int:
+        return self._watcher.sequence
+
+    def wait(self, token: int, timeout: Optional[float] = None) -> bool:
+        """token 取得後に変更通知があれば True を返す。通知が使えない場合はポーリング間隔だけ待機する."""
+        if timeout is not None and timeout <= 0:
+            return False
+        if not self.event_driven:
+            delay = self._watcher.poll_interval
+            if timeout is not None:
+                delay = min(delay, timeout)
+            time.sleep(delay)
+            return False
+        limit = self._watcher.heartbeat
+        if timeout is not None:
+            limit = min(limit, timeout)
+        return self._watcher._wait_for_change(token, limit)
+
+
+class FileWatcher:
+    """inotify 等の OS 通知 (watchfiles) でディレクトリ変更を待ち受け、利用できない場合はポーリングへ切り替える."""
+
+    def __init__(
+        self,
+        *,
+        poll_interval: float = 0.05,
+        heartbeat: float = 1.0,
+        force_polling: bool = False,
+    ) -> None:
+        self.poll_interval = poll_interval
+        # 通知の取りこぼしに備え、イベント駆動時も heartbeat 間隔で呼び出し元に再確認させる
+        self.heartbeat = max(heartbeat, poll_interval)
+        self._force_polling = force_polling or watchfiles is None
+        self._cond = threading.Condition()
+        self._sequence = 0
+        self._refs: Dict[Path, int] = {}
+        self._stop_event: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        self._failed = False
+        _LIVE_WATCHERS.add(self)
+
+    @property
+    def active(self) -> bool:
+        with self._cond:
+            return self._thread is not None and not self._failed
+
+    @property
+    def sequence(self) -> int:
+        with self._cond:
+            return self._sequence
+
+    @contextmanager
+    def watching(
+        self,
+        *,
+        files: Iterable[PathLike] = (),
+        dirs: Iterable[PathLike] = (),
+    ) -> Iterator[WatchScope]:
+        """files は親ディレクトリを、dirs はディレクトリ自体を監視対象に加える."""
+        targets, complete = self._resolve_targets(files, dirs)
+        self._acquire(targets)
+        try:
+            yield WatchScope(self, event_driven=complete and bool(targets) and not self._force_polling)
+        finally:
+            self._release(targets)
+
+    def notify(self) -> None:
+        with self._cond:
+            self._sequence += 1
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        with self._cond:
+            self._refs.clear()
+            stopped = self._restart_locked()
+        self._join(stopped)
+
+    # 内部ユーティリティ  -------------------------------------------------
+    def _wait_for_change(self, token: int, timeout: float) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self._sequence != token, timeout=timeout)
+
+    @staticmethod
+    def _resolve_targets(files: Iterable[PathLike], dirs: Iterable[PathLike]) -> tuple[Set[Path], bool]:
+        targets: Set[Path] = set()
+        complete = True
+        for raw in files:
+            parent = Path(raw).parent
+            if parent.is_dir():
+                targets.add(parent)
+            else:
+                complete = False
+        for raw in dirs:
+            path = Path(raw)
+            if path.is_dir():
+                targets.add(path)
+            else:
+                complete = False
+        return targets, complete
+
+    def _acquire(self, targets: Set[Path]) -> None:
+        if not targets or self._force_polling:
+            return
+        with self._cond:
+            before = set(self._refs)
+            for path in targets:
+                self._refs[path] = self._refs.get(path, 0) + 1
+            if set(self._refs) == before:
+                return
+            stopped = self._restart_locked()
+        self._join(stopped)
+
+    def _release(self, targets: Set[Path]) -> None:
+        if not targets or self._force_polling:
+            return
+        with self._cond:
+            before = set(self._refs)
+            for path in targets:
+                count = self._refs.get(path, 0) - 1
+                if count > 0:
+                    self._refs[path] = count
+                else:
+                    self._refs.pop(path, None)
+            if set(self._refs) == before:
+                return
+            stopped = self._restart_locked()
+        self._join(stopped)
+
+    def _restart_locked(self) -> Optional[threading.Thread]:
+        stopped = self._thread
+        if self._stop_event is not None:
+            self._stop_event.set()
+        self._stop_event = None
+        self._thread = None
+        self._failed = False
+        roots = self._minimal_roots(path for path in self._refs if path.is_dir())
+        if not roots:
+            return stopped
+        stop_event = threading.Event()
+        thread = threading.Thread(
+            target=self._run,
+            args=(roots, stop_event),
+            name="sibyl-file-watcher",
+            daemon=True,
+        )
+        self._stop_event = stop_event
+        self._thread = thread
+        thread.start()
+        return stopped
+
+    @staticmethod
+    def _join(thread: Optional[threading.Thread]) -> None:
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    @staticmethod
+    def _minimal_roots(paths: Iterable[Path]) -> list[Path]:
+        roots: list[Path] = []
+        for path in sorted(set(paths), key=lambda p: len(p.parts)):
+            if any(path == root or root in path.parents for root in roots):
+                continue
+            roots.append(path)
+        return roots
+
+    def _run(self, roots: list[Path], stop_event: threading.Event) -> None:
+        try:
+            for _changes in watchfiles.watch(
+                *roots,
+                watch_filter=None,
+                debounce=50,
+                step=5,
+                stop_event=stop_event,
+                raise_interrupt=False,
+            ):
+                self.notify()
+        except Exception:  # noqa: BLE001 - 監視上限超過などはポーリングで継続する
+            with self._cond:
+                if self._stop_event is stop_event:
+                    self._failed = True
+                self._sequence += 1
+                self._cond.notify_all()
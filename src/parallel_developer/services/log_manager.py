@@ -14,6 +14,9 @@ class LogManager:
     """各サイクルのメタデータを YAML/JSONL として永続化する."""
 
     def __init__(self, logs_dir: Path) -> None:
+        self.set_logs_dir(logs_dir)
+
+    def set_logs_dir(self, logs_dir: Path) -> None:
         self.logs_dir = Path(logs_dir)
         self.logs_dir.mkdir(parents=True, exist_ok=True)
         self.cycles_dir = self.logs_dir / "cycles"
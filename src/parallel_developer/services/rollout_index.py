@@ -0,0 +1,163 @@
+"""Codex sessions ディレクトリの rollout を差分で索引するサービス."""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+
+@dataclass(slots=True)
+class _DirState:
+    mtime_ns: int
+    subdirs: Tuple[Path, ...] = ()
+    files: FrozenSet[Path] = field(default_factory=frozenset)
+
+
+class RolloutIndex:
+    """sessions/YYYY/MM/DD 構成を前提に、当日・前日の経路と直近に変化したディレクトリだけを確認する.
+
+    過去の日付階層は full_rescan_interval ごとの全体走査でのみ stat する。
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        pattern: str = "rollout-*.jsonl",
+        recent_window: float = 2.0,
+        full_rescan_interval: float = 60.0,
+    ) -> None:
+        self.root = Path(root)
+        self.pattern = pattern
+        # mtime の分解能が粗いファイルシステムでも取りこぼさないよう、直近に更新されたディレクトリは毎回読む
+        self.recent_window = recent_window
+        self.full_rescan_interval = full_rescan_interval
+        self._dirs: Dict[Path, _DirState] = {}
+        self._files: Dict[Path, float] = {}
+        self._recent: Set[Path] = set()
+        self._last_full = 0.0
+        # Boss の事前 fork スレッドとメインスレッドが同時に refresh するため索引の更新を直列化する
+        self._lock = threading.Lock()
+
+    def refresh(self) -> Dict[Path, float]:
+        """索引を更新し、既知の rollout パスと mtime の対応をコピーで返す."""
+        with self._lock:
+            self._update()
+            return dict(self._files)
+
+    def snapshot(self) -> Dict[Path, float]:
+        return self.refresh()
+
+    # 内部ユーティリティ  -------------------------------------------------
+    def _update(self) -> None:
+        if not self.root.is_dir():
+            self._dirs.clear()
+            self._files.clear()
+            self._recent.clear()
+            return
+        hot = self._hot_partitions()
+        now = time.time()
+        full = not self._dirs or time.monotonic() - self._last_full >= self.full_rescan_interval
+        if full:
+            self._last_full = time.monotonic()
+            stack: List[Path] = [self.root]
+        else:
+            stack = self._watch_targets(hot)
+        visited: Set[Path] = set()
+        while stack:
+            directory = stack.pop()
+            if directory in visited:
+                continue
+            visited.add(directory)
+            try:
+                stat = os.stat(directory)
+            except OSError:
+                self._forget(directory)
+                continue
+            recent = now - stat.st_mtime <= self.recent_window
+            if recent:
+                self._recent.add(directory)
+            else:
+                self._recent.discard(directory)
+            state = self._dirs.get(directory)
+            if state is None or state.mtime_ns != stat.st_mtime_ns or directory in hot or recent:
+                # 書き込み中の rollout の mtime も追従させるため、当日分と直近の変化があった階層はファイルも stat し直す
+                state = self._rescan(directory, state, stat.st_mtime_ns, refresh_mtimes=directory in hot or recent)
+            if full:
+                stack.extend(state.subdirs)
+            else:
+                # 差分確認では新しく現れた階層だけを辿る
+                stack.extend(child for child in state.subdirs if child not in self._dirs)
+
+    def _watch_targets(self, hot: Set[Path]) -> List[Path]:
+        targets: Set[Path] = {self.root}
+        for partition in hot:
+            targets.update((partition.parent.parent, partition.parent, partition))
+        targets.update(self._recent)
+        # 親から順に確認し、新しい子階層を同じ refresh 内で辿れるようにする
+        return sorted(targets, key=lambda path: len(path.parts), reverse=True)
+
+    def _hot_partitions(self) -> Set[Path]:
+        now = datetime.now(timezone.utc)
+        partitions: Set[Path] = set()
+        for moment in (now, now.astimezone()):
+            for delta in (0, 1):
+                day = moment - timedelta(days=delta)
+                partitions.add(self.root / f"{day.year:04d}" / f"{day.month:02d}" / f"{day.day:02d}")
+        return partitions
+
+    def _rescan(
+        self,
+        directory: Path,
+        previous: Optional[_DirState],
+        mtime_ns: int,
+        *,
+        refresh_mtimes: bool = False,
+    ) -> _DirState:
+        subdirs: List[Path] = []
+        files: Set[Path] = set()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(Path(entry.path))
+                        elif fnmatch.fnmatchcase(entry.name, self.pattern):
+                            files.add(Path(entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            self._forget(directory)
+            return _DirState(mtime_ns=mtime_ns)
+
+        if previous is not None:
+            for stale in previous.files - files:
+                self._files.pop(stale, None)
+            for removed in set(previous.subdirs) - set(subdirs):
+                self._forget(removed)
+        for path in list(files):
+            if path in self._files and not refresh_mtimes:
+                continue
+            try:
+                self._files[path] = path.stat().st_mtime
+            except OSError:
+                files.discard(path)
+        state = _DirState(mtime_ns=mtime_ns, subdirs=tuple(subdirs), files=frozenset(files))
+        self._dirs[directory] = state
+        return state
+
+    def _forget(self, directory: Path) -> None:
+        self._recent.discard(directory)
+        state = self._dirs.pop(directory, None)
+        if state is None:
+            return
+        for path in state.files:
+            self._files.pop(path, None)
+        for child in state.subdirs:
+            self._forget(child)
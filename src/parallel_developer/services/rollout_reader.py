@@ -0,0 +1,206 @@
+"""Codex rollout JSONL を差分で読み取るリーダー."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, List, Mapping, Optional, Union
+
+_ASSISTANT_MARKER = b'"assistant"'
+_SESSION_META_MARKER = b'"session_meta"'
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+
+@dataclass(slots=True)
+class SessionMetaEvent:
+    offset: int
+    end_offset: int
+    session_id: str
+
+
+@dataclass(slots=True)
+class AssistantMessageEvent:
+    offset: int
+    end_offset: int
+    text: str
+    done: bool
+
+
+RolloutEvent = Union[SessionMetaEvent, AssistantMessageEvent]
+
+
+class RolloutReader:
+    """rollout をファイルハンドルを保持したまま追記分だけ解析し、書き込み途中の末尾行はバッファに残す."""
+
+    def __init__(self, path: Path, *, offset: int = 0) -> None:
+        self.path = Path(path)
+        self._start = max(int(offset), 0)
+        self._fh: Optional[BinaryIO] = None
+        self._position = self._start
+        self._pending = b""
+        self.session_id: Optional[str] = None
+        self.last_done: Optional[AssistantMessageEvent] = None
+        self._last_assistant: Optional[AssistantMessageEvent] = None
+        self._tail_seeded = self._start == 0
+
+    @property
+    def last_assistant(self) -> Optional[AssistantMessageEvent]:
+        """最新の assistant 応答。開始位置より前は必要になった時点で末尾から逆方向に探索する."""
+        if self._last_assistant is None and not self._tail_seeded:
+            self._tail_seeded = True
+            self._last_assistant = self._seek_last_assistant(self._start)
+        return self._last_assistant
+
+    @property
+    def offset(self) -> int:
+        """解析済みの完全な行の終端位置."""
+        return self._position
+
+    def read(self) -> List[RolloutEvent]:
+        fh = self._open()
+        if fh is None:
+            return []
+        try:
+            if os.fstat(fh.fileno()).st_size < self._position + len(self._pending):
+                self._rewind(fh)
+            chunk = fh.read()
+        except OSError:
+            return []
+        if not chunk:
+            return []
+        data = self._pending + chunk
+        cut = data.rfind(b"\n") + 1
+        self._pending = data[cut:]
+        events: List[RolloutEvent] = []
+        start = self._position
+        for line in data[:cut].splitlines(keepends=True):
+            end = start + len(line)
+            event = self._parse_line(line, start, end)
+            if event is not None:
+                events.append(event)
+            start = end
+        self._position = start
+        return events
+
+    def close(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except OSError:
+                pass
+            self._fh = None
+
+    def done_since(self, offset: int) -> bool:
+        """offset 以降に書き込まれた assistant 応答に /done が含まれていれば True."""
+        return self.last_done is not None and self.last_done.end_offset > offset
+
+    # 内部ユーティリティ  -------------------------------------------------
+    def _open(self) -> Optional[BinaryIO]:
+        if self._fh is None:
+            try:
+                self._fh = self.path.open("rb")
+                self._fh.seek(self._position)
+            except OSError:
+                self._fh = None
+        return self._fh
+
+    def _rewind(self, fh: BinaryIO) -> None:
+        fh.seek(0)
+        self._position = 0
+        self._pending = b""
+        self._last_assistant = None
+        self._tail_seeded = True
+        self.last_done = None
+
+    def _parse_line(self, line: bytes, start: int, end: int) -> Optional[RolloutEvent]:
+        if _ASSISTANT_MARKER not in line and _SESSION_META_MARKER not in line:
+            return None
+        try:
+            obj = json.loads(line.decode("utf-8", errors="ignore"))
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(obj, dict):
+            return None
+        payload = obj.get("payload")
+        if not isinstance(payload, dict):
+            return None
+        kind = obj.get("type")
+        if kind == "session_meta":
+            ident = payload.get("id")
+            if not ident:
+                return None
+            self.session_id = str(ident)
+            return SessionMetaEvent(offset=start, end_offset=end, session_id=str(ident))
+        if kind != "response_item" or payload.get("role") != "assistant":
+            return None
+        event = self._assistant_event(payload, start, end)
+        if event is not None:
+            self._last_assistant = event
+            if event.done:
+                self.last_done = event
+        return event
+
+    def _seek_last_assistant(self, end: int) -> Optional[AssistantMessageEvent]:
+        try:
+            fh = self.path.open("rb")
+        except OSError:
+            return None
+        with fh:
+            position = end
+            tail = b""
+            while position > 0:
+                size = min(_TAIL_BLOCK_SIZE, position)
+                position -= size
+                fh.seek(position)
+                block = fh.read(size) + tail
+                lines = block.split(b"\n")
+                # 先頭要素は前のブロックにまたがる可能性があるため次の周回へ持ち越す
+                tail = lines[0] if position > 0 else b""
+                complete = lines[1:] if position > 0 else lines
+                line_end = position + len(block)
+                for line in reversed(complete):
+                    line_start = line_end - len(line)
+                    if _ASSISTANT_MARKER in line:
+                        event = self._decode_assistant(line, line_start, line_end)
+                        if event is not None:
+                            return event
+                    line_end = line_start - 1
+        return None
+
+    def _decode_assistant(self, line: bytes, start: int, end: int) -> Optional[AssistantMessageEvent]:
+        try:
+            obj = json.loads(line.decode("utf-8", errors="ignore"))
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(obj, dict) or obj.get("type") != "response_item":
+            return None
+        payload = obj.get("payload")
+        if not isinstance(payload, dict) or payload.get("role") != "assistant":
+            return None
+        return self._assistant_event(payload, start, end)
+
+    @staticmethod
+    def _assistant_event(payload: Mapping[str, Any], start: int, end: int) -> Optional[AssistantMessageEvent]:
+        texts: List[str] = []
+        done = False
+        for block in payload.get("content", []) or []:
+            if not isinstance(block, dict):
+                continue
+            block_type = block.get("type")
+            if block_type in {"output_text", "text"}:
+                text = block.get("text", "")
+                texts.append(text)
+                if any(segment.strip() == "/done" for segment in text.splitlines()):
+                    done = True
+            elif block_type == "output_markdown":
+                texts.append(block.get("markdown", ""))
+            elif block_type == "output_json":
+                data = block.get("json")
+                if data is not None:
+                    texts.append(json.dumps(data))
+        if not texts:
+            return None
+        text = "\n".join(part for part in texts if part).strip()
+        return AssistantMessageEvent(offset=start, end_offset=end, text=text, done=done)
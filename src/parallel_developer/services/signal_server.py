@@ -0,0 +1,115 @@
+"""完了通知を Unix ドメインソケットで受け取るサービス."""
+
+from __future__ import annotations
+
+import os
+import socket
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+# sockaddr_un の sun_path は 108 バイト (macOS は 104) までのため、余裕を見て超える場合は一時ディレクトリへ置く
+_MAX_SOCKET_PATH = 100
+
+
+class SignalServer:
+    """サイクル単位の AF_UNIX データグラムソケットでフラグパスを受け取り、フラグを作成して待機側を即座に起こす.
+
+    フラグファイルは従来どおり完了判定の正本として残すため、touch による通知もそのまま使える。
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        *,
+        flags: Iterable[Path],
+        on_signal: Optional[Callable[[Path], None]] = None,
+    ) -> None:
+        self.socket_path = self._usable_path(Path(socket_path))
+        self.on_signal = on_signal
+        self._flags = {Path(flag) for flag in flags}
+        self._sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closing = threading.Event()
+
+    @property
+    def active(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        if self._sock is not None:
+            return True
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            self._unlink()
+            sock.bind(str(self.socket_path))
+            os.chmod(self.socket_path, 0o600)
+        except OSError:
+            sock.close()
+            return False
+        self._sock = sock
+        self._closing.clear()
+        self._thread = threading.Thread(target=self._serve, args=(sock,), name="sibyl-signal-server", daemon=True)
+        self._thread.start()
+        return True
+
+    def close(self) -> None:
+        sock = self._sock
+        if sock is None:
+            return
+        self._closing.set()
+        # 受信待ちの recv を起こすため自分宛てに空のデータグラムを送る
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as waker:
+                waker.sendto(b"", str(self.socket_path))
+        except OSError:
+            pass
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        sock.close()
+        self._sock = None
+        self._thread = None
+        self._unlink()
+
+    # 内部ユーティリティ  -------------------------------------------------
+    def _serve(self, sock: socket.socket) -> None:
+        while not self._closing.is_set():
+            try:
+                payload = sock.recv(4096)
+            except OSError:
+                return
+            if payload:
+                self._handle(payload)
+
+    def _handle(self, payload: bytes) -> None:
+        flag = Path(payload.decode("utf-8", errors="ignore").strip())
+        # 他サイクルや任意パスへの書き込みを防ぐため、このサイクルのフラグ以外は無視する
+        if flag not in self._flags:
+            return
+        try:
+            flag.touch()
+        except OSError:
+            return
+        if self.on_signal is not None:
+            try:
+                self.on_signal(flag)
+            except Exception:  # noqa: BLE001 - 通知側の失敗で受信を止めない
+                pass
+
+    def _unlink(self) -> None:
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            pass
+
+    @staticmethod
+    def _usable_path(path: Path) -> Path:
+        if len(os.fsencode(str(path))) <= _MAX_SOCKET_PATH:
+            return path
+        return Path(tempfile.gettempdir()) / f"sibyl-{uuid.uuid4().hex[:12]}.sock"
@@ -0,0 +1,249 @@
+"""tmux コントロールモード (tmux -C) で常駐接続するクライアント."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import threading
+from collections import Counter, deque
+from typing import Callable, Deque, Iterable, List, Optional, Sequence
+
+NotificationListener = Callable[[str, str], None]
+
+_ACTIVE_SESSIONS: Counter[str] = Counter()
+_ACTIVE_LOCK = threading.Lock()
+
+
+def control_client_count(session_name: str) -> int:
+    """このプロセスが session_name に接続しているコントロールモードクライアント数."""
+    with _ACTIVE_LOCK:
+        return _ACTIVE_SESSIONS[session_name]
+
+
+class TmuxControlError(RuntimeError):
+    """コントロールモードでのコマンド実行が %error を返した場合の例外."""
+
+
+class _PendingCommand:
+    __slots__ = ("event", "lines", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.lines: List[str] = []
+        self.error = False
+
+
+class TmuxControlClient:
+    """1 本の tmux -C 接続でコマンドを多重化し、%layout-change 等の通知を配信する."""
+
+    def __init__(
+        self,
+        session_name: str,
+        *,
+        tmux_bin: str = "tmux",
+        receive_output: bool = False,
+        command_timeout: float = 10.0,
+    ) -> None:
+        self.session_name = session_name
+        self.tmux_bin = tmux_bin
+        self.receive_output = receive_output
+        self.command_timeout = command_timeout
+        self._proc: Optional[subprocess.Popen] = None
+        self._reader: Optional[threading.Thread] = None
+        self._write_lock = threading.Lock()
+        self._pending: Deque[_PendingCommand] = deque()
+        self._listeners: List[NotificationListener] = []
+        self._registered = False
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self) -> bool:
+        if self.alive:
+            return True
+        if shutil.which(self.tmux_bin) is None:
+            return False
+        try:
+            self._proc = subprocess.Popen(
+                [self.tmux_bin, "-C", "attach-session", "-t", self.session_name],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+        except OSError:
+            self._proc = None
+            return False
+        self._pending.clear()
+        self._reader = threading.Thread(target=self._read_loop, name="sibyl-tmux-control", daemon=True)
+        self._reader.start()
+        with _ACTIVE_LOCK:
+            _ACTIVE_SESSIONS[self.session_name] += 1
+        self._registered = True
+        try:
+            if not self.receive_output:
+                # ペイン出力の通知は量が多いため不要なら止める (tmux 3.2 未満では無視される)
+                self.command("refresh-client", "-f", "no-output", check=False)
+            else:
+                self.command("display-message", "-p", "ok")
+        except (TmuxControlError, TimeoutError):
+            self.close()
+            return False
+        return self.alive
+
+    def add_listener(self, listener: NotificationListener) -> None:
+        self._listeners.append(listener)
+
+    def command(self, *args: str, check: bool = True, timeout: Optional[float] = None) -> List[str]:
+        """コマンドを送信して応答行を返す."""
+        return self.pipeline([args], check=check, timeout=timeout)[0]
+
+    def pipeline(
+        self,
+        commands: Iterable[Sequence[str]],
+        *,
+        check: bool = True,
+        timeout: Optional[float] = None,
+    ) -> List[List[str]]:
+        """複数コマンドを応答を待たずに連続送信し、最後にまとめて応答を回収する."""
+        pending = self.submit(commands)
+        limit = self.command_timeout if timeout is None else timeout
+        results: List[List[str]] = []
+        for entry in pending:
+            if not entry.event.wait(limit):
+                raise TimeoutError("tmux control command timed out")
+            if entry.error and check:
+                raise TmuxControlError("\n".join(entry.lines) or "tmux command failed")
+            results.append(entry.lines)
+        return results
+
+    def submit(self, commands: Iterable[Sequence[str]]) -> List[_PendingCommand]:
+        payload = b"".join(self.format_command(args).encode("utf-8") + b"\n" for args in commands)
+        if not payload:
+            return []
+        count = payload.count(b"\n")
+        entries = [_PendingCommand() for _ in range(count)]
+        with self._write_lock:
+            proc = self._proc
+            if proc is None or proc.poll() is not None or proc.stdin is None:
+                raise TmuxControlError("tmux control client is not running")
+            self._pending.extend(entries)
+            try:
+                proc.stdin.write(payload)
+            except (BrokenPipeError, OSError) as exc:
+                raise TmuxControlError("tmux control client is not running") from exc
+        return entries
+
+    def close(self) -> None:
+        proc = self._proc
+        self._proc = None
+        if proc is not None:
+            try:
+                if proc.stdin is not None:
+                    proc.stdin.close()
+            except OSError:
+                pass
+            try:
+                proc.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        if self._registered:
+            with _ACTIVE_LOCK:
+                _ACTIVE_SESSIONS[self.session_name] -= 1
+                if _ACTIVE_SESSIONS[self.session_name] <= 0:
+                    del _ACTIVE_SESSIONS[self.session_name]
+            self._registered = False
+        self._fail_pending()
+
+    @staticmethod
+    def format_command(args: Sequence[str]) -> str:
+        return " ".join(_quote(str(arg)) for arg in args)
+
+    # 内部ユーティリティ  -------------------------------------------------
+    def _read_loop(self) -> None:
+        proc = self._proc
+        if proc is None or proc.stdout is None:
+            return
+        current: Optional[_PendingCommand] = None
+        block: Optional[str] = None
+        for raw in proc.stdout:
+            line = raw.decode("utf-8", errors="replace").rstrip("\n")
+            if block is not None:
+                # ペイン内容に %end 行が含まれても誤認しないよう、%begin と同じ引数の行だけを終端とみなす
+                if line in (f"%end {block}", f"%error {block}"):
+                    if current is not None:
+                        current.error = line.startswith("%error ")
+                        current.event.set()
+                    current = None
+                    block = None
+                elif current is not None:
+                    current.lines.append(line)
+                continue
+            if line.startswith("%begin "):
+                block = line[len("%begin ") :]
+                # flags=1 はこのクライアントが送ったコマンドの応答、0 は attach 時の初期応答
+                if block.rsplit(" ", 1)[-1] == "1" and self._pending:
+                    current = self._pending.popleft()
+                continue
+            if line.startswith("%"):
+                name, _, rest = line[1:].partition(" ")
+                self._notify(name, rest)
+        self._fail_pending()
+
+    def _notify(self, name: str, rest: str) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(name, rest)
+            except Exception:  # noqa: BLE001 - 通知の失敗で読み取りを止めない
+                continue
+
+    def _fail_pending(self) -> None:
+        while self._pending:
+            entry = self._pending.popleft()
+            entry.error = True
+            entry.lines = entry.lines or ["tmux control client exited"]
+            entry.event.set()
+
+
+class ControlPane:
+    """libtmux の Pane と同じ呼び出し方でコントロールモード経由の操作を行うプロキシ."""
+
+    def __init__(self, client: TmuxControlClient, pane_id: str) -> None:
+        self._client = client
+        self.pane_id = pane_id
+
+    def send_keys(self, cmd: str, enter: bool = True) -> None:
+        args = ["send-keys", "-t", self.pane_id]
+        if cmd:
+            args.append(cmd)
+        if enter:
+            args.append("Enter")
+        if len(args) > 3:
+            self._client.command(*args)
+
+    def capture_pane(self) -> List[str]:
+        return self._client.command("capture-pane", "-p", "-t", self.pane_id)
+
+    def cmd(self, *args: str) -> List[str]:
+        return self._client.command(args[0], "-t", self.pane_id, *args[1:])
+
+
+def _quote(value: str) -> str:
+    """tmux のコマンドパーサ向けにクォートする (改行や制御文字は 8 進エスケープ)."""
+    if value and all(ch.isalnum() or ch in "%@:_-./=," for ch in value):
+        return value
+    prefix = ""
+    if value.startswith("~"):
+        # 先頭の ~ はダブルクォート内でもホームディレクトリに展開されるため単一引用符で囲む
+        prefix, value = "'~'", value[1:]
+    parts: List[str] = []
+    for ch in value:
+        code = ord(ch)
+        if ch in '"\\$':
+            parts.append("\\" + ch)
+        elif code < 0x20 or code == 0x7F:
+            parts.append(f"\\{code:03o}")
+        else:
+            parts.append(ch)
+    return prefix + '"' + "".join(parts) + '"'
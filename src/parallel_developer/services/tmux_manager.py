@@ -2,16 +2,41 @@
 
 from __future__ import annotations
 
+import os
 import shlex
+import tempfile
+import threading
 import time
+import uuid
 from pathlib import Path
 from typing import Any, Iterable, Mapping, Optional, Sequence, TYPE_CHECKING, List
 
 import libtmux
 
+from .tmux_control import ControlPane, TmuxControlClient, TmuxControlError
+
 if TYPE_CHECKING:  # pragma: no cover - 型チェック専用
+    from .codex_home import CodexHomeManager
     from .codex_monitor import CodexMonitor
 
+DEFAULT_READY_PATTERNS: tuple[str, ...] = ("⏎ send", "? for shortcuts", "Ask Codex")
+_PASTE_START = "\x1b[200~"
+_PASTE_END = "\x1b[201~"
+_LAYOUT_NOTIFICATIONS = frozenset(
+    {"layout-change", "window-add", "window-close", "unlinked-window-close", "sessions-changed", "session-changed"}
+)
+
+
+_STALE_HANDLE_MARKERS: tuple[str, ...] = ("can't find pane", "tmux control client is not running")
+
+
+def _is_stale_handle_error(exc: BaseException) -> bool:
+    """ペインが見つからない・接続が切れていて送信前に失敗したなど、ハンドルの取り直しで解決するエラーか."""
+    if isinstance(exc, TimeoutError):
+        return False
+    message = str(exc)
+    return any(marker in message for marker in _STALE_HANDLE_MARKERS)
+
 
 class TmuxLayoutManager:
     """Parallel Codex 用の tmux セッションを構成・制御する."""
@@ -27,9 +52,19 @@ class TmuxLayoutManager:
         backtrack_delay: float = 0.05,
         reuse_existing_session: bool = False,
         session_namespace: Optional[str] = None,
+        concurrent_fork: bool = True,
+        ready_patterns: Sequence[str] = DEFAULT_READY_PATTERNS,
+        ready_timeout: float = 10.0,
+        key_timeout: float = 0.5,
+        ready_poll_interval: float = 0.05,
+        ready_settle: float = 0.5,
+        control_mode: bool = False,
+        boss_count: int = 1,
+        codex_homes: Optional["CodexHomeManager"] = None,
     ) -> None:
         self.session_name = session_name
         self.worker_count = worker_count
+        self.boss_count = max(1, int(boss_count))
         self.monitor = monitor
         self.root_path = Path(root_path)
         self.boss_path = self.root_path
@@ -37,6 +72,22 @@ class TmuxLayoutManager:
         self.backtrack_delay = backtrack_delay
         self.reuse_existing_session = reuse_existing_session
         self.session_namespace = session_namespace
+        self.concurrent_fork = concurrent_fork
+        self.ready_patterns = tuple(ready_patterns)
+        self.ready_timeout = ready_timeout
+        self.key_timeout = key_timeout
+        self.ready_poll_interval = ready_poll_interval
+        self.ready_settle = ready_settle
+        self.control_mode = control_mode
+        self.codex_homes = codex_homes
+        self._control: Optional[TmuxControlClient] = None
+        self._control_failed = False
+        self._pane_cache: dict[str, Any] = {}
+        self._pane_generation = 0
+        # Boss の事前 fork スレッドからも呼ばれるため、接続の生成とハンドルキャッシュをそれぞれ保護する。
+        # 通知スレッドはキャッシュ破棄だけを行うので、接続待ちの間も _pane_lock は保持しない
+        self._control_lock = threading.Lock()
+        self._pane_lock = threading.Lock()
         self._server = libtmux.Server()
 
     def set_boss_path(self, path: Path) -> None:
@@ -50,9 +101,11 @@ class TmuxLayoutManager:
             raise ValueError("session_name/worker_count mismatch with manager configuration")
 
         session = self._get_or_create_session(fresh=not self.reuse_existing_session)
+        self._control_failed = False
+        self._invalidate_panes()
         window = getattr(session, "attached_window", None) or session.windows[0]
 
-        target_pane_count = self.worker_count + 2  # main + boss + workers
+        target_pane_count = self.worker_count + 1 + self.boss_count  # main + boss(es) + workers
         while len(window.panes) < target_pane_count:
             self._split_largest_pane(window)
             window.select_layout("tiled")
@@ -60,31 +113,48 @@ class TmuxLayoutManager:
         window.select_layout("tiled")
 
         panes = window.panes
+        # コントロールモードが使える場合はその接続経由のハンドルで揃え、libtmux の Pane と混在させない
+        control = self._control_client()
+        with self._pane_lock:
+            for pane in panes:
+                self._pane_cache[pane.pane_id] = ControlPane(control, pane.pane_id) if control is not None else pane
+        shard_start = 2 + self.worker_count
         layout = {
             "main": panes[0].pane_id,
             "boss": panes[1].pane_id,
-            "workers": [pane.pane_id for pane in panes[2 : 2 + self.worker_count]],
+            "workers": [pane.pane_id for pane in panes[2:shard_start]],
+            # 採点を分担する追加の Boss ペインは既存の並びを崩さないようワーカーの後ろに置く
+            "boss_shards": [pane.pane_id for pane in panes[shard_start : shard_start + self.boss_count - 1]],
         }
         self._apply_role_labels(session, layout)
         return layout
 
     def launch_main_session(self, *, pane_id: str) -> None:
-        codex = self._codex_command("codex")
+        codex = self._codex_command("codex", pane_id=pane_id)
         command = f"cd {shlex.quote(str(self.root_path))} && {codex}"
+        pane = self._get_pane(pane_id)
+        before = self._snapshot_panes([pane])
         self._send_command(pane_id, command)
-        self._maybe_wait()
+        self._maybe_wait([pane], before)
 
     def resume_session(self, *, pane_id: str, workdir: Path, session_id: str) -> None:
-        codex = self._codex_command(f"codex resume {shlex.quote(str(session_id))}")
+        codex = self._codex_command(f"codex resume {shlex.quote(str(session_id))}", pane_id=pane_id, session_id=session_id)
         command = f"cd {shlex.quote(str(workdir))} && {codex}"
+        pane = self._get_pane(pane_id)
+        before = self._snapshot_panes([pane])
         self._send_command(pane_id, command)
-        self._maybe_wait()
+        self._maybe_wait([pane], before)
 
     def fork_boss(self, *, pane_id: str, base_session_id: str, boss_path: Path) -> None:
         self.interrupt_pane(pane_id=pane_id)
-        command = f"cd {shlex.quote(str(boss_path))} && {self._codex_command(f'codex resume {shlex.quote(str(base_session_id))}')}"
+        codex = self._codex_command(
+            f"codex resume {shlex.quote(str(base_session_id))}", pane_id=pane_id, session_id=base_session_id
+        )
+        command = f"cd {shlex.quote(str(boss_path))} && {codex}"
+        pane = self._get_pane(pane_id)
+        before = self._snapshot_panes([pane])
         self._send_command(pane_id, command)
-        self._maybe_wait()
+        self._wait_for_prompt([pane], before, fallback=self.startup_delay)
         self._send_prompt_reset(pane_id=pane_id)
         self._maybe_wait()
 
@@ -98,42 +168,156 @@ class TmuxLayoutManager:
         if not base_session_id:
             raise RuntimeError("base_session_id が空です。メインセッションのIDが取得できていません。")
         worker_list = list(workers)
+        commands: dict[str, str] = {}
         for pane_id in worker_list:
             try:
                 worker_path = Path(pane_paths[pane_id])
             except KeyError as exc:
                 raise RuntimeError(f"pane {pane_id!r} に対応するワークツリーパスがありません") from exc
-            self.interrupt_pane(pane_id=pane_id)
-            command = f"cd {shlex.quote(str(worker_path))} && {self._codex_command(f'codex resume {shlex.quote(str(base_session_id))}')}"
-            self._send_command(pane_id, command)
-            time.sleep(max(0.5, self.backtrack_delay))
-            self._send_prompt_reset(pane_id=pane_id)
+            codex = self._codex_command(
+                f"codex resume {shlex.quote(str(base_session_id))}", pane_id=pane_id, session_id=base_session_id
+            )
+            commands[pane_id] = f"cd {shlex.quote(str(worker_path))} && {codex}"
+        if self.concurrent_fork:
+            self._fork_workers_concurrently(commands)
+        else:
+            for pane_id, command in commands.items():
+                self.interrupt_pane(pane_id=pane_id)
+                pane = self._get_pane(pane_id)
+                before = self._snapshot_panes([pane])
+                self._send_command(pane_id, command)
+                self._wait_for_prompt([pane], before, fallback=max(0.5, self.backtrack_delay))
+                self._send_prompt_reset(pane_id=pane_id)
         self._maybe_wait()
         return worker_list
 
+    def resume_workers(self, *, sessions: Mapping[str, str], pane_paths: Mapping[str, Path]) -> List[str]:
+        """複製済みのセッションを各ペインで一斉に resume する (分岐用の Esc 操作は不要)."""
+        commands: dict[str, str] = {}
+        for pane_id, session_id in sessions.items():
+            try:
+                worker_path = Path(pane_paths[pane_id])
+            except KeyError as exc:
+                raise RuntimeError(f"pane {pane_id!r} に対応するワークツリーパスがありません") from exc
+            codex = self._codex_command(f"codex resume {shlex.quote(str(session_id))}", pane_id=pane_id, session_id=session_id)
+            commands[pane_id] = f"cd {shlex.quote(str(worker_path))} && {codex}"
+        if commands:
+            self._fork_workers_concurrently(commands, reset_prompt=False)
+        self._maybe_wait()
+        return list(commands)
+
     def send_instruction_to_pane(self, *, pane_id: str, instruction: str) -> None:
-        self._send_text(pane_id, instruction)
+        self.send_instruction_to_panes(pane_ids=[pane_id], instruction=instruction)
+
+    def send_instruction_to_panes(
+        self,
+        *,
+        pane_ids: Sequence[str],
+        instruction: str,
+        headers: Optional[Mapping[str, str]] = None,
+        footers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """instruction 本体は tmux バッファへ一度だけ転送し、各ペインへ貼り付ける (前後の短い文面はペインごと)."""
+        headers = headers or {}
+        footers = footers or {}
+        if not pane_ids:
+            return
+        control = self._control_client()
+        buffer_name = self._load_buffer(control, instruction) if control is not None else None
+        if control is None or buffer_name is None:
+            for pane_id in pane_ids:
+                self._send_text(pane_id, f"{headers.get(pane_id, '')}{instruction}{footers.get(pane_id, '')}")
+            return
+        commands: List[List[str]] = []
+        for pane_id in pane_ids:
+            header = headers.get(pane_id, "").replace("\r\n", "\n")
+            footer = footers.get(pane_id, "").replace("\r\n", "\n")
+            commands.append(["send-keys", "-t", pane_id, "-l", f"{_PASTE_START}{header}"])
+            # -r を付けないと改行が CR に置換され、Codex では行ごとに送信されてしまう
+            commands.append(["paste-buffer", "-r", "-b", buffer_name, "-t", pane_id])
+            commands.append(["send-keys", "-t", pane_id, "-l", f"{footer}{_PASTE_END}"])
+            commands.append(["send-keys", "-t", pane_id, "Enter"])
+        commands.append(["delete-buffer", "-b", buffer_name])
+        control.pipeline(commands)
 
     def prepare_for_instruction(self, *, pane_id: str) -> None:
         pane = self._get_pane(pane_id)
-        pane.send_keys("C-c", enter=False)
-        if self.backtrack_delay > 0:
-            time.sleep(self.backtrack_delay)
+        self._send_keys_and_wait([pane], "C-c", enter=False, fallback=self.backtrack_delay, ready=True)
 
     def promote_to_main(self, *, session_id: str, pane_id: str) -> None:
-        command = self._codex_command(f"codex resume {shlex.quote(str(session_id))}")
+        command = self._codex_command(f"codex resume {shlex.quote(str(session_id))}", pane_id=pane_id, session_id=session_id)
         if self.backtrack_delay > 0:
             time.sleep(self.backtrack_delay)
         self._send_command(pane_id, command)
 
     def interrupt_pane(self, *, pane_id: str) -> None:
         pane = self._get_pane(pane_id)
-        pane.send_keys("C-c", enter=False)
-        if self.backtrack_delay > 0:
-            time.sleep(self.backtrack_delay)
-        pane.send_keys("C-c", enter=False)
-        if self.backtrack_delay > 0:
-            time.sleep(self.backtrack_delay)
+        self._send_keys_and_wait([pane], "C-c", enter=False, fallback=self.backtrack_delay)
+        self._send_keys_and_wait([pane], "C-c", enter=False, fallback=self.backtrack_delay, ready=True)
+
+    def list_panes(self) -> Optional[List[str]]:
+        """コントロールモード接続がある場合はプロセスを起動せずにペイン ID 一覧を返す."""
+        control = self._control_client()
+        if control is None:
+            return None
+        try:
+            lines = control.command("list-panes", "-t", self.session_name, "-F", "#{pane_id}")
+        except (TmuxControlError, TimeoutError):
+            return None
+        return [line.strip() for line in lines if line.strip()]
+
+    def send_keys_to_panes(self, pane_ids: Sequence[str], keys: str, *, enter: bool = False) -> None:
+        control = self._control_client()
+        if control is not None:
+            commands = []
+            for pane_id in pane_ids:
+                args = ["send-keys", "-t", pane_id]
+                if keys:
+                    args.append(keys)
+                if enter:
+                    args.append("Enter")
+                commands.append(args)
+            control.pipeline(commands, check=False)
+            return
+        for pane_id in pane_ids:
+            self._get_pane(pane_id).send_keys(keys, enter=enter)
+
+    def close(self) -> None:
+        with self._control_lock:
+            if self._control is not None:
+                self._control.close()
+                self._control = None
+
+    def _control_client(self) -> Optional[TmuxControlClient]:
+        if not self.control_mode or self._control_failed:
+            return None
+        with self._control_lock:
+            if self._control_failed:
+                return None
+            if self._control is not None and self._control.alive:
+                return self._control
+            if self._control is not None:
+                self._control.close()
+            control = TmuxControlClient(self.session_name)
+            control.add_listener(self._on_control_notification)
+            if not control.start():
+                # セッション未作成などで接続できない場合は次の ensure_layout まで libtmux を使う
+                self._control_failed = True
+                self._control = None
+                return None
+            self._control = control
+            self._invalidate_panes()
+            return control
+
+    def _on_control_notification(self, name: str, _rest: str) -> None:
+        if name in _LAYOUT_NOTIFICATIONS:
+            self._invalidate_panes()
+
+    def _invalidate_panes(self) -> None:
+        """ペイン構成が変わった可能性がある場合にハンドルキャッシュを破棄する."""
+        with self._pane_lock:
+            self._pane_generation += 1
+            self._pane_cache = {}
 
     def _apply_role_labels(self, session, layout: Mapping[str, Any]) -> None:
         try:
@@ -141,6 +325,8 @@ class TmuxLayoutManager:
             self._set_pane_title(session, layout.get("boss"), "BOSS")
             for index, pane_id in enumerate(layout.get("workers", []), start=1):
                 self._set_pane_title(session, pane_id, f"WORKER-{index}")
+            for index, pane_id in enumerate(layout.get("boss_shards", []), start=2):
+                self._set_pane_title(session, pane_id, f"BOSS-{index}")
         except Exception:  # pragma: no cover - tmux互換対策
             pass
 
@@ -177,6 +363,15 @@ class TmuxLayoutManager:
         return session
 
     def _get_pane(self, pane_id: str):
+        with self._pane_lock:
+            cached = self._pane_cache.get(pane_id)
+        if cached is not None:
+            return cached
+        control = self._control_client()
+        if control is not None:
+            pane = ControlPane(control, pane_id)
+            with self._pane_lock:
+                return self._pane_cache.setdefault(pane_id, pane)
         pane = self._find_pane(pane_id)
         if pane is not None:
             return pane
@@ -187,37 +382,200 @@ class TmuxLayoutManager:
         raise RuntimeError(f"Pane {pane_id!r} not found in tmux session {self.session_name}")
 
     def _find_pane(self, pane_id: str):
+        # 一度の走査で見つかった全ペインをキャッシュし、以降の参照を O(1) にする
+        found = None
+        cache: dict[str, Any] = {}
         for session in getattr(self._server, "sessions", []):
             for window in getattr(session, "windows", []):
                 for pane in getattr(window, "panes", []):
-                    if getattr(pane, "pane_id", None) == pane_id:
-                        return pane
-        return None
+                    current_id = getattr(pane, "pane_id", None)
+                    if current_id is None:
+                        continue
+                    cache[current_id] = pane
+                    if current_id == pane_id:
+                        found = pane
+        with self._pane_lock:
+            self._pane_cache.update(cache)
+        return found
+
+    def _send_keys(self, pane_id: str, keys: str, *, enter: bool) -> None:
+        pane = self._get_pane(pane_id)
+        try:
+            pane.send_keys(keys, enter=enter)
+        except Exception as exc:
+            # タイムアウトはキーが届いている可能性があるため、二重送信を避けて再送しない
+            if not _is_stale_handle_error(exc):
+                raise
+            # ハンドルが古かった場合だけキャッシュを破棄して一度だけ再送する
+            self._invalidate_panes()
+            self._get_pane(pane_id).send_keys(keys, enter=enter)
 
     def _send_command(self, pane_id: str, command: str) -> None:
-        pane = self._get_pane(pane_id)
-        pane.send_keys(command, enter=True)
+        self._send_keys(pane_id, command, enter=True)
 
-    def _maybe_wait(self) -> None:
-        if self.startup_delay > 0:
+    def _maybe_wait(self, panes: Sequence[Any] = (), before: Optional[List[str]] = None) -> None:
+        if self.startup_delay <= 0:
+            return
+        if not panes:
             time.sleep(self.startup_delay)
+            return
+        # startup_delay は上限として扱い、プロンプトが表示されたら早めに進める
+        self._wait_for_panes(panes, before, fallback=self.startup_delay, timeout=self.startup_delay, prompt=True)
 
     def _send_text(self, pane_id: str, text: str) -> None:
-        pane = self._get_pane(pane_id)
         payload = text.replace("\r\n", "\n")
-        pane.send_keys(f"\x1b[200~{payload}\x1b[201~", enter=True)
+        self._send_keys(pane_id, f"{_PASTE_START}{payload}{_PASTE_END}", enter=True)
 
-    def _codex_command(self, command: str) -> str:
-        return command
+    @staticmethod
+    def _load_buffer(control: TmuxControlClient, text: str) -> Optional[str]:
+        payload = text.replace("\r\n", "\n")
+        fd, tmp_name = tempfile.mkstemp(prefix="sibyl-instruction-", suffix=".txt")
+        buffer_name = f"sibyl-{uuid.uuid4().hex[:12]}"
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(payload)
+            control.command("load-buffer", "-b", buffer_name, tmp_name)
+        except (OSError, TmuxControlError, TimeoutError):
+            return None
+        finally:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+        return buffer_name
+
+    def _codex_command(self, command: str, *, pane_id: Optional[str] = None, session_id: Optional[str] = None) -> str:
+        homes = self.codex_homes
+        if homes is None or pane_id is None:
+            return command
+        home = homes.home_for(pane_id)
+        if session_id:
+            locate = getattr(self.monitor, "rollout_path", None)
+            rollout = locate(str(session_id)) if callable(locate) else None
+            if rollout is not None:
+                # 複製先は bind_existing_session がペインの HOME から解決し、以降の追跡対象を付け替える
+                homes.stage_rollout(pane_id, rollout)
+        return f"env CODEX_HOME={shlex.quote(str(home))} {command}"
+
+    def _fork_workers_concurrently(self, commands: Mapping[str, str], *, reset_prompt: bool = True) -> None:
+        """各ステップを全ペインへ一括送信し、待機はステップごとに一度だけ行う."""
+        panes = {pane_id: self._get_pane(pane_id) for pane_id in commands}
+        targets = list(panes.values())
+        self._send_keys_and_wait(targets, "C-c", enter=False, fallback=self.backtrack_delay)
+        self._send_keys_and_wait(targets, "C-c", enter=False, fallback=self.backtrack_delay, ready=True)
+        before = self._snapshot_panes(targets)
+        for pane_id, command in commands.items():
+            panes[pane_id].send_keys(command, enter=True)
+        self._wait_for_prompt(targets, before, fallback=max(0.5, self.backtrack_delay))
+        if reset_prompt:
+            self._send_prompt_reset_to(targets)
+
+    def _send_keys_and_wait(
+        self,
+        panes: Sequence[Any],
+        keys: str,
+        *,
+        enter: bool,
+        fallback: float,
+        ready: bool = False,
+    ) -> None:
+        """全ペインへキーを送り、画面が反応するまで待つ.
+
+        画面が変わらないキー操作で毎回待たされないよう、上限は通常 fallback とし、
+        直後にコマンドやプロンプトを入力する場合 (ready=True) だけ key_timeout まで待つ。
+        """
+        before = self._snapshot_panes(panes)
+        for pane in panes:
+            pane.send_keys(keys, enter=enter)
+        timeout = self.key_timeout if ready else min(self.key_timeout, fallback)
+        self._wait_for_panes(panes, before, fallback=fallback, timeout=timeout, prompt=False)
+
+    def _wait_for_prompt(self, panes: Sequence[Any], before: Optional[List[str]], *, fallback: float) -> None:
+        self._wait_for_panes(panes, before, fallback=fallback, timeout=self.ready_timeout, prompt=True)
+
+    def _snapshot_panes(self, panes: Sequence[Any]) -> Optional[List[str]]:
+        snapshot: List[str] = []
+        for pane in panes:
+            content = self._capture(pane)
+            if content is None:
+                return None
+            snapshot.append(content)
+        return snapshot
+
+    def _wait_for_panes(
+        self,
+        panes: Sequence[Any],
+        before: Optional[List[str]],
+        *,
+        fallback: float,
+        timeout: float,
+        prompt: bool,
+    ) -> None:
+        """capture-pane で画面を監視し、全ペインが準備完了になるまで待つ。取得できない場合は固定待機に戻す."""
+        if before is None or timeout <= 0:
+            if fallback > 0:
+                time.sleep(fallback)
+            return
+        deadline = time.monotonic() + timeout
+        pending = dict(enumerate(panes))
+        last_seen = dict(enumerate(before))
+        stable_since: dict[int, float] = {}
+        while pending:
+            now = time.monotonic()
+            for index, pane in list(pending.items()):
+                content = self._capture(pane)
+                if content is None:
+                    pending.pop(index)
+                    continue
+                if content != last_seen[index]:
+                    last_seen[index] = content
+                    stable_since[index] = now
+                if index not in stable_since:
+                    continue
+                if not prompt or self._is_ready(content, before[index], now - stable_since[index]):
+                    pending.pop(index)
+            if not pending or now >= deadline:
+                return
+            time.sleep(self.ready_poll_interval)
+
+    def _is_ready(self, content: str, before: str, stable_for: float) -> bool:
+        """送信後に書き換わった行にプロンプトが現れたかで判定する (パターン未指定時だけ静止時間で判定)."""
+        if not self.ready_patterns:
+            return stable_for >= self.ready_settle
+        if stable_for < self.ready_poll_interval:
+            return False
+        # 送信前から画面に残っていたフッターを準備完了と取り違えないよう、同じ行位置で変化した行だけを見る
+        previous = before.splitlines()
+        lines = content.splitlines()
+        changed = [
+            line
+            for row, line in enumerate(lines)
+            if line.strip() and (row >= len(previous) or previous[row] != line)
+        ]
+        tail = "\n".join(changed[-6:])
+        return any(pattern in tail for pattern in self.ready_patterns)
+
+    @staticmethod
+    def _capture(pane: Any) -> Optional[str]:
+        capture = getattr(pane, "capture_pane", None)
+        if not callable(capture):
+            return None
+        try:
+            lines = capture()
+        except Exception:  # noqa: BLE001 - ペイン消失時などは固定待機に戻す
+            return None
+        if isinstance(lines, str):
+            return lines
+        return "\n".join(lines or [])
 
     def _send_prompt_reset(self, *, pane_id: str) -> None:
-        pane = self._get_pane(pane_id)
-        pane.send_keys("C-[", enter=False)
-        time.sleep(max(0.1, self.backtrack_delay))
-        pane.send_keys("C-[", enter=False)
-        time.sleep(max(0.1, self.backtrack_delay))
-        pane.send_keys("", enter=True)
-        time.sleep(max(0.1, self.backtrack_delay))
+        self._send_prompt_reset_to([self._get_pane(pane_id)])
+
+    def _send_prompt_reset_to(self, panes: Sequence[Any]) -> None:
+        fallback = max(0.1, self.backtrack_delay)
+        self._send_keys_and_wait(panes, "C-[", enter=False, fallback=fallback)
+        self._send_keys_and_wait(panes, "C-[", enter=False, fallback=fallback)
+        self._send_keys_and_wait(panes, "", enter=True, fallback=fallback, ready=True)
 
     def _configure_session(self, session) -> None:
         commands = [
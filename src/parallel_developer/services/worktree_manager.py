@@ -2,12 +2,49 @@
 
 from __future__ import annotations
 
+import os
+import platform
+import re
 import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Literal, Optional, Sequence
 
 import git
 
+PrepareMode = Literal["create", "reset", "reuse"]
+ResetPolicy = Literal["full", "keep_cache"]
+SeedMethod = Literal["reflink", "hardlink", "copy"]
+
+_PATH_TOKEN = re.compile(r"[\w@.\-]+(?:/[\w@.\-]+)+/?|[\w@.\-]+/")
+
+DEFAULT_CACHE_PATHS: tuple[str, ...] = (
+    "node_modules",
+    ".venv",
+    "venv",
+    "target",
+    "__pycache__",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+    ".tox",
+    ".gradle",
+    ".next",
+    ".turbo",
+)
+
+
+@dataclass(slots=True)
+class _PrepareTask:
+    name: str
+    path: Path
+    branch: str
+    mode: PrepareMode
+
 
 class WorktreeManager:
     """ワーカー/ボス用の git worktree を生成・整備する."""
@@ -18,10 +55,31 @@ class WorktreeManager:
         worker_count: int,
         session_namespace: Optional[str] = None,
         storage_root: Optional[Path] = None,
+        max_parallel: Optional[int] = None,
+        reset_policy: ResetPolicy = "full",
+        keep_paths: Sequence[str] = DEFAULT_CACHE_PATHS,
+        seed_paths: Sequence[str] = (),
+        seed_hardlink: bool = False,
+        sparse_paths: Sequence[str] = (),
+        sparse_from_instruction: bool = False,
+        sparse_depth: int = 2,
+        checkout_workers: int = 0,
+        follow_root_head: bool = False,
     ) -> None:
         self.root = Path(root)
         self.worker_count = worker_count
         self.session_namespace = session_namespace
+        self.max_parallel = max_parallel
+        self.reset_policy = reset_policy
+        self.keep_paths = tuple(keep_paths)
+        self.seed_paths = tuple(seed_paths)
+        self.seed_hardlink = seed_hardlink
+        self.sparse_paths = tuple(sparse_paths)
+        self.sparse_from_instruction = sparse_from_instruction
+        self.sparse_depth = sparse_depth
+        self.checkout_workers = checkout_workers
+        self.follow_root_head = follow_root_head
+        self._active_sparse: tuple[str, ...] = ()
         try:
             self._repo = git.Repo(self.root)
         except git.exc.InvalidGitRepositoryError:
@@ -35,29 +93,44 @@ class WorktreeManager:
         self._worker_branch_template, self._boss_branch = self._resolve_branch_templates()
         self._initialized = False
         self._worker_paths: Dict[str, Path] = {}
+        # worktree の登録やブランチ更新はリポジトリ共有のロックを取るため直列化し、チェックアウトのみ並列に行う
+        self._repo_lock = threading.Lock()
+        self.last_prepare_timings: Dict[str, float] = {}
 
-    def prepare(self) -> Dict[str, Path]:
+    def prepare(self, *, instruction: Optional[str] = None) -> Dict[str, Path]:
+        """instruction を渡すと、sparse_from_instruction 有効時に言及されたパスから sparse 範囲を決める."""
         self.worktrees_dir.mkdir(parents=True, exist_ok=True)
+        self._active_sparse = self._resolve_sparse(instruction)
+        # 別プロセスが作成した worktree も git 側の登録情報から検出し、作り直さずにリセットする
+        registered = {} if self._initialized else self._registered_worktrees()
         mapping: Dict[str, Path] = {}
+        tasks: List[_PrepareTask] = []
         for index in range(1, self.worker_count + 1):
             worker_name = f"worker-{index}"
             worktree_path = self.worktrees_dir / worker_name
             branch_name = self.worker_branch(worker_name)
-            if not self._initialized or worker_name not in self._worker_paths:
-                self._recreate_worktree(worktree_path, branch_name)
+            if self._initialized and worker_name in self._worker_paths:
+                mode: PrepareMode = "reset"
             else:
-                self._reset_worktree(worktree_path)
+                mode = self._initial_mode(worktree_path, branch_name, registered)
+            tasks.append(_PrepareTask(worker_name, worktree_path, branch_name, mode))
             mapping[worker_name] = worktree_path
         if self._initialized:
-            existing = set(self._worker_paths)
-            target = set(mapping)
-            for obsolete in existing - target:
-                self._remove_worktree(self.worktrees_dir / obsolete)
-
-        if not self._initialized:
-            self._recreate_worktree(self.boss_path, self.boss_branch)
+            obsolete_names = set(self._worker_paths) - set(mapping)
         else:
-            self._reset_worktree(self.boss_path)
+            obsolete_names = {
+                path.name
+                for path in registered
+                if path.parent == self._resolved(self.worktrees_dir) and path.name.startswith("worker-")
+            } - set(mapping)
+        for obsolete in obsolete_names:
+            self._remove_worktree(self.worktrees_dir / obsolete)
+
+        boss_mode: PrepareMode = (
+            "reset" if self._initialized else self._initial_mode(self.boss_path, self.boss_branch, registered)
+        )
+        tasks.append(_PrepareTask("boss", self.boss_path, self.boss_branch, boss_mode))
+        self.last_prepare_timings = self._run_tasks(tasks)
         self._worker_paths = mapping
         self._initialized = True
         return mapping
@@ -85,36 +158,223 @@ class WorktreeManager:
                     "Please create an initial commit manually."
                 ) from commit_exc
 
-    def _recreate_worktree(self, path: Path, branch_name: str) -> None:
-        if path.exists():
-            try:
-                self._repo.git.worktree("remove", "--force", str(path))
-            except git.GitCommandError:
-                shutil.rmtree(path, ignore_errors=True)
+    def _run_tasks(self, tasks: List[_PrepareTask]) -> Dict[str, float]:
+        """各 worktree の作成/リセットをスレッドプールで実行し、所要秒数を返す."""
+        with self._repo_lock:
+            head = self._repo.head.commit.hexsha
+            if self._active_sparse:
+                self._enable_worktree_config()
+
+        def run(task: _PrepareTask) -> float:
+            started = time.perf_counter()
+            if task.mode == "reset":
+                # ワーカーを持ち越す場合だけ、前サイクルで統合されたルートの HEAD へ揃える
+                self._reset_worktree(task.path, head if self.follow_root_head else "HEAD")
+            elif task.mode == "reuse":
+                try:
+                    self._reuse_worktree(task.path, head)
+                except (git.GitCommandError, git.exc.InvalidGitRepositoryError, git.exc.NoSuchPathError):
+                    self._recreate_worktree(task.path, task.branch, head)
+            else:
+                self._recreate_worktree(task.path, task.branch, head)
+            self._seed_artifacts(task.path)
+            return time.perf_counter() - started
+
+        workers = self.max_parallel or len(tasks)
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="sibyl-worktree") as pool:
+            futures = [(task.name, pool.submit(run, task)) for task in tasks]
+        timings: Dict[str, float] = {}
+        errors: List[BaseException] = []
+        for name, future in futures:
+            error = future.exception()
+            if error is not None:
+                errors.append(error)
+                continue
+            timings[name] = future.result()
+        if errors:
+            raise errors[0]
+        return timings
+
+    def sparse_paths_for(self, instruction: str) -> List[str]:
+        """指示文中のパス表記のうち HEAD に存在するディレクトリを sparse_depth 階層までに丸めて返す."""
+        tree = self._repo.head.commit.tree
+        found: List[str] = []
+        for token in _PATH_TOKEN.findall(instruction):
+            parts = [part for part in token.strip("/").split("/") if part not in {"", "."}]
+            if not parts or ".." in parts:
+                continue
+            directory: Optional[str] = None
+            for depth in range(1, min(len(parts), self.sparse_depth) + 1):
+                candidate = "/".join(parts[:depth])
+                try:
+                    entry = tree / candidate
+                except KeyError:
+                    break
+                if entry.type != "tree":
+                    break
+                directory = candidate
+            if directory and directory not in found:
+                found.append(directory)
+        return found
+
+    def _resolve_sparse(self, instruction: Optional[str]) -> tuple[str, ...]:
+        paths = list(self.sparse_paths)
+        if self.sparse_from_instruction and instruction:
+            derived = self.sparse_paths_for(instruction)
+            if not derived and not paths:
+                # 対象パスが読み取れない場合は取りこぼしを避けて全体をチェックアウトする
+                return ()
+            paths.extend(path for path in derived if path not in paths)
+        return tuple(paths)
+
+    def _enable_worktree_config(self) -> None:
+        # sparse-checkout は初回に共有設定へ extensions.worktreeConfig を書き込むため、並列実行前に一度だけ設定する
+        reader = self._repo.config_reader()
+        if reader.get_value("extensions", "worktreeConfig", default=False):
+            return
+        if int(reader.get_value("core", "repositoryformatversion", default=0)) < 1:
+            self._repo.git.config("core.repositoryformatversion", "1")
+        self._repo.git.config("extensions.worktreeConfig", "true")
+
+    def _git(self, path: Path) -> git.Git:
+        runner = git.Repo(path).git
+        if self.checkout_workers:
+            return runner(c=f"checkout.workers={self.checkout_workers}")
+        return runner
+
+    def _apply_sparse(self, runner: git.Git) -> None:
+        if self._active_sparse:
+            runner.sparse_checkout("set", "--cone", *self._active_sparse)
+            return
+        try:
+            enabled = runner.config("--get", "core.sparseCheckout").strip() == "true"
+        except git.GitCommandError:
+            enabled = False
+        if enabled:
+            runner.sparse_checkout("disable")
+
+    def _registered_worktrees(self) -> Dict[Path, Optional[str]]:
+        """git worktree list --porcelain から、利用可能な worktree のパスとブランチ名を返す."""
+        try:
+            output = self._repo.git.worktree("list", "--porcelain")
+        except git.GitCommandError:
+            return {}
+        registered: Dict[Path, Optional[str]] = {}
+        for block in output.split("\n\n"):
+            path: Optional[Path] = None
+            branch: Optional[str] = None
+            usable = True
+            for line in block.splitlines():
+                key, _, value = line.partition(" ")
+                if key == "worktree":
+                    path = Path(value)
+                elif key == "branch":
+                    branch = value[len("refs/heads/") :] if value.startswith("refs/heads/") else value
+                elif key in {"prunable", "bare"}:
+                    usable = False
+            if path is not None and usable:
+                registered[self._resolved(path)] = branch
+        return registered
+
+    def _initial_mode(self, path: Path, branch_name: str, registered: Dict[Path, Optional[str]]) -> PrepareMode:
+        resolved = self._resolved(path)
+        if resolved in registered and registered[resolved] == branch_name and (path / ".git").is_file():
+            return "reuse"
+        return "create"
+
+    @staticmethod
+    def _resolved(path: Path) -> Path:
+        try:
+            return path.resolve()
+        except OSError:
+            return path.absolute()
+
+    def _reuse_worktree(self, path: Path, commit: str) -> None:
+        # -B で作り直した場合と同じく、ブランチをルートの HEAD へ合わせてから作業ツリーを掃除する
+        runner = self._git(path)
+        self._apply_sparse(runner)
+        runner.reset("--hard", commit)
+        runner.clean(*self._clean_args())
+
+    def seed_warnings(self) -> List[str]:
+        """seed_paths の設定で意図どおりに効かないものを利用者向けの文面で返す."""
+        if not self.seed_paths:
+            return []
+        warnings: List[str] = []
+        if self.reset_policy == "full":
+            warnings.append(
+                "reset=full では git clean -fdx が毎サイクル複製物を消すため、seed は毎回やり直しになります。"
+                "reset=keep_cache の併用を推奨します。"
+            )
+        venvs = [relative for relative in self.seed_paths if _is_virtualenv(self.root / relative)]
+        if venvs:
+            warnings.append(
+                f"仮想環境は絶対パスを埋め込んでおり複製すると元の環境を指すため、seed の対象外にしました: {', '.join(venvs)}"
+            )
+        return warnings
+
+    def _seed_artifacts(self, path: Path) -> Dict[str, SeedMethod]:
+        """ルートの依存物ディレクトリ (seed_paths) を worktree に無い場合だけ複製する."""
+        methods: Dict[str, SeedMethod] = {}
+        for relative in self.seed_paths:
+            source = self.root / relative
+            target = path / relative
+            if not source.exists() or target.exists() or target.is_symlink():
+                continue
+            # venv の activate やスクリプトの shebang はルートの絶対パスを指すため複製しても使えない
+            if _is_virtualenv(source):
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            methods[relative] = _clone_tree(source, target, hardlink=self.seed_hardlink)
+        return methods
+
+    def _clean_args(self) -> List[str]:
+        """keep_cache では無視対象のビルド成果物のうち許可リストに一致するものを残す."""
+        args = ["-fdx"]
+        if self.reset_policy == "keep_cache":
+            for pattern in self.keep_paths:
+                args.extend(["-e", pattern])
+        return args
+
+    def _recreate_worktree(self, path: Path, branch_name: str, commit: str = "HEAD") -> None:
         if path.exists():
             shutil.rmtree(path, ignore_errors=True)
-        self._repo.git.worktree(
-            "add",
-            "-B",
-            branch_name,
-            str(path),
-            "HEAD",
-        )
+        with self._repo_lock:
+            self._repo.git.worktree("prune")
+            if path.exists():
+                try:
+                    self._repo.git.worktree("remove", "--force", str(path))
+                except git.GitCommandError:
+                    shutil.rmtree(path, ignore_errors=True)
+            self._repo.git.worktree(
+                "add",
+                "--no-checkout",
+                "-B",
+                branch_name,
+                str(path),
+                commit,
+            )
+        # チェックアウトは worktree 固有の index だけを触るためロック外で並列に行う
+        runner = self._git(path)
+        self._apply_sparse(runner)
+        runner.reset("--hard", "HEAD")
 
-    def _reset_worktree(self, path: Path) -> None:
+    def _reset_worktree(self, path: Path, commit: str = "HEAD") -> None:
         if not path.exists():
             return
-        repo = git.Repo(path)
-        repo.git.reset("--hard", "HEAD")
-        repo.git.clean("-fdx")
+        runner = self._git(path)
+        self._apply_sparse(runner)
+        runner.reset("--hard", commit)
+        runner.clean(*self._clean_args())
 
     def _remove_worktree(self, path: Path) -> None:
         if not path.exists():
             return
-        try:
-            self._repo.git.worktree("remove", "--force", str(path))
-        except git.GitCommandError:
-            shutil.rmtree(path, ignore_errors=True)
+        with self._repo_lock:
+            try:
+                self._repo.git.worktree("remove", "--force", str(path))
+            except git.GitCommandError:
+                shutil.rmtree(path, ignore_errors=True)
         if path.exists():
             shutil.rmtree(path, ignore_errors=True)
 
@@ -129,3 +389,45 @@ class WorktreeManager:
             prefix = f"parallel-dev/{self.session_namespace}"
             return f"{prefix}/{{name}}", f"{prefix}/boss"
         return "parallel-dev/{name}", "parallel-dev/boss"
+
+
+def _clone_tree(source: Path, target: Path, *, hardlink: bool = False) -> SeedMethod:
+    """reflink (CoW) → (hardlink 指定時のみ) ハードリンク → 通常コピーの順に試して source を target へ複製する."""
+    if _reflink_copy(source, target):
+        return "reflink"
+    if hardlink and source.is_dir() and not source.is_symlink():
+        try:
+            # ハードリンクはルートと inode を共有し、worktree 側のその場書き換えがルートにも及ぶため明示的な指定時だけ使う
+            shutil.copytree(source, target, symlinks=True, copy_function=os.link)
+            return "hardlink"
+        except OSError:
+            shutil.rmtree(target, ignore_errors=True)
+    if source.is_dir() and not source.is_symlink():
+        shutil.copytree(source, target, symlinks=True)
+    else:
+        shutil.copy2(source, target, follow_symlinks=False)
+    return "copy"
+
+
+def _is_virtualenv(path: Path) -> bool:
+    return (path / "pyvenv.cfg").is_file()
+
+
+def _reflink_copy(source: Path, target: Path) -> bool:
+    if shutil.which("cp") is None:
+        return False
+    if platform.system() == "Darwin":
+        command = ["cp", "-cRp", str(source), str(target)]
+    else:
+        command = ["cp", "-a", "--reflink=always", str(source), str(target)]
+    try:
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    except OSError:
+        return False
+    if result.returncode == 0:
+        return True
+    if target.is_dir() and not target.is_symlink():
+        shutil.rmtree(target, ignore_errors=True)
+    elif target.exists() or target.is_symlink():
+        target.unlink()
+    return False
@@ -0,0 +1,45 @@
+"""ワーカーから完了をホストへ通知する `sibyl-signal` コマンド."""
+
+from __future__ import annotations
+
+import argparse
+import socket
+from pathlib import Path
+from typing import Optional, Sequence
+
+
+def send_signal(socket_path: Path, flag_path: Path, *, timeout: float = 1.0) -> bool:
+    """ホストのシグナルソケットへフラグパスを送る。ソケットが使えなければ False."""
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(timeout)
+            sock.sendto(str(flag_path).encode("utf-8"), str(socket_path))
+    except OSError:
+        return False
+    return True
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="sibyl-signal",
+        description="Notify the Sibyl host that a task is complete (falls back to creating the flag file).",
+    )
+    parser.add_argument("--socket", help="signal socket path announced in the instruction")
+    parser.add_argument("flag", help="completion flag path announced in the instruction")
+    args = parser.parse_args(argv)
+
+    flag = Path(args.flag).expanduser().absolute()
+    if args.socket and send_signal(Path(args.socket).expanduser(), flag):
+        return 0
+    try:
+        flag.parent.mkdir(parents=True, exist_ok=True)
+        flag.touch()
+    except OSError as exc:
+        parser.exit(1, f"sibyl-signal: {exc}\n")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -6,7 +6,7 @@ import os
 import platform
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import yaml
 from platformdirs import PlatformDirs
@@ -53,6 +53,22 @@ class SettingsData:
     commit: str = "manual"
     merge: str = "auto"
     worktree_root: Optional[str] = None
+    worktree_reset: str = "full"
+    worktree_keep: Optional[List[str]] = None
+    worktree_seed: Optional[List[str]] = None
+    worktree_seed_hardlink: bool = False
+    worktree_sparse: Optional[List[str]] = None
+    worktree_sparse_auto: bool = False
+    worktree_checkout_workers: int = 0
+    worker_quorum: Optional[int] = None
+    straggler_grace: Optional[float] = None
+    stream_boss: bool = False
+    boss_shards: int = 1
+    boss_top_k: int = 0
+    signal_socket: bool = True
+    codex_isolate_home: bool = False
+    codex_fork_strategy: str = "resume"
+    codex_sticky_workers: bool = False
 
 
 class SettingsStore:
@@ -72,6 +88,47 @@ class SettingsStore:
             return "auto"
         return token
 
+    @staticmethod
+    def _normalize_worktree_reset(value: Optional[object]) -> str:
+        if value is None:
+            return "full"
+        token = str(value).strip().lower()
+        if token not in {"full", "keep_cache"}:
+            return "full"
+        return token
+
+    @staticmethod
+    def _normalize_path_list(value: Optional[object]) -> Optional[List[str]]:
+        if not isinstance(value, (list, tuple)):
+            return None
+        return [str(item) for item in value if str(item).strip()]
+
+    @staticmethod
+    def _normalize_count(value: Optional[object]) -> int:
+        try:
+            return max(int(str(value)), 0)
+        except (TypeError, ValueError):
+            return 0
+
+    @staticmethod
+    def _normalize_optional_number(value: Optional[object], kind: type) -> Optional[Any]:
+        if value is None or value == "":
+            return None
+        try:
+            number = kind(value)
+        except (TypeError, ValueError):
+            return None
+        return number if number >= 0 else None
+
+    @staticmethod
+    def _normalize_fork_strategy(value: Optional[object]) -> str:
+        if value is None:
+            return "resume"
+        token = str(value).strip().lower()
+        if token not in {"resume", "clone"}:
+            return "resume"
+        return token
+
     @property
     def attach(self) -> str:
         return self._data.attach
@@ -144,6 +201,150 @@ class SettingsStore:
         self._data.worktree_root = str(value) if value else None
         self._save()
 
+    @property
+    def worktree_reset(self) -> str:
+        return self._data.worktree_reset
+
+    @worktree_reset.setter
+    def worktree_reset(self, value: str) -> None:
+        self._data.worktree_reset = self._normalize_worktree_reset(value)
+        self._save()
+
+    @property
+    def worktree_keep(self) -> Optional[List[str]]:
+        return self._data.worktree_keep
+
+    @worktree_keep.setter
+    def worktree_keep(self, value: Optional[Sequence[str]]) -> None:
+        self._data.worktree_keep = self._normalize_path_list(value)
+        self._save()
+
+    @property
+    def worktree_seed(self) -> Optional[List[str]]:
+        return self._data.worktree_seed
+
+    @worktree_seed.setter
+    def worktree_seed(self, value: Optional[Sequence[str]]) -> None:
+        self._data.worktree_seed = self._normalize_path_list(value)
+        self._save()
+
+    @property
+    def worktree_seed_hardlink(self) -> bool:
+        return self._data.worktree_seed_hardlink
+
+    @worktree_seed_hardlink.setter
+    def worktree_seed_hardlink(self, value: bool) -> None:
+        self._data.worktree_seed_hardlink = bool(value)
+        self._save()
+
+    @property
+    def worktree_sparse(self) -> Optional[List[str]]:
+        return self._data.worktree_sparse
+
+    @worktree_sparse.setter
+    def worktree_sparse(self, value: Optional[Sequence[str]]) -> None:
+        self._data.worktree_sparse = self._normalize_path_list(value)
+        self._save()
+
+    @property
+    def worktree_sparse_auto(self) -> bool:
+        return self._data.worktree_sparse_auto
+
+    @worktree_sparse_auto.setter
+    def worktree_sparse_auto(self, value: bool) -> None:
+        self._data.worktree_sparse_auto = bool(value)
+        self._save()
+
+    @property
+    def worktree_checkout_workers(self) -> int:
+        return self._data.worktree_checkout_workers
+
+    @worktree_checkout_workers.setter
+    def worktree_checkout_workers(self, value: int) -> None:
+        self._data.worktree_checkout_workers = self._normalize_count(value)
+        self._save()
+
+    @property
+    def worker_quorum(self) -> Optional[int]:
+        return self._data.worker_quorum
+
+    @worker_quorum.setter
+    def worker_quorum(self, value: Optional[int]) -> None:
+        self._data.worker_quorum = self._normalize_optional_number(value, int) or None
+        self._save()
+
+    @property
+    def straggler_grace(self) -> Optional[float]:
+        return self._data.straggler_grace
+
+    @straggler_grace.setter
+    def straggler_grace(self, value: Optional[float]) -> None:
+        self._data.straggler_grace = self._normalize_optional_number(value, float)
+        self._save()
+
+    @property
+    def stream_boss(self) -> bool:
+        return self._data.stream_boss
+
+    @stream_boss.setter
+    def stream_boss(self, value: bool) -> None:
+        self._data.stream_boss = bool(value)
+        self._save()
+
+    @property
+    def boss_shards(self) -> int:
+        return self._data.boss_shards
+
+    @boss_shards.setter
+    def boss_shards(self, value: int) -> None:
+        self._data.boss_shards = max(1, self._normalize_count(value))
+        self._save()
+
+    @property
+    def boss_top_k(self) -> int:
+        return self._data.boss_top_k
+
+    @boss_top_k.setter
+    def boss_top_k(self, value: int) -> None:
+        self._data.boss_top_k = self._normalize_count(value)
+        self._save()
+
+    @property
+    def signal_socket(self) -> bool:
+        return self._data.signal_socket
+
+    @signal_socket.setter
+    def signal_socket(self, value: bool) -> None:
+        self._data.signal_socket = bool(value)
+        self._save()
+
+    @property
+    def codex_isolate_home(self) -> bool:
+        return self._data.codex_isolate_home
+
+    @codex_isolate_home.setter
+    def codex_isolate_home(self, value: bool) -> None:
+        self._data.codex_isolate_home = bool(value)
+        self._save()
+
+    @property
+    def codex_fork_strategy(self) -> str:
+        return self._data.codex_fork_strategy
+
+    @codex_fork_strategy.setter
+    def codex_fork_strategy(self, value: str) -> None:
+        self._data.codex_fork_strategy = self._normalize_fork_strategy(value)
+        self._save()
+
+    @property
+    def codex_sticky_workers(self) -> bool:
+        return self._data.codex_sticky_workers
+
+    @codex_sticky_workers.setter
+    def codex_sticky_workers(self, value: bool) -> None:
+        self._data.codex_sticky_workers = bool(value)
+        self._save()
+
     def snapshot(self) -> Dict[str, object]:
         payload: Dict[str, object] = {
             "commands": {
@@ -158,6 +359,44 @@ class SettingsStore:
         }
         if self._data.worktree_root:
             payload["paths"] = {"worktree_root": self._data.worktree_root}
+        worktrees: Dict[str, object] = {"reset": self._data.worktree_reset}
+        if self._data.worktree_keep is not None:
+            worktrees["keep"] = list(self._data.worktree_keep)
+        if self._data.worktree_seed:
+            worktrees["seed"] = list(self._data.worktree_seed)
+        if self._data.worktree_seed_hardlink:
+            worktrees["seed_hardlink"] = True
+        if self._data.worktree_sparse:
+            worktrees["sparse"] = list(self._data.worktree_sparse)
+        if self._data.worktree_sparse_auto:
+            worktrees["sparse_auto"] = True
+        if self._data.worktree_checkout_workers:
+            worktrees["checkout_workers"] = self._data.worktree_checkout_workers
+        payload["worktrees"] = worktrees
+        completion: Dict[str, object] = {}
+        if self._data.worker_quorum:
+            completion["quorum"] = self._data.worker_quorum
+        if self._data.straggler_grace is not None:
+            completion["grace_seconds"] = self._data.straggler_grace
+        if self._data.stream_boss:
+            completion["stream_boss"] = True
+        if self._data.boss_shards > 1:
+            completion["boss_shards"] = self._data.boss_shards
+        if self._data.boss_top_k:
+            completion["boss_top_k"] = self._data.boss_top_k
+        if not self._data.signal_socket:
+            completion["signal_socket"] = False
+        if completion:
+            payload["completion"] = completion
+        codex: Dict[str, object] = {}
+        if self._data.codex_isolate_home:
+            codex["isolate_home"] = True
+        if self._data.codex_fork_strategy != "resume":
+            codex["fork_strategy"] = self._data.codex_fork_strategy
+        if self._data.codex_sticky_workers:
+            codex["sticky_workers"] = True
+        if codex:
+            payload["codex"] = codex
         return payload
 
     def update(
@@ -171,6 +410,22 @@ class SettingsStore:
         commit: Optional[str] = None,
         merge: Optional[str] = None,
         worktree_root: object = _UNSET,
+        worktree_reset: Optional[str] = None,
+        worktree_keep: object = _UNSET,
+        worktree_seed: object = _UNSET,
+        worktree_seed_hardlink: Optional[bool] = None,
+        worktree_sparse: object = _UNSET,
+        worktree_sparse_auto: Optional[bool] = None,
+        worktree_checkout_workers: Optional[int] = None,
+        worker_quorum: object = _UNSET,
+        straggler_grace: object = _UNSET,
+        stream_boss: Optional[bool] = None,
+        boss_shards: Optional[int] = None,
+        boss_top_k: Optional[int] = None,
+        signal_socket: Optional[bool] = None,
+        codex_isolate_home: Optional[bool] = None,
+        codex_fork_strategy: Optional[str] = None,
+        codex_sticky_workers: Optional[bool] = None,
     ) -> None:
         if attach is not None:
             self._data.attach = attach
@@ -188,6 +443,38 @@ class SettingsStore:
             self._data.merge = merge
         if worktree_root is not _UNSET:
             self._data.worktree_root = str(worktree_root) if worktree_root else None
+        if worktree_reset is not None:
+            self._data.worktree_reset = self._normalize_worktree_reset(worktree_reset)
+        if worktree_keep is not _UNSET:
+            self._data.worktree_keep = self._normalize_path_list(worktree_keep)
+        if worktree_seed is not _UNSET:
+            self._data.worktree_seed = self._normalize_path_list(worktree_seed)
+        if worktree_seed_hardlink is not None:
+            self._data.worktree_seed_hardlink = bool(worktree_seed_hardlink)
+        if worktree_sparse is not _UNSET:
+            self._data.worktree_sparse = self._normalize_path_list(worktree_sparse)
+        if worktree_sparse_auto is not None:
+            self._data.worktree_sparse_auto = bool(worktree_sparse_auto)
+        if worktree_checkout_workers is not None:
+            self._data.worktree_checkout_workers = self._normalize_count(worktree_checkout_workers)
+        if worker_quorum is not _UNSET:
+            self._data.worker_quorum = self._normalize_optional_number(worker_quorum, int) or None
+        if straggler_grace is not _UNSET:
+            self._data.straggler_grace = self._normalize_optional_number(straggler_grace, float)
+        if stream_boss is not None:
+            self._data.stream_boss = bool(stream_boss)
+        if boss_shards is not None:
+            self._data.boss_shards = max(1, self._normalize_count(boss_shards))
+        if boss_top_k is not None:
+            self._data.boss_top_k = self._normalize_count(boss_top_k)
+        if signal_socket is not None:
+            self._data.signal_socket = bool(signal_socket)
+        if codex_isolate_home is not None:
+            self._data.codex_isolate_home = bool(codex_isolate_home)
+        if codex_fork_strategy is not None:
+            self._data.codex_fork_strategy = self._normalize_fork_strategy(codex_fork_strategy)
+        if codex_sticky_workers is not None:
+            self._data.codex_sticky_workers = bool(codex_sticky_workers)
         self._save()
 
     def _load(self) -> SettingsData:
@@ -208,6 +495,31 @@ class SettingsStore:
             raw_root = paths_data.get("worktree_root")
             if raw_root:
                 worktree_root_value = str(raw_root)
+        worktrees_data = payload.get("worktrees") if isinstance(payload, dict) else None
+        if not isinstance(worktrees_data, dict):
+            worktrees_data = {}
+        worktree_reset = self._normalize_worktree_reset(worktrees_data.get("reset"))
+        worktree_keep = self._normalize_path_list(worktrees_data.get("keep"))
+        worktree_seed = self._normalize_path_list(worktrees_data.get("seed"))
+        worktree_seed_hardlink = bool(worktrees_data.get("seed_hardlink", False))
+        worktree_sparse = self._normalize_path_list(worktrees_data.get("sparse"))
+        worktree_sparse_auto = bool(worktrees_data.get("sparse_auto", False))
+        worktree_checkout_workers = self._normalize_count(worktrees_data.get("checkout_workers"))
+        completion_data = payload.get("completion") if isinstance(payload, dict) else None
+        if not isinstance(completion_data, dict):
+            completion_data = {}
+        worker_quorum = self._normalize_optional_number(completion_data.get("quorum"), int) or None
+        straggler_grace = self._normalize_optional_number(completion_data.get("grace_seconds"), float)
+        stream_boss = bool(completion_data.get("stream_boss", False))
+        boss_shards = max(1, self._normalize_count(completion_data.get("boss_shards")))
+        boss_top_k = self._normalize_count(completion_data.get("boss_top_k"))
+        signal_socket = bool(completion_data.get("signal_socket", True))
+        codex_data = payload.get("codex") if isinstance(payload, dict) else None
+        if not isinstance(codex_data, dict):
+            codex_data = {}
+        codex_isolate_home = bool(codex_data.get("isolate_home", False))
+        codex_fork_strategy = self._normalize_fork_strategy(codex_data.get("fork_strategy"))
+        codex_sticky_workers = bool(codex_data.get("sticky_workers", False))
         if isinstance(commands, dict):
             return SettingsData(
                 attach=str(commands.get("attach", "auto")),
@@ -218,6 +530,22 @@ class SettingsStore:
                 commit=str(commands.get("commit", "manual")),
                 merge=self._normalize_merge(commands.get("merge")),
                 worktree_root=worktree_root_value,
+                worktree_reset=worktree_reset,
+                worktree_keep=worktree_keep,
+                worktree_seed=worktree_seed,
+                worktree_seed_hardlink=worktree_seed_hardlink,
+                worktree_sparse=worktree_sparse,
+                worktree_sparse_auto=worktree_sparse_auto,
+                worktree_checkout_workers=worktree_checkout_workers,
+                worker_quorum=worker_quorum,
+                straggler_grace=straggler_grace,
+                stream_boss=stream_boss,
+                boss_shards=boss_shards,
+                boss_top_k=boss_top_k,
+                signal_socket=signal_socket,
+                codex_isolate_home=codex_isolate_home,
+                codex_fork_strategy=codex_fork_strategy,
+                codex_sticky_workers=codex_sticky_workers,
             )
 
         # Legacy YAML keys fallback
@@ -230,6 +558,22 @@ class SettingsStore:
             commit="auto" if bool(payload.get("auto_commit", False)) else "manual",
             merge="auto",
             worktree_root=None,
+            worktree_reset=worktree_reset,
+            worktree_keep=worktree_keep,
+            worktree_seed=worktree_seed,
+            worktree_seed_hardlink=worktree_seed_hardlink,
+            worktree_sparse=worktree_sparse,
+            worktree_sparse_auto=worktree_sparse_auto,
+            worktree_checkout_workers=worktree_checkout_workers,
+            worker_quorum=worker_quorum,
+            straggler_grace=straggler_grace,
+            stream_boss=stream_boss,
+            boss_shards=boss_shards,
+            boss_top_k=boss_top_k,
+            signal_socket=signal_socket,
+            codex_isolate_home=codex_isolate_home,
+            codex_fork_strategy=codex_fork_strategy,
+            codex_sticky_workers=codex_sticky_workers,
         )
 
     def _save(self) -> None:
@@ -323,6 +323,9 @@ def test_load_session_recreates_with_session_namespace(tmp_path, monkeypatch):
 
     assert controller._session_namespace == "session-test"
     assert captured_kwargs.get("session_namespace") == "session-test"
+    # サイクル実行時と同じオプション一式で構築する
+    assert set(captured_kwargs) == set(controller._orchestrator_options())
+    assert captured_kwargs.get("isolate_codex_home") is False
     assert dummy_tmux.reuse is True
     assert dummy_tmux.boss_path == boss_path
 
@@ -535,6 +538,20 @@ def test_paused_instruction_broadcast(monkeypatch, tmp_path):
     assert controller._paused is False
 
 
+def test_paused_instruction_skips_boss_shard_panes(monkeypatch, tmp_path):
+    controller = CLIController(event_handler=lambda *_: None, worktree_root=tmp_path)
+    controller._paused = True
+    controller._config.worker_count = 2
+    controller._tmux_list_panes = lambda: ["%0", "%1", "%2", "%3", "%4", "%5"]
+    sent: list[list[str]] = []
+    controller._tmux_send_instruction = lambda panes, instruction: sent.append(list(panes))
+
+    _run_async(controller.handle_input("echo pause"))
+
+    # %4 と %5 はワーカーの後ろに置かれた採点用の Boss ペイン
+    assert sent == [["%2", "%3"]]
+
+
 def test_done_command_forces_completion(monkeypatch, tmp_path):
     events = []
 
@@ -783,6 +800,18 @@ def test_tmux_attach_manager_is_not_attached(monkeypatch):
     assert manager.is_attached("parallel-dev-test") is False
 
 
+def test_tmux_attach_manager_ignores_own_control_client(monkeypatch):
+    manager = TmuxAttachManager()
+
+    def fake_run(command, check=False, stdout=None, stderr=None, text=False):
+        return SimpleNamespace(returncode=0, stdout="1\n", stderr="")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr("parallel_developer.controller.control_client_count", lambda name: 1)
+
+    assert manager.is_attached("parallel-dev-test") is False
+
+
 def test_attach_skips_when_session_missing(monkeypatch, manifest_store, tmp_path):
     events = []
 
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from parallel_developer.services import CodexHomeManager
+
+
+def test_codex_home_links_shared_config(tmp_path: Path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    (shared / "auth.json").write_text("{}", encoding="utf-8")
+    (shared / "prompts").mkdir()
+    homes = CodexHomeManager(tmp_path / "homes", source_home=shared)
+
+    home = homes.home_for("%2")
+
+    assert home == tmp_path / "homes" / "pane-2"
+    assert (home / "sessions").is_dir()
+    assert (home / "auth.json").resolve() == (shared / "auth.json").resolve()
+    assert (home / "prompts").is_dir()
+    assert not (home / "config.toml").exists()
+    assert homes.home_for("%2") is home
+
+
+def test_codex_home_stages_rollout_for_resume(tmp_path: Path):
+    homes = CodexHomeManager(tmp_path / "homes", source_home=tmp_path / "shared")
+    rollout = tmp_path / "codex" / "2025" / "11" / "11" / "rollout-main.jsonl"
+    rollout.parent.mkdir(parents=True)
+    rollout.write_text("meta\n", encoding="utf-8")
+
+    staged = homes.stage_rollout("%3", rollout)
+
+    assert staged == homes.sessions_dir("%3") / "2025" / "11" / "11" / "rollout-main.jsonl"
+    assert staged.read_text(encoding="utf-8") == "meta\n"
+    assert homes.is_staged(staged)
+    assert not homes.is_staged(rollout)
+    # 既にペインの HOME にある rollout は複製しない
+    assert homes.stage_rollout("%3", staged) == staged
+    assert homes.stage_rollout("%3", tmp_path / "missing.jsonl") is None
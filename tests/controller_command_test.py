@@ -364,6 +364,71 @@ def test_settings_store_update_snapshot(tmp_path):
     assert cfg.read_text(encoding="utf-8")
 
 
+def test_settings_store_worktree_reset_policy(tmp_path):
+    cfg = tmp_path / "settings.yaml"
+    cfg.write_text(
+        yaml.safe_dump({"worktrees": {"reset": "keep_cache", "keep": ["node_modules", ".venv"]}}),
+        encoding="utf-8",
+    )
+    store = SettingsStore(cfg)
+    assert store.worktree_reset == "keep_cache"
+    assert store.worktree_keep == ["node_modules", ".venv"]
+
+    store.update(worktree_reset="bogus", worktree_keep=None)
+    data = yaml.safe_load(cfg.read_text(encoding="utf-8"))
+    assert data["worktrees"] == {"reset": "full"}
+
+    store.update(worktree_sparse=["packages/app"], worktree_sparse_auto=True, worktree_checkout_workers="4")
+    store.worktree_seed = ["node_modules"]
+    store.worktree_seed_hardlink = True
+    reloaded = SettingsStore(cfg)
+    assert reloaded.worktree_seed == ["node_modules"]
+    assert reloaded.worktree_seed_hardlink is True
+    assert reloaded.worktree_sparse == ["packages/app"]
+    assert reloaded.worktree_sparse_auto is True
+    assert reloaded.worktree_checkout_workers == 4
+
+
+def test_settings_store_completion_policy(tmp_path):
+    cfg = tmp_path / "settings.yaml"
+    cfg.write_text(
+        yaml.safe_dump(
+            {"completion": {"quorum": 2, "grace_seconds": 90, "stream_boss": True, "boss_shards": 3, "boss_top_k": 2}}
+        ),
+        encoding="utf-8",
+    )
+    store = SettingsStore(cfg)
+    assert store.worker_quorum == 2
+    assert store.straggler_grace == 90.0
+    assert store.stream_boss is True
+    assert (store.boss_shards, store.boss_top_k) == (3, 2)
+    assert store.signal_socket is True
+
+    store.update(worker_quorum=0, straggler_grace=None, stream_boss=False, boss_shards=0, boss_top_k=0)
+    data = yaml.safe_load(cfg.read_text(encoding="utf-8"))
+    assert "completion" not in data
+    assert SettingsStore(cfg).worker_quorum is None
+
+    store.signal_socket = False
+    assert yaml.safe_load(cfg.read_text(encoding="utf-8"))["completion"] == {"signal_socket": False}
+
+
+def test_settings_store_codex_options(tmp_path):
+    cfg = tmp_path / "settings.yaml"
+    cfg.write_text(yaml.safe_dump({"codex": {"isolate_home": True, "fork_strategy": "CLONE"}}), encoding="utf-8")
+    store = SettingsStore(cfg)
+    assert store.codex_isolate_home is True
+    assert store.codex_fork_strategy == "clone"
+    assert store.codex_sticky_workers is False
+
+    store.codex_sticky_workers = True
+    assert yaml.safe_load(cfg.read_text(encoding="utf-8"))["codex"]["sticky_workers"] is True
+    store.update(codex_isolate_home=False, codex_fork_strategy="bogus", codex_sticky_workers=False)
+    assert store.codex_fork_strategy == "resume"
+    assert "codex" not in yaml.safe_load(cfg.read_text(encoding="utf-8"))
+    assert SettingsStore(cfg).codex_isolate_home is False
+
+
 def test_settings_store_legacy_keys(tmp_path):
     cfg = tmp_path / "legacy.yaml"
     cfg.write_text(
@@ -0,0 +1,53 @@
+import threading
+import time
+from pathlib import Path
+
+from parallel_developer.services import FileWatcher
+
+
+def test_file_watcher_wakes_on_file_creation(tmp_path: Path):
+    watcher = FileWatcher(poll_interval=0.01, heartbeat=5.0)
+    flag = tmp_path / "signals" / "worker-1.done"
+    flag.parent.mkdir(parents=True)
+
+    with watcher.watching(files=[flag]) as scope:
+        assert scope.event_driven
+        token = scope.token()
+        # 監視スレッドの起動を待ってからファイルを作成する
+        time.sleep(0.2)
+        threading.Timer(0.05, flag.touch).start()
+        started = time.time()
+        changed = scope.wait(token, timeout=3.0)
+        elapsed = time.time() - started
+
+    assert changed is True
+    assert flag.exists()
+    assert elapsed < 2.0
+    assert not watcher.active
+
+
+def test_file_watcher_falls_back_to_polling(tmp_path: Path):
+    watcher = FileWatcher(poll_interval=0.01, force_polling=True)
+
+    with watcher.watching(dirs=[tmp_path]) as scope:
+        assert not scope.event_driven
+        token = scope.token()
+        started = time.time()
+        assert scope.wait(token, timeout=1.0) is False
+        assert time.time() - started < 0.5
+
+
+def test_file_watcher_missing_directory_uses_polling(tmp_path: Path):
+    watcher = FileWatcher(poll_interval=0.01)
+
+    with watcher.watching(dirs=[tmp_path / "missing"]) as scope:
+        assert not scope.event_driven
+
+
+def test_file_watcher_notify_wakes_waiters(tmp_path: Path):
+    watcher = FileWatcher(poll_interval=0.01, heartbeat=5.0)
+
+    with watcher.watching(dirs=[tmp_path]) as scope:
+        token = scope.token()
+        threading.Timer(0.05, watcher.notify).start()
+        assert scope.wait(token, timeout=3.0) is True
@@ -1,12 +1,14 @@
 import json
+import os
 import threading
 import time
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 import yaml
 
-from parallel_developer.services import CodexMonitor, SessionReservationError
+from parallel_developer.services import CodexHomeManager, CodexMonitor, SessionReservationError
 
 
 def test_monitor_registers_and_logs_instruction(tmp_path: Path):
@@ -529,3 +531,426 @@ def test_await_completion_uses_signal_flags(tmp_path: Path):
 
     assert completion["session-signal"]["done"] is True
     assert "session-signal" not in monitor._active_signal_paths  # type: ignore[attr-defined]
+
+
+def test_wait_for_flag_detects_signal_file(tmp_path: Path):
+    monitor = CodexMonitor(
+        logs_dir=tmp_path,
+        session_map_path=tmp_path / "sessions_map.yaml",
+        codex_sessions_root=tmp_path / "codex",
+        poll_interval=0.01,
+        session_namespace="flag-test",
+    )
+    flag_path = tmp_path / "signals" / "worker-1.done"
+
+    threading.Timer(0.05, flag_path.touch).start()
+    assert monitor.wait_for_flag(flag_path, timeout_seconds=2.0) is True
+    assert monitor.wait_for_flag(tmp_path / "signals" / "never.done", timeout_seconds=0.05) is False
+
+
+def test_session_map_offsets_are_written_behind(tmp_path: Path):
+    session_map = tmp_path / "sessions_map.json"
+    monitor = CodexMonitor(
+        logs_dir=tmp_path,
+        session_map_path=session_map,
+        codex_sessions_root=tmp_path / "codex",
+        poll_interval=0.01,
+        session_namespace="flush-test",
+        flush_interval=3600.0,
+    )
+    rollout = tmp_path / "sessions" / "rollout-flush.jsonl"
+    rollout.write_text("", encoding="utf-8")
+    monitor.register_session(pane_id="pane-flush", session_id="session-flush", rollout_path=rollout)
+    assert json.loads(session_map.read_text(encoding="utf-8"))["sessions"]["session-flush"]["offset"] == 0
+
+    line = json.dumps({"type": "response_item", "payload": {"role": "assistant", "content": [{"type": "output_text", "text": "/done"}]}}) + "\n"
+    rollout.write_text(line, encoding="utf-8")
+    monitor._update_session_offset("session-flush", len(line))  # type: ignore[attr-defined]
+    assert json.loads(session_map.read_text(encoding="utf-8"))["sessions"]["session-flush"]["offset"] == 0
+
+    monitor.flush()
+    mapping = json.loads(session_map.read_text(encoding="utf-8"))
+    assert mapping["sessions"]["session-flush"]["offset"] == len(line)
+    assert mapping["panes"]["pane-flush"]["offset"] == len(line)
+
+
+def test_await_completion_flushes_offsets_without_further_updates(tmp_path: Path):
+    session_map = tmp_path / "sessions_map.json"
+    monitor = CodexMonitor(
+        logs_dir=tmp_path,
+        session_map_path=session_map,
+        codex_sessions_root=tmp_path / "codex",
+        poll_interval=0.01,
+        session_namespace="flush-timer",
+        flush_interval=0.2,
+    )
+    rollout = tmp_path / "sessions" / "rollout-timer.jsonl"
+    rollout.parent.mkdir(parents=True, exist_ok=True)
+    rollout.write_text("", encoding="utf-8")
+    monitor.register_session(pane_id="pane-timer", session_id="session-timer", rollout_path=rollout)
+    line = json.dumps({"type": "response_item", "payload": {"role": "assistant", "content": []}}) + "\n"
+    rollout.write_text(line, encoding="utf-8")
+
+    observed: list[int] = []
+
+    def observe() -> None:
+        time.sleep(0.6)
+        observed.append(json.loads(session_map.read_text(encoding="utf-8"))["sessions"]["session-timer"]["offset"])
+
+    watcher = threading.Thread(target=observe, daemon=True)
+    watcher.start()
+    # 追記が止まっても、待機中に書き出し間隔で読み取り位置が永続化される
+    monitor.await_completion(session_ids=["session-timer"], timeout_seconds=1)
+    watcher.join()
+
+    assert observed == [len(line)]
+
+
+def test_refresh_session_id_runs_concurrently_with_flush(tmp_path: Path):
+    monitor = CodexMonitor(
+        logs_dir=tmp_path,
+        session_map_path=tmp_path / "sessions_map.json",
+        codex_sessions_root=tmp_path / "codex",
+        poll_interval=0.01,
+        session_namespace="rename-flush",
+        flush_interval=0.0,
+    )
+    rollout = tmp_path / "codex" / "2025" / "11" / "11" / "rollout-rename.jsonl"
+    rollout.parent.mkdir(parents=True)
+    rollout.write_text(json.dumps({"type": "session_meta", "payload": {"id": "session-real"}}) + "\n", encoding="utf-8")
+    monitor.register_session(pane_id="%1", session_id="unknown-1", rollout_path=rollout)
+    extra = tmp_path / "codex" / "rollout-extra.jsonl"
+    extra.write_text("", encoding="utf-8")
+
+    errors: list[BaseException] = []
+    blocked: list[bool] = []
+    threads: list[threading.Thread] = []
+    original = monitor._extract_session_meta
+
+    def flusher() -> None:
+        try:
+            monitor.register_session(pane_id="%2", session_id="session-extra", rollout_path=extra)
+            monitor._update_session_offset("session-extra", 1)
+            monitor.flush(force=True)
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    def extract_during_flush(path: Path):
+        # 付け替えの途中で別スレッドが登録と書き出しを行っても、付け替えが終わるまで待たされること
+        thread = threading.Thread(target=flusher, daemon=True)
+        thread.start()
+        thread.join(timeout=0.2)
+        blocked.append(thread.is_alive())
+        threads.append(thread)
+        return original(path)
+
+    monitor._extract_session_meta = extract_during_flush
+    assert monitor.refresh_session_id("unknown-1") == "session-real"
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert errors == []
+    assert blocked == [True]
+    data = json.loads((tmp_path / "sessions_map.json").read_text(encoding="utf-8"))
+    assert set(data["sessions"]) == {"session-real", "session-extra"}
+    assert {pane: entry["session_id"] for pane, entry in data["panes"].items()} == {
+        "%1": "session-real",
+        "%2": "session-extra",
+    }
+    assert data["sessions"]["session-extra"]["offset"] == 1
+
+
+def test_session_map_migrates_legacy_yaml(tmp_path: Path):
+    session_map = tmp_path / "sessions_map.yaml"
+    legacy = {
+        "panes": {"pane-main": {"session_id": "session-main", "rollout_path": "/tmp/r.jsonl", "offset": 3}},
+        "sessions": {"session-main": {"pane_id": "pane-main", "rollout_path": "/tmp/r.jsonl", "offset": 3}},
+    }
+    session_map.write_text(yaml.safe_dump(legacy), encoding="utf-8")
+
+    monitor = CodexMonitor(
+        logs_dir=tmp_path,
+        session_map_path=session_map,
+        codex_sessions_root=tmp_path / "codex",
+        poll_interval=0.01,
+        session_namespace="legacy-test",
+    )
+
+    assert json.loads(session_map.read_text(encoding="utf-8")) == legacy
+    monitor.bind_existing_session(pane_id="pane-new", session_id="session-main")
+    assert json.loads(session_map.read_text(encoding="utf-8"))["panes"]["pane-new"]["session_id"] == "session-main"
+
+
+def test_register_worker_rollouts_matches_panes_by_cwd(tmp_path: Path):
+    codex_root = tmp_path / "codex"
+    codex_root.mkdir()
+    monitor = CodexMonitor(
+        logs_dir=tmp_path / "logs",
+        session_map_path=tmp_path / "sessions_map.json",
+        codex_sessions_root=codex_root,
+        poll_interval=0.01,
+        session_namespace="cwd-test",
+    )
+    baseline = monitor.snapshot_rollouts()
+    pane_paths = {"pane-1": tmp_path / "worker-1", "pane-2": tmp_path / "worker-2"}
+
+    # 無関係な cwd の rollout と、worker-2 の rollout が先に生成されるケース
+    for index, worker in enumerate(("elsewhere", "worker-2", "worker-1")):
+        path = codex_root / "2025" / "11" / "09" / f"rollout-{index}.jsonl"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"type": "session_meta", "payload": {"id": f"session-{worker}", "cwd": str(tmp_path / worker)}})
+            + "\n",
+            encoding="utf-8",
+        )
+        time.sleep(0.01)
+
+    mapping = monitor.register_worker_rollouts(
+        worker_panes=["pane-1", "pane-2"],
+        baseline=baseline,
+        timeout_seconds=1.0,
+        pane_paths=pane_paths,
+    )
+
+    assert mapping == {"pane-1": "session-worker-1", "pane-2": "session-worker-2"}
+
+
+def test_register_worker_rollouts_falls_back_to_order_without_cwd(tmp_path: Path):
+    codex_root = tmp_path / "codex"
+    codex_root.mkdir()
+    monitor = CodexMonitor(
+        logs_dir=tmp_path / "logs",
+        session_map_path=tmp_path / "sessions_map.json",
+        codex_sessions_root=codex_root,
+        poll_interval=0.01,
+        session_namespace="cwd-missing",
+    )
+    baseline = monitor.snapshot_rollouts()
+    path = codex_root / "2025" / "11" / "09" / "rollout-0.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"type": "session_meta", "payload": {"id": "session-a"}}) + "\n", encoding="utf-8")
+
+    mapping = monitor.register_worker_rollouts(
+        worker_panes=["pane-1"],
+        baseline=baseline,
+        timeout_seconds=1.0,
+        pane_paths={"pane-1": tmp_path / "worker-1"},
+    )
+
+    assert mapping == {"pane-1": "session-a"}
+
+
+def test_await_completion_stops_at_quorum_and_grace(tmp_path: Path):
+    monitor = CodexMonitor(
+        logs_dir=tmp_path,
+        session_map_path=tmp_path / "sessions_map.yaml",
+        codex_sessions_root=tmp_path / "codex",
+        poll_interval=0.01,
+        session_namespace="quorum-test",
+    )
+    signals = tmp_path / "signals"
+    signals.mkdir()
+    flags = {}
+    for name in ("a", "b", "c"):
+        rollout = tmp_path / "sessions" / f"rollout-{name}.jsonl"
+        rollout.parent.mkdir(parents=True, exist_ok=True)
+        rollout.write_text("", encoding="utf-8")
+        monitor.register_session(pane_id=f"pane-{name}", session_id=f"session-{name}", rollout_path=rollout)
+        flags[f"session-{name}"] = signals / f"session-{name}.done"
+    flags["session-a"].touch()
+    flags["session-b"].touch()
+
+    started = time.time()
+    completion = monitor.await_completion(
+        session_ids=list(flags),
+        timeout_seconds=5.0,
+        signal_paths=flags,
+        quorum=2,
+    )
+    assert time.time() - started < 2.0
+    assert completion["session-a"]["done"] is True
+    assert completion["session-b"]["done"] is True
+    assert completion["session-c"]["done"] is False
+
+    flags["session-a"].touch()
+    started = time.time()
+    completion = monitor.await_completion(
+        session_ids=["session-a", "session-c"],
+        timeout_seconds=5.0,
+        signal_paths={key: flags[key] for key in ("session-a", "session-c")},
+        grace_seconds=0.1,
+    )
+    assert time.time() - started < 2.0
+    assert completion["session-a"]["done"] is True
+    assert completion["session-c"]["done"] is False
+
+
+def test_await_completion_reports_each_completion(tmp_path: Path):
+    monitor = CodexMonitor(
+        logs_dir=tmp_path,
+        session_map_path=tmp_path / "sessions_map.yaml",
+        codex_sessions_root=tmp_path / "codex",
+        poll_interval=0.01,
+        session_namespace="stream-test",
+    )
+    flags = {}
+    for name in ("a", "b"):
+        rollout = tmp_path / "sessions" / f"rollout-{name}.jsonl"
+        rollout.parent.mkdir(parents=True, exist_ok=True)
+        rollout.write_text("", encoding="utf-8")
+        monitor.register_session(pane_id=f"pane-{name}", session_id=f"session-{name}", rollout_path=rollout)
+        flags[f"session-{name}"] = tmp_path / f"session-{name}.done"
+    flags["session-a"].touch()
+    seen = []
+
+    def on_complete(session_id, entry):
+        seen.append((session_id, entry["done"]))
+        if session_id == "session-a":
+            flags["session-b"].touch()
+
+    completion = monitor.await_completion(
+        session_ids=list(flags),
+        timeout_seconds=5.0,
+        signal_paths=flags,
+        on_complete=on_complete,
+    )
+
+    assert seen == [("session-a", True), ("session-b", True)]
+    assert all(entry["done"] for entry in completion.values())
+
+
+def test_register_worker_rollouts_attributes_by_pane_home(tmp_path: Path):
+    homes = CodexHomeManager(tmp_path / "codex-homes", source_home=tmp_path / "shared")
+    monitor = CodexMonitor(
+        logs_dir=tmp_path,
+        session_map_path=tmp_path / "sessions_map.yaml",
+        codex_sessions_root=tmp_path / "codex",
+        poll_interval=0.01,
+        session_namespace="isolated-workers",
+        codex_homes=homes,
+    )
+    base = tmp_path / "codex" / "2025" / "11" / "11" / "rollout-2025-11-11T00-00-00-session-main.jsonl"
+    base.parent.mkdir(parents=True, exist_ok=True)
+    base.write_text(json.dumps({"type": "session_meta", "payload": {"id": "session-main"}}) + "\n", encoding="utf-8")
+
+    baseline = monitor.snapshot_rollouts()
+    # resume 用に複製した元 rollout は新規セッションとして扱わない
+    for pane_id in ("%2", "%3"):
+        homes.stage_rollout(pane_id, base)
+
+    def create(pane_id: str, session_id: str, delay: float) -> None:
+        time.sleep(delay)
+        path = homes.sessions_dir(pane_id) / "2025" / "11" / "11" / f"rollout-{session_id}.jsonl"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"type": "session_meta", "payload": {"id": session_id}}) + "\n", encoding="utf-8")
+
+    # 後ろのペインが先に rollout を作っても、置き場所でペインが決まる
+    threading.Thread(target=create, args=("%3", "session-worker-2", 0.0), daemon=True).start()
+    threading.Thread(target=create, args=("%2", "session-worker-1", 0.1), daemon=True).start()
+    mapping = monitor.register_worker_rollouts(
+        worker_panes=["%2", "%3"],
+        baseline=baseline,
+        timeout_seconds=2.0,
+    )
+
+    assert mapping == {"%2": "session-worker-1", "%3": "session-worker-2"}
+    assert monitor.rollout_path("session-main") == base
+
+
+def test_snapshot_rollouts_tracks_todays_partition_in_each_pane_home(tmp_path: Path):
+    homes = CodexHomeManager(tmp_path / "codex-homes", source_home=tmp_path / "shared")
+    monitor = CodexMonitor(
+        logs_dir=tmp_path,
+        session_map_path=tmp_path / "sessions_map.yaml",
+        codex_sessions_root=tmp_path / "codex",
+        poll_interval=0.01,
+        session_namespace="pane-home-snapshot",
+        codex_homes=homes,
+    )
+    today = datetime.now(timezone.utc)
+    partition = homes.sessions_dir("%2") / f"{today.year:04d}" / f"{today.month:02d}" / f"{today.day:02d}"
+    partition.mkdir(parents=True)
+    existing = partition / "rollout-existing.jsonl"
+    existing.write_text("", encoding="utf-8")
+
+    def age() -> None:
+        # 直近更新扱いで毎回読まれることがないよう、codex-homes までの mtime を戻す
+        for path in [partition, *partition.parents][:6]:
+            os.utime(path, (time.time() - 3600, time.time() - 3600))
+
+    age()
+    assert existing in monitor.snapshot_rollouts()
+
+    created = partition / "rollout-created.jsonl"
+    created.write_text("", encoding="utf-8")
+    age()
+
+    # 全体走査を待たなくても、各ペイン HOME の当日の階層は毎回確認される
+    assert set(monitor.snapshot_rollouts()) >= {existing, created}
+
+
+def test_bind_existing_session_follows_rollout_staged_into_pane_home(tmp_path: Path):
+    homes = CodexHomeManager(tmp_path / "codex-homes", source_home=tmp_path / "shared")
+    monitor = CodexMonitor(
+        logs_dir=tmp_path,
+        session_map_path=tmp_path / "sessions_map.yaml",
+        codex_sessions_root=tmp_path / "codex",
+        poll_interval=0.01,
+        session_namespace="staged-rollout",
+        codex_homes=homes,
+    )
+    worker = homes.sessions_dir("%3") / "2025" / "11" / "11" / "rollout-session-worker.jsonl"
+    worker.parent.mkdir(parents=True, exist_ok=True)
+    worker.write_text(json.dumps({"type": "session_meta", "payload": {"id": "session-worker"}}) + "\n", encoding="utf-8")
+    monitor.register_session(pane_id="%3", session_id="session-worker", rollout_path=worker)
+
+    # 採択後にメインペインで resume すると、メインの HOME へ複製した rollout に追記される
+    staged = homes.stage_rollout("%1", monitor.rollout_path("session-worker"))
+    monitor.bind_existing_session(pane_id="%1", session_id="session-worker")
+
+    assert monitor.rollout_path("session-worker") == staged
+    assert monitor._load_map()["panes"]["%1"]["rollout_path"] == str(staged)
+
+    def append() -> None:
+        time.sleep(0.1)
+        with staged.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps({"type": "response_item", "payload": {"role": "user"}}) + "\n")
+
+    threading.Thread(target=append, daemon=True).start()
+    start = time.time()
+    monitor.wait_for_rollout_activity("session-worker", timeout_seconds=2.0)
+    assert time.time() - start < 1.5
+    assert monitor._load_map()["sessions"]["session-worker"]["offset"] == staged.stat().st_size
+
+
+def test_clone_worker_sessions_writes_rollouts_with_new_ids(tmp_path: Path):
+    codex_root = tmp_path / "codex"
+    monitor = CodexMonitor(
+        logs_dir=tmp_path,
+        session_map_path=tmp_path / "sessions_map.yaml",
+        codex_sessions_root=codex_root,
+        poll_interval=0.01,
+        session_namespace="clone-workers",
+    )
+    base = codex_root / "2025" / "11" / "11" / "rollout-main.jsonl"
+    base.parent.mkdir(parents=True, exist_ok=True)
+    meta = {"type": "session_meta", "payload": {"id": "session-main", "cwd": "/repo"}}
+    message = {"type": "response_item", "payload": {"role": "assistant", "content": [{"type": "output_text", "text": "ok"}]}}
+    base.write_text(json.dumps(meta) + "\n" + json.dumps(message) + "\n" + '{"partial', encoding="utf-8")
+    monitor.register_session(pane_id="pane-main", session_id="session-main", rollout_path=base)
+
+    fork_map = monitor.clone_worker_sessions(
+        base_session_id="session-main",
+        worker_panes=["pane-1", "pane-2"],
+        pane_paths={"pane-1": Path("/repo/worker-1"), "pane-2": Path("/repo/worker-2")},
+    )
+
+    assert set(fork_map) == {"pane-1", "pane-2"}
+    assert len(set(fork_map.values()) | {"session-main"}) == 3
+    for index, (pane_id, session_id) in enumerate(fork_map.items(), start=1):
+        path = monitor.rollout_path(session_id)
+        assert path.name.endswith(f"-{session_id}.jsonl")
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["payload"] == {"id": session_id, "cwd": f"/repo/worker-{index}"}
+        assert json.loads(lines[1]) == message
@@ -1,4 +1,5 @@
 import json
+import threading
 from pathlib import Path
 from typing import Any, List, Mapping
 from unittest.mock import Mock, call
@@ -157,12 +158,20 @@ def test_orchestrator_runs_happy_path(dependencies):
         base_session_id="session-main",
         pane_paths=expected_worker_paths,
     )
-    worker_calls = send_calls[1:4]
-    assert len(worker_calls) == 3
-    for idx, call in enumerate(worker_calls, start=1):
-        assert call.kwargs["pane_id"] == f"pane-worker-{idx}"
-        message = call.kwargs["instruction"]
+    tmux.send_instruction_to_panes.assert_called_once()
+    worker_batch = tmux.send_instruction_to_panes.call_args.kwargs
+    assert worker_batch["pane_ids"] == ["pane-worker-1", "pane-worker-2", "pane-worker-3"]
+    assert worker_batch["instruction"] == dependencies["instruction"]
+    for idx, pane_id in enumerate(worker_batch["pane_ids"], start=1):
+        header = worker_batch["headers"][pane_id]
+        footer = worker_batch["footers"][pane_id]
+        message = header + worker_batch["instruction"] + footer
+        assert f"You are worker-{idx}." in message
         worker_path = expected_worker_paths[f"pane-worker-{idx}"]
+        # 後置文は本文を含まず、作業場所の案内と完了手順だけで構成される
+        assert footer.startswith(orchestrator._worktree_location_notice(custom_path=worker_path).rstrip())
+        assert footer.endswith("keep working.")
+        assert worker_batch["instruction"] not in footer
         assert str(worker_path) in message
         assert dependencies["instruction"] in message
         assert "Completion protocol" in message
@@ -477,8 +486,11 @@ def test_orchestrator_handles_worker_continuation(dependencies):
 
     assert monitor.await_completion.call_count == 2
     # second batch of worker instructions comes from continuation
-    continuation_calls = [call for call in tmux.send_instruction_to_pane.call_args_list if call.kwargs.get("instruction") == "追記して"]
+    continuation_calls = [
+        call for call in tmux.send_instruction_to_panes.call_args_list if call.kwargs.get("instruction") == "追記して"
+    ]
     assert continuation_calls
+    assert continuation_calls[0].kwargs["pane_ids"] == ["pane-worker-1", "pane-worker-2", "pane-worker-3"]
     # prepare_for_instruction is not re-issued during continuation to avoid extra Ctrl+C
     prepare_calls = [call.kwargs for call in tmux.prepare_for_instruction.call_args_list]
     assert prepare_calls == [
@@ -556,6 +568,13 @@ def test_ensure_done_directive_always_appends(dependencies):
     ensured_again = orchestrator._ensure_done_directive(ensured)
     assert ensured_again == ensured
 
+    # ワーカー向けの後置文は案内と完了手順を個別に受け取り、連結すると全文と一致する
+    notice, directive = orchestrator._done_directive_parts(instruction, completion_flag=Path("/tmp/flag.done"))
+    assert notice.startswith("\n\nBefore you make any edits:")
+    assert directive.startswith("\n\nCompletion protocol:")
+    assert instruction + notice + directive == flagged
+    assert orchestrator._done_directive_parts(flagged, completion_flag=Path("/tmp/flag.done")) == ("", "")
+
 
 def test_orchestrator_skip_boss_mode(dependencies):
     tmux = dependencies["tmux"]
@@ -718,3 +737,393 @@ def test_rewrite_mode_sends_followup_prompt(dependencies):
     assert len(boss_calls) >= 2
     assert "Boss integration phase" in boss_calls[1]
     assert "touch" in boss_calls[1]
+
+
+def test_orchestrator_prepares_worktrees_while_main_session_starts(dependencies):
+    tmux = dependencies["tmux"]
+    worktree = dependencies["worktree"]
+    prepared = worktree.prepare.return_value
+    main_launched = threading.Event()
+    order: List[str] = []
+
+    def prepare(**_kwargs):
+        # メインセッションの起動を待ってから返すことで、両者が並行していることを確かめる
+        assert main_launched.wait(timeout=5)
+        order.append("prepare")
+        return prepared
+
+    worktree.prepare.side_effect = prepare
+    tmux.launch_main_session.side_effect = lambda **_: (order.append("launch"), main_launched.set())
+    tmux.fork_workers.side_effect = lambda **_: (order.append("fork"), ["pane-worker-1", "pane-worker-2", "pane-worker-3"])[1]
+    orchestrator = Orchestrator(
+        tmux_manager=tmux,
+        worktree_manager=worktree,
+        monitor=dependencies["monitor"],
+        log_manager=dependencies["logger"],
+        worker_count=3,
+        session_name="parallel-dev",
+        boss_mode=BossMode.SCORE,
+    )
+
+    orchestrator.run_cycle(
+        dependencies["instruction"],
+        selector=lambda candidates, scoreboard=None: SelectionDecision(selected_key="worker-1", scores={}),
+    )
+
+    assert order == ["launch", "prepare", "fork"]
+    worktree.prepare.assert_called_once_with(instruction=dependencies["instruction"])
+
+
+def test_orchestrator_interrupts_stragglers_after_quorum(dependencies):
+    tmux = dependencies["tmux"]
+    monitor = dependencies["monitor"]
+    monitor.await_completion.side_effect = [
+        {
+            "session-worker-1": {"done": True},
+            "session-worker-2": {"done": True},
+            "session-worker-3": {"done": False},
+        },
+    ]
+    orchestrator = Orchestrator(
+        tmux_manager=tmux,
+        worktree_manager=dependencies["worktree"],
+        monitor=monitor,
+        log_manager=dependencies["logger"],
+        worker_count=3,
+        session_name="parallel-dev",
+        boss_mode=BossMode.SCORE,
+        worker_quorum=2,
+        straggler_grace=30.0,
+    )
+
+    result = orchestrator.run_cycle(
+        dependencies["instruction"],
+        selector=lambda candidates, scoreboard=None: SelectionDecision(selected_key="worker-1", scores={}),
+    )
+
+    worker_call = monitor.await_completion.call_args_list[0]
+    assert worker_call.kwargs["quorum"] == 2
+    assert worker_call.kwargs["grace_seconds"] == 30.0
+    tmux.interrupt_pane.assert_any_call(pane_id="pane-worker-3")
+    assert call(pane_id="pane-worker-1") not in tmux.interrupt_pane.call_args_list
+    assert result.sessions_summary["worker-3"]["interrupted"] is True
+    boss_instruction = tmux.send_instruction_to_pane.call_args_list[-1].kwargs["instruction"]
+    assert "worker-2" in boss_instruction
+    assert "worker-3" not in boss_instruction
+
+
+def test_orchestrator_streams_boss_reviews_as_workers_finish(dependencies):
+    tmux = dependencies["tmux"]
+    monitor = dependencies["monitor"]
+    monitor.poll_interval = 0.01
+    fork_map = dependencies["fork_map"]
+    boss_state = {"raw": None}
+    boss_messages: List[str] = []
+
+    def send_instruction(*, pane_id, instruction):
+        if pane_id != "pane-boss":
+            return
+        boss_messages.append(instruction)
+        names = [name for name in ("worker-1", "worker-2", "worker-3") if f"- {name} (" in instruction]
+        boss_state["raw"] = json.dumps({"scores": {name: {"score": 50 + len(boss_messages), "comment": name} for name in names}})
+
+    def await_completion(*, session_ids, signal_paths, on_complete=None, **_kwargs):
+        completion = {}
+        for session_id in session_ids:
+            completion[session_id] = {"done": True}
+            # Boss は最初の完了時点で fork され、残りのワーカーはまだ走っている
+            assert tmux.fork_boss.called is (session_id != "session-worker-1")
+            on_complete(session_id, completion[session_id])
+        return completion
+
+    tmux.send_instruction_to_pane.side_effect = send_instruction
+    monitor.await_completion.side_effect = await_completion
+    monitor.get_last_assistant_message.side_effect = lambda _sid: boss_state["raw"]
+    orchestrator = Orchestrator(
+        tmux_manager=tmux,
+        worktree_manager=dependencies["worktree"],
+        monitor=monitor,
+        log_manager=dependencies["logger"],
+        worker_count=3,
+        session_name="parallel-dev",
+        boss_mode=BossMode.SCORE,
+        stream_boss=True,
+        prefork_boss=False,
+    )
+
+    result = orchestrator.run_cycle(
+        dependencies["instruction"],
+        selector=lambda candidates, scoreboard=None: SelectionDecision(selected_key="worker-1", scores={}),
+    )
+
+    tmux.fork_boss.assert_called_once()
+    assert len(boss_messages) == 3
+    assert "Other workers are still running" in boss_messages[0]
+    assert "- worker-1 (" in boss_messages[0] and "- worker-2 (" not in boss_messages[0]
+    assert "additional candidates" in boss_messages[1] and "- worker-2 (" in boss_messages[1]
+    assert "- worker-3 (" in boss_messages[2]
+    summary = result.sessions_summary
+    assert [summary[name]["score"] for name in ("worker-1", "worker-2", "worker-3")] == [51.0, 52.0, 53.0]
+    assert summary["worker-1"]["session_id"] == fork_map["pane-worker-1"]
+
+
+def test_orchestrator_preforks_boss_while_workers_run(dependencies):
+    tmux = dependencies["tmux"]
+    monitor = dependencies["monitor"]
+    boss_forked = threading.Event()
+    tmux.fork_boss.side_effect = lambda **_: boss_forked.set()
+
+    def await_completion(*, session_ids, signal_paths, **_kwargs):
+        # Boss の起動はワーカー待機中に裏で進む
+        assert boss_forked.wait(timeout=5)
+        return {session_id: {"done": True} for session_id in session_ids}
+
+    monitor.await_completion.side_effect = await_completion
+    orchestrator = Orchestrator(
+        tmux_manager=tmux,
+        worktree_manager=dependencies["worktree"],
+        monitor=monitor,
+        log_manager=dependencies["logger"],
+        worker_count=3,
+        session_name="parallel-dev",
+        boss_mode=BossMode.SCORE,
+    )
+
+    result = orchestrator.run_cycle(
+        dependencies["instruction"],
+        selector=lambda candidates, scoreboard=None: SelectionDecision(selected_key="worker-1", scores={}),
+    )
+
+    tmux.fork_boss.assert_called_once()
+    boss_registrations = [
+        entry for entry in monitor.register_new_rollout.call_args_list if entry.kwargs.get("pane_id") == "pane-boss"
+    ]
+    assert len(boss_registrations) == 1
+    assert tmux.send_instruction_to_pane.call_args_list[-1].kwargs["pane_id"] == "pane-boss"
+    assert result.artifact.boss_session_id == "session-boss"
+
+
+def test_orchestrator_shards_boss_scoring_and_rescores_top_k(dependencies):
+    tmux = dependencies["tmux"]
+    monitor = dependencies["monitor"]
+    monitor.poll_interval = 0.01
+    tmux.ensure_layout.return_value = {
+        **tmux.ensure_layout.return_value,
+        "boss_shards": ["pane-boss-2"],
+    }
+    monitor.snapshot_rollouts.side_effect = [{}, {}, {}, {}]
+    monitor.register_new_rollout.side_effect = ["session-main", "session-boss", "session-boss-2"]
+    replies = {"session-boss": None, "session-boss-2": None}
+    boss_messages = {"pane-boss": [], "pane-boss-2": []}
+
+    def send_instruction(*, pane_id, instruction):
+        if pane_id not in boss_messages:
+            return
+        boss_messages[pane_id].append(instruction)
+        if pane_id == "pane-boss-2":
+            scores = {"worker-2": {"score": 80, "comment": "b"}}
+        elif len(boss_messages[pane_id]) == 1:
+            scores = {"worker-1": {"score": 70, "comment": "a"}, "worker-3": {"score": 90, "comment": "c"}}
+        else:
+            scores = {"worker-2": {"score": 85, "comment": "final"}, "worker-3": {"score": 60, "comment": "final"}}
+        replies["session-boss" if pane_id == "pane-boss" else "session-boss-2"] = json.dumps({"scores": scores})
+
+    tmux.send_instruction_to_pane.side_effect = send_instruction
+    monitor.get_last_assistant_message.side_effect = lambda session_id: replies.get(session_id)
+    orchestrator = Orchestrator(
+        tmux_manager=tmux,
+        worktree_manager=dependencies["worktree"],
+        monitor=monitor,
+        log_manager=dependencies["logger"],
+        worker_count=3,
+        session_name="parallel-dev",
+        boss_mode=BossMode.SCORE,
+        boss_top_k=2,
+    )
+
+    result = orchestrator.run_cycle(
+        dependencies["instruction"],
+        selector=lambda candidates, scoreboard=None: SelectionDecision(selected_key="worker-2", scores={}),
+    )
+
+    assert [entry.kwargs["pane_id"] for entry in tmux.fork_boss.call_args_list] == ["pane-boss", "pane-boss-2"]
+    primary, final_round = boss_messages["pane-boss"]
+    assert "- worker-1 (" in primary and "- worker-3 (" in primary and "- worker-2 (" not in primary
+    assert "reviewer 1 of 2" in primary
+    assert "- worker-2 (" in boss_messages["pane-boss-2"][0]
+    assert "Boss final round" in final_round and "- worker-1 (" not in final_round
+    summary = result.sessions_summary
+    assert [summary[name]["score"] for name in ("worker-1", "worker-2", "worker-3")] == [59.0, 85.0, 60.0]
+
+
+def test_orchestrator_clone_strategy_skips_rollout_discovery(dependencies):
+    tmux = dependencies["tmux"]
+    monitor = dependencies["monitor"]
+    monitor.clone_worker_sessions.return_value = dependencies["fork_map"]
+    orchestrator = Orchestrator(
+        tmux_manager=tmux,
+        worktree_manager=dependencies["worktree"],
+        monitor=monitor,
+        log_manager=dependencies["logger"],
+        worker_count=3,
+        session_name="parallel-dev",
+        boss_mode=BossMode.SCORE,
+        fork_strategy="clone",
+    )
+
+    result = orchestrator.run_cycle(
+        dependencies["instruction"],
+        selector=lambda candidates, scoreboard=None: SelectionDecision(selected_key="worker-1", scores={}),
+    )
+
+    clone_kwargs = monitor.clone_worker_sessions.call_args.kwargs
+    assert clone_kwargs["base_session_id"] == "session-main"
+    assert clone_kwargs["worker_panes"] == ["pane-worker-1", "pane-worker-2", "pane-worker-3"]
+    tmux.resume_workers.assert_called_once()
+    assert tmux.resume_workers.call_args.kwargs["sessions"] == dependencies["fork_map"]
+    tmux.fork_workers.assert_not_called()
+    monitor.register_worker_rollouts.assert_not_called()
+    worker_wait = monitor.await_completion.call_args_list[0].kwargs
+    assert sorted(worker_wait["session_ids"]) == sorted(dependencies["fork_map"].values())
+    assert result.selected_session == "session-worker-1"
+
+
+def test_orchestrator_clone_strategy_falls_back_to_resume(dependencies):
+    monitor = dependencies["monitor"]
+    monitor.clone_worker_sessions.side_effect = FileNotFoundError("missing rollout")
+    logs: List[str] = []
+    orchestrator = Orchestrator(
+        tmux_manager=dependencies["tmux"],
+        worktree_manager=dependencies["worktree"],
+        monitor=monitor,
+        log_manager=dependencies["logger"],
+        worker_count=3,
+        session_name="parallel-dev",
+        boss_mode=BossMode.SCORE,
+        log_hook=logs.append,
+        fork_strategy="clone",
+    )
+
+    orchestrator.run_cycle(
+        dependencies["instruction"],
+        selector=lambda candidates, scoreboard=None: SelectionDecision(selected_key="worker-1", scores={}),
+    )
+
+    dependencies["tmux"].fork_workers.assert_called_once()
+    dependencies["tmux"].resume_workers.assert_not_called()
+    monitor.register_worker_rollouts.assert_called_once()
+    assert any(line.startswith("[fork]") for line in logs)
+
+
+def test_orchestrator_keeps_unselected_workers_across_cycles(dependencies, monkeypatch):
+    tmux = dependencies["tmux"]
+    monitor = dependencies["monitor"]
+    tmux.fork_workers.side_effect = lambda **kwargs: list(kwargs["workers"])
+    monitor.snapshot_rollouts.side_effect = None
+    monitor.snapshot_rollouts.return_value = {}
+    monitor.register_new_rollout.side_effect = (
+        lambda **kwargs: "session-main" if kwargs["pane_id"] == "pane-main" else "session-boss"
+    )
+    monitor.await_completion.side_effect = lambda *, session_ids, **_kwargs: {sid: {"done": True} for sid in session_ids}
+    monitor.register_worker_rollouts.side_effect = [
+        dependencies["fork_map"],
+        {"pane-worker-1": "session-worker-1b"},
+    ]
+    orchestrator = Orchestrator(
+        tmux_manager=tmux,
+        worktree_manager=dependencies["worktree"],
+        monitor=monitor,
+        log_manager=dependencies["logger"],
+        worker_count=3,
+        session_name="parallel-dev",
+        boss_mode=BossMode.SCORE,
+        merge_mode=MergeMode.AUTO,
+        prefork_boss=False,
+        sticky_workers=True,
+    )
+    monkeypatch.setattr(orchestrator, "_run_host_pipeline", lambda selected: None)
+
+    def selector(candidates, scoreboard=None):
+        return SelectionDecision(selected_key="worker-1", scores={})
+
+    orchestrator.run_cycle(dependencies["instruction"], selector=selector)
+    second = orchestrator.run_cycle("Follow-up", selector=selector, resume_session_id="session-worker-1")
+
+    # 採択されたペインだけを fork し直し、他のワーカーは前回のセッションで続行する
+    assert tmux.fork_workers.call_args.kwargs["workers"] == ["pane-worker-1"]
+    assert monitor.register_worker_rollouts.call_args.kwargs["worker_panes"] == ["pane-worker-1"]
+    assert second.artifact.worker_sessions == {
+        "worker-1": "session-worker-1b",
+        "worker-2": "session-worker-2",
+        "worker-3": "session-worker-3",
+    }
+    headers = tmux.send_instruction_to_panes.call_args_list[-1].kwargs["headers"]
+    assert headers["pane-worker-2"].startswith("Sync: worker-1 was selected")
+    assert headers["pane-worker-3"].startswith("Sync: worker-1 was selected")
+    assert headers["pane-worker-1"].startswith("You are worker-1.")
+
+
+def test_orchestrator_does_not_keep_interrupted_or_forced_workers(dependencies, monkeypatch):
+    tmux = dependencies["tmux"]
+    monitor = dependencies["monitor"]
+    tmux.fork_workers.side_effect = lambda **kwargs: list(kwargs["workers"])
+    monitor.snapshot_rollouts.side_effect = None
+    monitor.snapshot_rollouts.return_value = {}
+    monitor.register_new_rollout.side_effect = (
+        lambda **kwargs: "session-main" if kwargs["pane_id"] == "pane-main" else "session-boss"
+    )
+    status = {
+        "session-worker-1": {"done": True},
+        "session-worker-2": {"done": True},
+        "session-worker-3": {"done": False, "interrupted": True},
+    }
+    monitor.await_completion.side_effect = (
+        lambda *, session_ids, **_kwargs: {sid: dict(status.get(sid, {"done": True})) for sid in session_ids}
+    )
+    orchestrator = Orchestrator(
+        tmux_manager=tmux,
+        worktree_manager=dependencies["worktree"],
+        monitor=monitor,
+        log_manager=dependencies["logger"],
+        worker_count=3,
+        session_name="parallel-dev",
+        boss_mode=BossMode.SCORE,
+        merge_mode=MergeMode.AUTO,
+        prefork_boss=False,
+        sticky_workers=True,
+    )
+    monkeypatch.setattr(orchestrator, "_run_host_pipeline", lambda selected: None)
+
+    orchestrator.run_cycle(
+        dependencies["instruction"],
+        selector=lambda candidates, scoreboard=None: SelectionDecision(selected_key="worker-1", scores={}),
+    )
+
+    # 中断したワーカーは持ち越さず、持ち越すセッションは読み取り位置と強制完了の印を整理する
+    assert orchestrator._sticky.sessions == {"pane-worker-2": "session-worker-2"}
+    monitor.consume_session_until_eof.assert_called_with("session-worker-2")
+    monitor.clear_forced_completion.assert_called_once_with(["session-worker-2"])
+
+
+def test_orchestrator_announces_signal_socket(dependencies, monkeypatch, tmp_path):
+    monitor = dependencies["monitor"]
+    orchestrator = Orchestrator(
+        tmux_manager=dependencies["tmux"],
+        worktree_manager=dependencies["worktree"],
+        monitor=monitor,
+        log_manager=dependencies["logger"],
+        worker_count=1,
+        session_name="parallel-dev",
+    )
+    monkeypatch.setattr(orchestrator, "_signal_base_dir", lambda namespace: tmp_path)
+
+    bundle = orchestrator._prepare_signal_paths(["worker-1"])
+    flag = bundle.worker_flags["worker-1"]
+    message = orchestrator._ensure_done_directive("Task", completion_flag=flag)
+    orchestrator._on_signal(flag)
+    orchestrator._cleanup_signal_paths()
+
+    assert bundle.socket is not None
+    assert f"sibyl-signal --socket {bundle.socket} {flag} || touch {flag}" in message
+    monitor.notify_signal.assert_called_once()
+    assert not bundle.socket.exists()
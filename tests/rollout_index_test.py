@@ -0,0 +1,111 @@
+import os
+from datetime import datetime
+from pathlib import Path
+
+from parallel_developer.services import RolloutIndex
+from parallel_developer.services import rollout_index as rollout_index_module
+
+
+def _age(path: Path, seconds: float = 3600.0) -> None:
+    stat = path.stat()
+    os.utime(path, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+
+def test_rollout_index_detects_new_partitions_and_files(tmp_path: Path):
+    root = tmp_path / "sessions"
+    old_day = root / "2024" / "01" / "02"
+    old_day.mkdir(parents=True)
+    existing = old_day / "rollout-a.jsonl"
+    existing.write_text("", encoding="utf-8")
+    (old_day / "notes.txt").write_text("", encoding="utf-8")
+
+    index = RolloutIndex(root)
+    assert set(index.snapshot()) == {existing}
+
+    new_day = root / "2024" / "01" / "03"
+    new_day.mkdir()
+    created = new_day / "rollout-b.jsonl"
+    created.write_text("", encoding="utf-8")
+    assert set(index.snapshot()) == {existing, created}
+
+    created.unlink()
+    assert set(index.snapshot()) == {existing}
+
+
+def test_rollout_index_skips_unchanged_partitions(tmp_path: Path, monkeypatch):
+    root = tmp_path / "sessions"
+    for day in ("01", "02", "03"):
+        partition = root / "2024" / "01" / day
+        partition.mkdir(parents=True)
+        (partition / f"rollout-{day}.jsonl").write_text("", encoding="utf-8")
+    for directory in sorted(root.rglob("*"), reverse=True) + [root]:
+        if directory.is_dir():
+            _age(directory)
+
+    index = RolloutIndex(root, full_rescan_interval=3600.0)
+    assert len(index.snapshot()) == 3
+
+    scanned = []
+    statted = []
+    original_scandir = rollout_index_module.os.scandir
+    original_stat = rollout_index_module.os.stat
+
+    def tracking_scandir(path):
+        scanned.append(Path(path))
+        return original_scandir(path)
+
+    def tracking_stat(path, *args, **kwargs):
+        statted.append(Path(path))
+        return original_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(rollout_index_module.os, "scandir", tracking_scandir)
+    monkeypatch.setattr(rollout_index_module.os, "stat", tracking_stat)
+    assert len(index.snapshot()) == 3
+    assert scanned == []
+    # 過去の日付階層は差分確認では stat もしない
+    assert not any(path.is_relative_to(root / "2024") for path in statted)
+
+    # 過去の日付階層への追加は定期的な全体走査で拾う
+    added = root / "2024" / "01" / "02" / "rollout-late.jsonl"
+    added.write_text("", encoding="utf-8")
+    assert added not in index.snapshot()
+    index.full_rescan_interval = 0.0
+    assert added in index.snapshot()
+    assert scanned == [root / "2024" / "01" / "02"]
+
+
+def test_rollout_index_refreshes_mtimes_of_todays_rollouts(tmp_path: Path):
+    root = tmp_path / "sessions"
+    today = datetime.now()
+    partition = root / f"{today.year:04d}" / f"{today.month:02d}" / f"{today.day:02d}"
+    partition.mkdir(parents=True)
+    rollout = partition / "rollout-live.jsonl"
+    rollout.write_text("", encoding="utf-8")
+    _age(rollout)
+
+    index = RolloutIndex(root, full_rescan_interval=3600.0)
+    first = index.snapshot()[rollout]
+
+    with rollout.open("a", encoding="utf-8") as fh:
+        fh.write("{}\n")
+    os.utime(rollout, (first + 10, first + 10))
+    assert index.snapshot()[rollout] == first + 10
+
+
+def test_rollout_index_refresh_returns_independent_copies(tmp_path: Path):
+    root = tmp_path / "sessions"
+    day = root / "2024" / "01" / "02"
+    day.mkdir(parents=True)
+    first = day / "rollout-a.jsonl"
+    first.write_text("", encoding="utf-8")
+
+    index = RolloutIndex(root, full_rescan_interval=0.0)
+    before = index.refresh()
+    (day / "rollout-b.jsonl").write_text("", encoding="utf-8")
+    after = index.refresh()
+
+    # 別スレッドの refresh で手元の結果が書き換わらない
+    assert set(before) == {first}
+    assert len(after) == 2
+    before.clear()
+    assert len(index.snapshot()) == 2
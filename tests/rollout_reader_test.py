@@ -0,0 +1,81 @@
+import json
+from pathlib import Path
+
+from parallel_developer.services import AssistantMessageEvent, RolloutReader, SessionMetaEvent
+
+
+def _assistant_line(text: str) -> str:
+    return json.dumps(
+        {
+            "type": "response_item",
+            "payload": {"role": "assistant", "content": [{"type": "output_text", "text": text}]},
+        }
+    )
+
+
+def test_rollout_reader_buffers_partial_line(tmp_path: Path):
+    rollout = tmp_path / "rollout.jsonl"
+    meta = json.dumps({"type": "session_meta", "payload": {"id": "session-1"}}) + "\n"
+    done_line = _assistant_line("finished\n/done") + "\n"
+    rollout.write_text(meta + done_line[:20], encoding="utf-8")
+
+    reader = RolloutReader(rollout)
+    events = reader.read()
+    assert events == [SessionMetaEvent(offset=0, end_offset=len(meta), session_id="session-1")]
+    assert reader.offset == len(meta)
+    assert not reader.done_since(0)
+
+    with rollout.open("a", encoding="utf-8") as fh:
+        fh.write(done_line[20:])
+
+    events = reader.read()
+    assert len(events) == 1
+    assert isinstance(events[0], AssistantMessageEvent)
+    assert events[0].done is True
+    assert reader.last_assistant.text == "finished\n/done"
+    assert reader.offset == len(meta) + len(done_line)
+    assert reader.done_since(len(meta))
+    assert not reader.done_since(reader.offset)
+    reader.close()
+
+
+def test_rollout_reader_skips_unrelated_lines(tmp_path: Path):
+    rollout = tmp_path / "rollout.jsonl"
+    lines = [
+        json.dumps({"type": "response_item", "payload": {"role": "user", "content": [{"type": "input_text", "text": "/done"}]}}),
+        "not json",
+        _assistant_line("working"),
+    ]
+    rollout.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    reader = RolloutReader(rollout)
+    events = reader.read()
+
+    assert [event.text for event in events] == ["working"]
+    assert reader.last_done is None
+    assert reader.read() == []
+
+
+def test_rollout_reader_seeks_last_assistant_backwards(tmp_path: Path, monkeypatch):
+    from parallel_developer.services import rollout_reader as rollout_reader_module
+
+    monkeypatch.setattr(rollout_reader_module, "_TAIL_BLOCK_SIZE", 16)
+    rollout = tmp_path / "rollout.jsonl"
+    history = [
+        _assistant_line("first"),
+        _assistant_line('{"scores": {"worker-1": {"score": 80}}}'),
+        json.dumps({"type": "response_item", "payload": {"role": "user", "content": []}}),
+    ]
+    rollout.write_text("\n".join(history) + "\n", encoding="utf-8")
+    registered = rollout.stat().st_size
+
+    reader = RolloutReader(rollout, offset=registered)
+    assert reader.read() == []
+    assert reader.last_assistant.text == '{"scores": {"worker-1": {"score": 80}}}'
+    assert not reader.done_since(registered)
+
+    with rollout.open("a", encoding="utf-8") as fh:
+        fh.write(_assistant_line("latest\n/done") + "\n")
+    reader.read()
+    assert reader.last_assistant.text == "latest\n/done"
+    assert reader.done_since(registered)
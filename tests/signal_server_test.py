@@ -0,0 +1,41 @@
+import threading
+from pathlib import Path
+
+from parallel_developer.services import SignalServer
+from parallel_developer.signal_client import main as signal_main, send_signal
+
+
+def test_signal_server_creates_flag_and_notifies(tmp_path: Path):
+    flag = tmp_path / "worker-1.done"
+    received = []
+    signalled = threading.Event()
+
+    def on_signal(path: Path) -> None:
+        received.append(path)
+        signalled.set()
+
+    server = SignalServer(tmp_path / "signal.sock", flags=[flag], on_signal=on_signal)
+    assert server.start()
+    try:
+        assert send_signal(server.socket_path, tmp_path / "other.done")
+        assert send_signal(server.socket_path, flag)
+        assert signalled.wait(timeout=2.0)
+    finally:
+        server.close()
+
+    assert received == [flag]
+    assert flag.exists()
+    assert not (tmp_path / "other.done").exists()
+    assert not server.socket_path.exists()
+
+
+def test_signal_server_moves_long_socket_paths(tmp_path: Path):
+    server = SignalServer(tmp_path / ("x" * 120) / "signal.sock", flags=[])
+    assert len(str(server.socket_path)) < 100
+
+
+def test_signal_client_falls_back_to_flag_file(tmp_path: Path):
+    flag = tmp_path / "signals" / "boss.done"
+
+    assert signal_main(["--socket", str(tmp_path / "missing.sock"), str(flag)]) == 0
+    assert flag.exists()
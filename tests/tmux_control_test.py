@@ -0,0 +1,94 @@
+import shutil
+import subprocess
+import tempfile
+import time
+import uuid
+
+import pytest
+
+from parallel_developer.services import ControlPane, TmuxControlClient, TmuxControlError
+from parallel_developer.services.tmux_control import control_client_count
+
+pytestmark = pytest.mark.skipif(shutil.which("tmux") is None, reason="tmux is not installed")
+
+
+@pytest.fixture
+def tmux_session(monkeypatch):
+    # 既定サーバーを共有すると、並行実行中の別スイートが最後のセッションを閉じた際にサーバーごと終了するため専用サーバーを使う
+    socket_dir = tempfile.mkdtemp(prefix="sibyl-tmux-")
+    monkeypatch.setenv("TMUX_TMPDIR", socket_dir)
+    monkeypatch.delenv("TMUX", raising=False)
+    name = f"sibyl-control-test-{uuid.uuid4().hex[:8]}"
+    # シェルの起動完了を待たずに入力できるよう、ペインでは cat を動かして端末のエコーをそのまま確認する
+    created = subprocess.run(["tmux", "new-session", "-d", "-s", name, "-x", "120", "-y", "40", "cat"], check=False)
+    if created.returncode != 0:
+        pytest.skip("tmux server is not available")
+    yield name
+    subprocess.run(["tmux", "kill-server"], check=False)
+    shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+def test_control_client_multiplexes_commands(tmux_session, tmp_path, monkeypatch):
+    client = TmuxControlClient(tmux_session)
+    assert client.start()
+    assert control_client_count(tmux_session) == 1
+
+    def forbid(*_args, **_kwargs):
+        raise AssertionError("no process should be spawned")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(subprocess, "Popen", forbid)
+        patch.setattr(subprocess, "run", forbid)
+        _exercise_control_client(client, tmp_path)
+
+    client.close()
+    assert not client.alive
+    assert control_client_count(tmux_session) == 0
+
+
+def _exercise_control_client(client, tmp_path):
+    tmux_session = client.session_name
+    pane_id = client.command("list-panes", "-t", tmux_session, "-F", "#{pane_id}")[0]
+    pane = ControlPane(client, pane_id)
+    payload = "~/x \"quoted\" $HOME\nsecond\tline \x1b[200~"
+    out_path = tmp_path / "buffer.txt"
+    results = client.pipeline(
+        [
+            ["set-buffer", "-b", "sibyl-test", "--", payload],
+            ["save-buffer", "-b", "sibyl-test", str(out_path)],
+        ]
+    )
+    assert results == [[], []]
+    # save-buffer はクライアント側で非同期に書き込まれるため、内容が揃うまで待つ
+    deadline = time.time() + 5
+    while time.time() < deadline and (not out_path.exists() or out_path.read_text(encoding="utf-8") != payload):
+        time.sleep(0.02)
+    assert out_path.read_text(encoding="utf-8") == payload
+
+    pane.send_keys("control-mode-ok", enter=True)
+    deadline = time.time() + 10
+    while time.time() < deadline and not any(line.strip() == "control-mode-ok" for line in pane.capture_pane()):
+        time.sleep(0.02)
+    assert any(line.strip() == "control-mode-ok" for line in pane.capture_pane())
+
+    with pytest.raises(TmuxControlError):
+        client.command("no-such-command")
+
+
+def test_control_client_delivers_layout_notifications(tmux_session):
+    client = TmuxControlClient(tmux_session)
+    assert client.start()
+    received = []
+    client.add_listener(lambda name, rest: received.append(name))
+
+    client.command("split-window", "-d", "-t", tmux_session)
+    deadline = time.time() + 10
+    layouts = ["even-vertical", "even-horizontal"]
+    while time.time() < deadline and "layout-change" not in received:
+        time.sleep(0.1)
+        # 接続直後は最初の %layout-change が送られないことがあるため、レイアウトを切り替えて再度通知させる
+        layouts.reverse()
+        client.command("select-layout", "-t", tmux_session, layouts[0])
+    client.close()
+
+    assert "layout-change" in received
@@ -1,9 +1,11 @@
+import time
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
-from parallel_developer.services import TmuxLayoutManager
+from parallel_developer.services import CodexHomeManager, TmuxLayoutManager
+from parallel_developer.services.tmux_control import ControlPane, TmuxControlError
 
 
 class DummyPane:
@@ -152,6 +154,24 @@ def test_tmux_layout_manager_allocates_panes(monkeypatch_server):
     assert any("codex resume session-main" in entry[0] for entry in main_pane.sent)
 
 
+def test_tmux_layout_manager_places_boss_shards_after_workers(monkeypatch_server):
+    manager = TmuxLayoutManager(
+        session_name="parallel-dev",
+        worker_count=2,
+        monitor=Mock(),
+        root_path=Path("/repo"),
+        boss_count=3,
+    )
+
+    layout = manager.ensure_layout(session_name="parallel-dev", worker_count=2)
+
+    assert (layout["main"], layout["boss"]) == ("%0", "%1")
+    assert layout["workers"] == ["%2", "%3"]
+    assert layout["boss_shards"] == ["%4", "%5"]
+    session_cmds = monkeypatch_server.sessions[0].cmd_calls
+    assert ("select-pane", "-t", "%5", "-T", "BOSS-3") in session_cmds
+
+
 def test_tmux_layout_manager_recreates_existing_session(monkeypatch_server):
     monitor = Mock()
     manager = TmuxLayoutManager(
@@ -198,3 +218,372 @@ def test_fork_boss_interrupts_before_resume(monkeypatch_server):
         entry[0].startswith("cd /repo/.parallel-dev/sessions/session-a/worktrees/boss && codex resume session-main")
         for entry in boss_pane.sent
     )
+
+
+def test_fork_workers_batches_steps_across_panes(monkeypatch_server, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("parallel_developer.services.tmux_manager.time.sleep", lambda seconds: sleeps.append(seconds))
+    manager = TmuxLayoutManager(
+        session_name="parallel-dev",
+        worker_count=4,
+        monitor=Mock(),
+        root_path=Path("/repo"),
+        backtrack_delay=0.0,
+        session_namespace="session-a",
+    )
+    layout = manager.ensure_layout(session_name="parallel-dev", worker_count=4)
+    pane_paths = {pane_id: Path(f"/repo/worker-{index}") for index, pane_id in enumerate(layout["workers"], start=1)}
+
+    manager.fork_workers(workers=layout["workers"], base_session_id="session-main", pane_paths=pane_paths)
+
+    panes = monkeypatch_server.sessions[0].windows[0].panes
+    for index, pane in enumerate(panes[2:], start=1):
+        assert pane.sent == [
+            ("C-c", False),
+            ("C-c", False),
+            (f"cd /repo/worker-{index} && codex resume session-main", True),
+            ("C-[", False),
+            ("C-[", False),
+            ("", True),
+        ]
+    assert sleeps == [0.5, 0.1, 0.1, 0.1]
+
+
+def test_fork_workers_uses_per_pane_codex_home(monkeypatch_server, tmp_path):
+    homes = CodexHomeManager(tmp_path / "homes", source_home=tmp_path / "shared")
+    rollout = tmp_path / "codex" / "2025" / "11" / "11" / "rollout-main.jsonl"
+    rollout.parent.mkdir(parents=True)
+    rollout.write_text("meta\n", encoding="utf-8")
+    monitor = Mock()
+    monitor.rollout_path.return_value = rollout
+    manager = TmuxLayoutManager(
+        session_name="parallel-dev",
+        worker_count=2,
+        monitor=monitor,
+        root_path=Path("/repo"),
+        backtrack_delay=0.0,
+        codex_homes=homes,
+    )
+    layout = manager.ensure_layout(session_name="parallel-dev", worker_count=2)
+    pane_paths = {pane_id: Path(f"/repo/worker-{index}") for index, pane_id in enumerate(layout["workers"], start=1)}
+
+    manager.fork_workers(workers=layout["workers"], base_session_id="session-main", pane_paths=pane_paths)
+
+    panes = monkeypatch_server.sessions[0].windows[0].panes
+    for index, pane in enumerate(panes[2:], start=1):
+        home = homes.home_for(pane.pane_id)
+        assert (f"cd /repo/worker-{index} && env CODEX_HOME={home} codex resume session-main", True) in pane.sent
+        assert (home / "sessions" / "2025" / "11" / "11" / "rollout-main.jsonl").exists()
+    monitor.rollout_path.assert_called_with("session-main")
+
+
+def test_resume_workers_skips_prompt_reset(monkeypatch_server):
+    manager = TmuxLayoutManager(
+        session_name="parallel-dev",
+        worker_count=2,
+        monitor=Mock(),
+        root_path=Path("/repo"),
+        backtrack_delay=0.0,
+    )
+    layout = manager.ensure_layout(session_name="parallel-dev", worker_count=2)
+    sessions = {pane_id: f"clone-{index}" for index, pane_id in enumerate(layout["workers"], start=1)}
+    pane_paths = {pane_id: Path(f"/repo/worker-{index}") for index, pane_id in enumerate(layout["workers"], start=1)}
+
+    assert manager.resume_workers(sessions=sessions, pane_paths=pane_paths) == layout["workers"]
+
+    panes = monkeypatch_server.sessions[0].windows[0].panes
+    for index, pane in enumerate(panes[2:], start=1):
+        assert pane.sent == [
+            ("C-c", False),
+            ("C-c", False),
+            (f"cd /repo/worker-{index} && codex resume clone-{index}", True),
+        ]
+
+
+class CapturingPane(DummyPane):
+    def __init__(self, pane_id, frames):
+        super().__init__(pane_id)
+        self.frames = list(frames)
+        self.captures = 0
+
+    def capture_pane(self):
+        self.captures += 1
+        index = min(self.captures - 1, len(self.frames) - 1)
+        return self.frames[index]
+
+
+def test_wait_for_prompt_returns_once_codex_prompt_is_visible(monkeypatch_server):
+    manager = TmuxLayoutManager(
+        session_name="parallel-dev",
+        worker_count=1,
+        monitor=Mock(),
+        root_path=Path("/repo"),
+        ready_timeout=5.0,
+        ready_poll_interval=0.01,
+        ready_settle=5.0,
+    )
+    pane = CapturingPane(
+        "%9",
+        [
+            ["$ "],
+            ["$ codex resume session-main"],
+            ["loading..."],
+            ["", "▌ Ask Codex to do anything", "⏎ send"],
+        ],
+    )
+    before = manager._snapshot_panes([pane])
+    started = time.monotonic()
+    manager._wait_for_prompt([pane], before, fallback=5.0)
+
+    assert time.monotonic() - started < 1.0
+    assert pane.captures == 5
+
+
+def test_wait_for_prompt_ignores_footer_left_from_before_the_command(monkeypatch_server):
+    manager = TmuxLayoutManager(
+        session_name="parallel-dev",
+        worker_count=1,
+        monitor=Mock(),
+        root_path=Path("/repo"),
+        ready_timeout=0.3,
+        ready_poll_interval=0.01,
+        ready_settle=0.05,
+    )
+    # 入力行だけが書き換わり、送信前のフッターが同じ位置に残っている画面
+    pane = CapturingPane(
+        "%9",
+        [
+            ["▌ ", "⏎ send"],
+            ["▌ codex resume session-main", "⏎ send"],
+        ],
+    )
+    before = manager._snapshot_panes([pane])
+    started = time.monotonic()
+    manager._wait_for_prompt([pane], before, fallback=5.0)
+
+    # 静止しただけでは準備完了とせず、タイムアウトまで待つ
+    assert time.monotonic() - started >= 0.3
+
+
+def test_key_steps_wait_for_key_timeout_only_before_typing(monkeypatch_server):
+    manager = TmuxLayoutManager(
+        session_name="parallel-dev",
+        worker_count=1,
+        monitor=Mock(),
+        root_path=Path("/repo"),
+        backtrack_delay=0.05,
+        key_timeout=0.6,
+        ready_poll_interval=0.01,
+    )
+    # C-c を押しても画面が変わらないアイドル状態のペイン
+    pane = CapturingPane("%9", [["▌ Ask Codex to do anything"]])
+
+    started = time.monotonic()
+    manager._send_keys_and_wait([pane], "C-c", enter=False, fallback=manager.backtrack_delay)
+    assert time.monotonic() - started < 0.3
+
+    started = time.monotonic()
+    manager._send_keys_and_wait([pane], "C-c", enter=False, fallback=manager.backtrack_delay, ready=True)
+    assert time.monotonic() - started >= 0.6
+
+
+def test_wait_for_prompt_falls_back_to_fixed_delay_without_capture(monkeypatch_server, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("parallel_developer.services.tmux_manager.time.sleep", lambda seconds: sleeps.append(seconds))
+    manager = TmuxLayoutManager(
+        session_name="parallel-dev",
+        worker_count=1,
+        monitor=Mock(),
+        root_path=Path("/repo"),
+    )
+    pane = DummyPane("%9")
+
+    manager._wait_for_prompt([pane], manager._snapshot_panes([pane]), fallback=0.5)
+
+    assert sleeps == [0.5]
+
+
+def test_get_pane_uses_cache_until_layout_changes(monkeypatch_server, monkeypatch):
+    manager = TmuxLayoutManager(
+        session_name="parallel-dev",
+        worker_count=2,
+        monitor=Mock(),
+        root_path=Path("/repo"),
+        startup_delay=0.0,
+        backtrack_delay=0.0,
+    )
+    layout = manager.ensure_layout(session_name="parallel-dev", worker_count=2)
+    walks = []
+    original = manager._find_pane
+    monkeypatch.setattr(manager, "_find_pane", lambda pane_id: walks.append(pane_id) or original(pane_id))
+
+    for _ in range(3):
+        for pane_id in layout["workers"]:
+            manager._send_command(pane_id, "echo hi")
+    assert walks == []
+
+    manager._on_control_notification("layout-change", "@0 abcd")
+    manager._send_command(layout["workers"][0], "echo hi")
+    manager._send_command(layout["workers"][1], "echo hi")
+    assert walks == [layout["workers"][0]]
+
+
+class FailingPane(DummyPane):
+    def __init__(self, pane_id, error):
+        super().__init__(pane_id)
+        self.error = error
+
+    def send_keys(self, cmd, enter=True):
+        self.sent.append((cmd, enter))
+        raise self.error
+
+
+def test_send_keys_retries_only_when_pane_handle_is_stale(monkeypatch_server):
+    manager = TmuxLayoutManager(
+        session_name="parallel-dev",
+        worker_count=1,
+        monitor=Mock(),
+        root_path=Path("/repo"),
+    )
+    fresh = DummyPane("%2")
+    stale = FailingPane("%2", TmuxControlError("can't find pane: %2"))
+    manager._pane_cache["%2"] = stale
+    manager._find_pane = lambda pane_id: fresh
+
+    manager._send_command("%2", "echo hi")
+
+    assert stale.sent == [("echo hi", True)]
+    assert fresh.sent == [("echo hi", True)]
+
+
+def test_send_keys_does_not_resend_after_timeout(monkeypatch_server):
+    manager = TmuxLayoutManager(
+        session_name="parallel-dev",
+        worker_count=1,
+        monitor=Mock(),
+        root_path=Path("/repo"),
+    )
+    fresh = DummyPane("%2")
+    slow = FailingPane("%2", TimeoutError("tmux control command timed out"))
+    manager._pane_cache["%2"] = slow
+    manager._find_pane = lambda pane_id: fresh
+
+    with pytest.raises(TimeoutError):
+        manager._send_command("%2", "echo hi")
+
+    # キーが届いている可能性があるため再送しない
+    assert slow.sent == [("echo hi", True)]
+    assert fresh.sent == []
+
+
+class RecordingControl:
+    alive = True
+
+    def __init__(self):
+        self.commands = []
+        self.loaded = {}
+
+    def command(self, *args, **_kwargs):
+        self.commands.append(list(args))
+        if args[0] == "load-buffer":
+            self.loaded[args[2]] = Path(args[3]).read_text(encoding="utf-8")
+        return []
+
+    def pipeline(self, commands, **_kwargs):
+        commands = [list(args) for args in commands]
+        self.commands.extend(commands)
+        return [[] for _ in commands]
+
+    def close(self):
+        pass
+
+
+def test_send_instruction_to_panes_loads_buffer_once(monkeypatch_server):
+    manager = TmuxLayoutManager(
+        session_name="parallel-dev",
+        worker_count=2,
+        monitor=Mock(),
+        root_path=Path("/repo"),
+        control_mode=True,
+    )
+    control = RecordingControl()
+    manager._control = control
+    body = "long task\n" * 1000
+
+    manager.send_instruction_to_panes(
+        pane_ids=["%2", "%3"],
+        instruction=body,
+        headers={"%2": "You are worker-1.\n", "%3": "You are worker-2.\n"},
+        footers={"%2": "\nflag-1", "%3": "\nflag-2"},
+    )
+
+    loads = [args for args in control.commands if args[0] == "load-buffer"]
+    assert len(loads) == 1
+    buffer_name = loads[0][2]
+    assert control.loaded[buffer_name] == body
+    assert not Path(loads[0][3]).exists()
+    pastes = [args for args in control.commands if args[0] == "paste-buffer"]
+    assert pastes == [
+        ["paste-buffer", "-r", "-b", buffer_name, "-t", "%2"],
+        ["paste-buffer", "-r", "-b", buffer_name, "-t", "%3"],
+    ]
+    assert ["send-keys", "-t", "%3", "-l", "\x1b[200~You are worker-2.\n"] in control.commands
+    assert ["send-keys", "-t", "%3", "-l", "\nflag-2\x1b[201~"] in control.commands
+    assert control.commands[-1] == ["delete-buffer", "-b", buffer_name]
+    assert all(body not in " ".join(args) for args in control.commands)
+
+
+def test_ensure_layout_caches_control_handles_in_control_mode(monkeypatch_server, monkeypatch):
+    manager = TmuxLayoutManager(
+        session_name="parallel-dev",
+        worker_count=2,
+        monitor=Mock(),
+        root_path=Path("/repo"),
+        control_mode=True,
+    )
+    control = RecordingControl()
+    monkeypatch.setattr(manager, "_control_client", lambda: control)
+
+    layout = manager.ensure_layout(session_name="parallel-dev", worker_count=2)
+    manager._send_command(layout["workers"][0], "echo hi")
+
+    assert all(isinstance(pane, ControlPane) for pane in manager._pane_cache.values())
+    assert ["send-keys", "-t", layout["workers"][0], "echo hi", "Enter"] in control.commands
+
+
+def test_control_client_is_created_once_across_threads(monkeypatch_server, monkeypatch):
+    import threading
+
+    from parallel_developer.services import tmux_manager as tmux_manager_module
+
+    started = []
+
+    class SlowControl(RecordingControl):
+        def __init__(self, session_name):
+            super().__init__()
+
+        def add_listener(self, listener):
+            pass
+
+        def start(self):
+            started.append(self)
+            time.sleep(0.05)
+            return True
+
+    monkeypatch.setattr(tmux_manager_module, "TmuxControlClient", SlowControl)
+    manager = TmuxLayoutManager(
+        session_name="parallel-dev",
+        worker_count=1,
+        monitor=Mock(),
+        root_path=Path("/repo"),
+        control_mode=True,
+    )
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(manager._control_client())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(started) == 1
+    assert all(client is started[0] for client in results)
@@ -1,12 +1,14 @@
 import asyncio
+import sys
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
 
 from parallel_developer.controller import CLIController, FlowMode
 from parallel_developer.orchestrator import CandidateInfo, CycleArtifact, CycleLayout, OrchestrationResult, BossMode
-from parallel_developer.stores import ManifestStore
+from parallel_developer.stores import ManifestStore, PaneRecord, SessionManifest
 
 
 def _run(coro):
@@ -340,3 +342,95 @@ def test_flow_full_auto_prefers_boss_on_rewrite(base_controller, tmp_path):
     decision = controller._select_candidates(candidates, scoreboard)
     assert decision.selected_key == "boss"
     assert any("flow full_auto" in payload.get("text", "").lower() for event, payload in events if event == "log")
+
+
+def test_acquire_orchestrator_reuses_warm_instance(base_controller, tmp_path):
+    from parallel_developer.orchestrator import Orchestrator
+
+    controller, _ = base_controller
+    built = []
+
+    def builder(**kwargs):
+        orchestrator = Orchestrator(
+            tmux_manager=Mock(),
+            worktree_manager=Mock(),
+            monitor=Mock(),
+            log_manager=Mock(),
+            worker_count=kwargs["worker_count"],
+            session_name="parallel-dev",
+        )
+        built.append(orchestrator)
+        return orchestrator
+
+    controller._builder = builder
+    first = controller._acquire_orchestrator(worker_count=2, log_dir=tmp_path / "a", session_namespace="s1")
+    second = controller._acquire_orchestrator(
+        worker_count=2,
+        log_dir=tmp_path / "b",
+        session_namespace="s1",
+        boss_mode=BossMode.SKIP,
+        reuse_existing_session=True,
+    )
+
+    assert second is first and len(built) == 1
+    assert first._boss_mode == BossMode.SKIP
+    first._log.set_logs_dir.assert_called_once_with(tmp_path / "b")
+    first._tmux.set_reuse_existing_session.assert_called_once_with(True)
+
+    third = controller._acquire_orchestrator(worker_count=3, log_dir=tmp_path / "c", session_namespace="s1")
+    assert third is not first and len(built) == 2
+    first._tmux.close.assert_called_once()
+    first._monitor.close.assert_called_once()
+
+
+def test_resumed_tmux_session_shares_warm_orchestrator(base_controller, tmp_path, monkeypatch):
+    from parallel_developer.orchestrator import Orchestrator
+
+    controller, _ = base_controller
+    built = []
+
+    def builder(**kwargs):
+        tmux = Mock()
+        tmux.ensure_layout.return_value = SimpleNamespace(
+            main_pane="%0", boss_pane="%1", worker_panes=["%2"], worker_names=["worker-1"]
+        )
+        orchestrator = Orchestrator(
+            tmux_manager=tmux,
+            worktree_manager=Mock(),
+            monitor=Mock(),
+            log_manager=Mock(),
+            worker_count=kwargs["worker_count"],
+            session_name="parallel-dev",
+        )
+        built.append((orchestrator, kwargs))
+        return orchestrator
+
+    fake_server = SimpleNamespace(find_where=lambda query: None)
+    monkeypatch.setitem(sys.modules, "libtmux", SimpleNamespace(Server=lambda: fake_server))
+    controller._builder = builder
+    manifest = SessionManifest(
+        session_id="session-resumed",
+        created_at="2025-11-06T00:00:00",
+        tmux_session="parallel-dev-resumed",
+        worker_count=1,
+        mode="parallel",
+        logs_dir=str(tmp_path / "logs" / "cycle-1"),
+        latest_instruction=None,
+        scoreboard={},
+        conversation_log=None,
+        selected_session_id=None,
+        main=PaneRecord(role="main", name=None, session_id="session-main", worktree=str(tmp_path)),
+        boss=None,
+        workers={"worker-1": PaneRecord(role="worker", name="worker-1", session_id="session-worker", worktree=str(tmp_path))},
+    )
+    controller._apply_manifest(manifest)
+
+    assert len(built) == 1
+    resumed, kwargs = built[0]
+    assert controller._warm_orchestrator is resumed
+    assert kwargs["session_namespace"] == "session-resumed"
+    assert kwargs["log_hook"] == controller._log_hook
+
+    # 続くサイクルは再開時に作った Orchestrator をそのまま使う
+    cycle = controller._acquire_orchestrator(**controller._orchestrator_options(log_dir=tmp_path / "logs" / "cycle-2"))
+    assert cycle is resumed and len(built) == 1
@@ -74,3 +74,181 @@ def test_worktree_manager_separates_sessions(git_repo: Path):
 
     assert worker_a != worker_b
     assert (worker_a / "keep.txt").read_text(encoding="utf-8") == "session a"
+
+
+def test_worktree_manager_prepares_in_parallel_and_reports_timings(git_repo: Path):
+    manager = WorktreeManager(root=git_repo, worker_count=3, session_namespace="session-a")
+
+    mapping = manager.prepare()
+    assert set(manager.last_prepare_timings) == {"worker-1", "worker-2", "worker-3", "boss"}
+    for path in [*mapping.values(), manager.boss_path]:
+        assert (path / "README.md").read_text(encoding="utf-8") == "# demo\n"
+
+    (mapping["worker-2"] / "README.md").write_text("changed\n", encoding="utf-8")
+    (mapping["worker-2"] / "scratch.txt").write_text("tmp\n", encoding="utf-8")
+    manager.prepare()
+
+    assert (mapping["worker-2"] / "README.md").read_text(encoding="utf-8") == "# demo\n"
+    assert not (mapping["worker-2"] / "scratch.txt").exists()
+    branches = {head.name for head in git.Repo(git_repo).heads}
+    assert "parallel-dev/session-a/worker-3" in branches
+    assert all(seconds >= 0 for seconds in manager.last_prepare_timings.values())
+
+
+def test_worktree_manager_reuses_worktrees_from_previous_process(git_repo: Path, monkeypatch: pytest.MonkeyPatch):
+    first = WorktreeManager(root=git_repo, worker_count=3, session_namespace="session-a")
+    mapping = first.prepare()
+    worker_1 = git.Repo(mapping["worker-1"])
+    (mapping["worker-1"] / "work.txt").write_text("wip\n", encoding="utf-8")
+    worker_1.index.add(["work.txt"])
+    worker_1.index.commit("worker commit")
+    (mapping["worker-2"] / ".git").unlink()
+
+    second = WorktreeManager(root=git_repo, worker_count=2, session_namespace="session-a")
+    recreated = []
+    original = second._recreate_worktree
+    monkeypatch.setattr(
+        second,
+        "_recreate_worktree",
+        lambda path, branch, commit="HEAD": recreated.append(path.name) or original(path, branch, commit),
+    )
+    second.prepare()
+
+    assert recreated == ["worker-2"]
+    root_head = git.Repo(git_repo).head.commit.hexsha
+    assert git.Repo(mapping["worker-1"]).head.commit.hexsha == root_head
+    assert not (mapping["worker-1"] / "work.txt").exists()
+    assert git.Repo(mapping["worker-2"]).head.commit.hexsha == root_head
+    assert not mapping["worker-3"].exists()
+
+
+def test_worktree_manager_keep_cache_policy_preserves_build_outputs(git_repo: Path):
+    (git_repo / ".gitignore").write_text("node_modules/\n*.log\n", encoding="utf-8")
+    repo = git.Repo(git_repo)
+    repo.index.add([".gitignore"])
+    repo.index.commit("Add ignore rules")
+    manager = WorktreeManager(root=git_repo, worker_count=1, reset_policy="keep_cache")
+    worker = manager.prepare()["worker-1"]
+    (worker / "node_modules" / "pkg").mkdir(parents=True)
+    (worker / "node_modules" / "pkg" / "index.js").write_text("cached\n", encoding="utf-8")
+    (worker / "debug.log").write_text("log\n", encoding="utf-8")
+    (worker / "draft.py").write_text("print()\n", encoding="utf-8")
+
+    manager.prepare()
+
+    assert (worker / "node_modules" / "pkg" / "index.js").exists()
+    assert not (worker / "debug.log").exists()
+    assert not (worker / "draft.py").exists()
+
+
+def test_worktree_manager_seeds_ignored_artifacts(git_repo: Path):
+    (git_repo / ".gitignore").write_text("node_modules/\n", encoding="utf-8")
+    repo = git.Repo(git_repo)
+    repo.index.add([".gitignore"])
+    repo.index.commit("Ignore node_modules")
+    package = git_repo / "node_modules" / "left-pad"
+    package.mkdir(parents=True)
+    (package / "index.js").write_text("module.exports = 1;\n", encoding="utf-8")
+    (package / "alias.js").symlink_to("index.js")
+
+    manager = WorktreeManager(root=git_repo, worker_count=2, seed_paths=["node_modules", "missing"])
+    mapping = manager.prepare()
+
+    for path in [*mapping.values(), manager.boss_path]:
+        seeded = path / "node_modules" / "left-pad"
+        assert (seeded / "index.js").read_text(encoding="utf-8") == "module.exports = 1;\n"
+        assert (seeded / "alias.js").is_symlink()
+        assert not (path / "missing").exists()
+
+
+def test_worktree_manager_seed_hardlinks_only_on_request(git_repo: Path, monkeypatch):
+    (git_repo / ".gitignore").write_text("node_modules/\n.venv/\n", encoding="utf-8")
+    repo = git.Repo(git_repo)
+    repo.index.add([".gitignore"])
+    repo.index.commit("Ignore artifacts")
+    package = git_repo / "node_modules" / "left-pad"
+    package.mkdir(parents=True)
+    (package / "index.js").write_text("module.exports = 1;\n", encoding="utf-8")
+    venv = git_repo / ".venv"
+    venv.mkdir()
+    (venv / "pyvenv.cfg").write_text(f"home = {git_repo}\n", encoding="utf-8")
+    # reflink に対応したファイルシステムでも既定と明示指定の差を確認できるよう、reflink は失敗させる
+    monkeypatch.setattr("parallel_developer.services.worktree_manager._reflink_copy", lambda source, target: False)
+
+    manager = WorktreeManager(root=git_repo, worker_count=1, seed_paths=["node_modules", ".venv"])
+    worker = manager.prepare()["worker-1"]
+    seeded = worker / "node_modules" / "left-pad" / "index.js"
+    assert seeded.read_text(encoding="utf-8") == "module.exports = 1;\n"
+    assert seeded.stat().st_ino != (package / "index.js").stat().st_ino
+    assert not (worker / ".venv").exists()
+    warnings = manager.seed_warnings()
+    assert any("reset=full" in warning for warning in warnings)
+    assert any(".venv" in warning for warning in warnings)
+
+    linked = WorktreeManager(
+        root=git_repo,
+        worker_count=1,
+        session_namespace="hardlink",
+        reset_policy="keep_cache",
+        seed_paths=["node_modules"],
+        seed_hardlink=True,
+    )
+    worker = linked.prepare()["worker-1"]
+    assert (worker / "node_modules" / "left-pad" / "index.js").stat().st_ino == (package / "index.js").stat().st_ino
+    assert linked.seed_warnings() == []
+
+
+def test_worktree_manager_sparse_checkout_follows_instruction_paths(git_repo: Path):
+    repo = git.Repo(git_repo)
+    for relative in ("packages/foo/src/index.ts", "packages/bar/index.ts", "docs/guide.md"):
+        target = git_repo / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("content\n", encoding="utf-8")
+        repo.index.add([relative])
+    repo.index.commit("Add monorepo layout")
+    manager = WorktreeManager(root=git_repo, worker_count=1, sparse_from_instruction=True, checkout_workers=2)
+
+    assert manager.sparse_paths_for("Fix `packages/foo/src/index.ts` and see docs/") == ["packages/foo", "docs"]
+
+    worker = manager.prepare(instruction="Update packages/foo/src/index.ts only")["worker-1"]
+    assert (worker / "packages" / "foo" / "src" / "index.ts").exists()
+    assert (worker / "README.md").exists()
+    assert not (worker / "packages" / "bar").exists()
+    assert not (worker / "docs").exists()
+
+    manager.prepare(instruction="General cleanup")
+    assert (worker / "packages" / "bar" / "index.ts").exists()
+    assert (worker / "docs" / "guide.md").exists()
+
+
+def test_worktree_manager_reset_follows_merged_root_head(git_repo: Path):
+    manager = WorktreeManager(root=git_repo, worker_count=2, follow_root_head=True)
+    mapping = manager.prepare()
+    worker_repo = git.Repo(mapping["worker-1"])
+    (mapping["worker-1"] / "feature.txt").write_text("selected\n", encoding="utf-8")
+    worker_repo.index.add(["feature.txt"])
+    worker_repo.index.commit("Selected change")
+    git.Repo(git_repo).git.merge("--ff-only", manager.worker_branch("worker-1"))
+
+    manager.prepare()
+
+    assert (mapping["worker-2"] / "feature.txt").read_text(encoding="utf-8") == "selected\n"
+    assert (manager.boss_path / "feature.txt").exists()
+
+
+def test_worktree_manager_reset_keeps_worktree_head_by_default(git_repo: Path):
+    manager = WorktreeManager(root=git_repo, worker_count=2)
+    mapping = manager.prepare()
+    worker_repo = git.Repo(mapping["worker-1"])
+    (mapping["worker-1"] / "feature.txt").write_text("selected\n", encoding="utf-8")
+    worker_repo.index.add(["feature.txt"])
+    worker_repo.index.commit("Selected change")
+    git.Repo(git_repo).git.merge("--ff-only", manager.worker_branch("worker-1"))
+    (mapping["worker-1"] / "scratch.txt").write_text("temp\n", encoding="utf-8")
+
+    manager.prepare()
+
+    # 既定では各 worktree の HEAD へ戻すだけで、ルートの統合結果には追従しない
+    assert not (mapping["worker-2"] / "feature.txt").exists()
+    assert (mapping["worker-1"] / "feature.txt").exists()
+    assert not (mapping["worker-1"] / "scratch.txt").exists()